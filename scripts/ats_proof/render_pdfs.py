@@ -1,38 +1,54 @@
 """Render all corpus YAML files across all RenderCV themes.
 
 For each YAML in corpus/, generates PDFs for all 5 themes using the
-RenderCV Python API. Output goes to rendered/{theme}/{category}/{name}.pdf.
+RenderCV Python API, which reads and validates each YAML once. Output goes
+to rendered/{theme}/{category}/{name}.pdf.
 """
 
+import shutil
 import sys
 import tempfile
 from pathlib import Path
 
 from common import RENDERED_DIR, THEMES, find_corpus_yamls
 
-from rendercv.cli.render_command.progress_panel import ProgressPanel
+from rendercv.cli.render_command.progress_reporter import SilentProgressReporter
 from rendercv.cli.render_command.run_rendercv import run_rendercv
 
 
-def render_with_theme(yaml_path: Path, theme: str, output_dir: Path) -> Path | None:
-    """Render a corpus YAML with a given theme using the RenderCV API."""
-    output_dir.mkdir(parents=True, exist_ok=True)
+def render_with_themes(
+    yaml_path: Path, themes: list[str], category: str
+) -> dict[str, Path | None]:
+    """Render a corpus YAML in all given themes with a single parse and validation."""
     stem = yaml_path.stem
-    pdf_path = (output_dir / f"{stem}.pdf").resolve()
 
     with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp).resolve()
         run_rendercv(
             yaml_path.resolve(),
-            progress=ProgressPanel(),
-            pdf_path=pdf_path,
-            typst_path=Path(tmp).resolve() / f"{stem}.typ",
+            progress=SilentProgressReporter(),
+            themes=themes,
+            pdf_path=tmp_path / f"{stem}.pdf",
+            typst_path=tmp_path / f"{stem}.typ",
             dont_generate_html=True,
             dont_generate_markdown=True,
             dont_generate_png=True,
-            overrides={"design": {"theme": theme}},
         )
 
-    return pdf_path if pdf_path.exists() else None
+        pdfs: dict[str, Path | None] = {}
+        for theme in themes:
+            # The output name gets the theme and locale language appended:
+            rendered_pdfs = list(tmp_path.glob(f"{stem}_{theme}_*.pdf"))
+            if not rendered_pdfs:
+                pdfs[theme] = None
+                continue
+            output_dir = RENDERED_DIR / theme / category
+            output_dir.mkdir(parents=True, exist_ok=True)
+            pdfs[theme] = Path(
+                shutil.move(rendered_pdfs[0], output_dir / f"{stem}.pdf")
+            )
+
+    return pdfs
 
 
 def main() -> None:
@@ -49,9 +65,7 @@ def main() -> None:
 
     for yaml_path in yamls:
         category = yaml_path.parent.name
-        for theme in THEMES:
-            output_dir = RENDERED_DIR / theme / category
-            pdf = render_with_theme(yaml_path, theme, output_dir)
+        for theme, pdf in render_with_themes(yaml_path, THEMES, category).items():
             if pdf:
                 success += 1
                 print(f"  [{success}/{total}] {theme}/{category}/{yaml_path.stem}.pdf")  # noqa: T201
@@ -0,0 +1,138 @@
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, BinaryIO, cast
+
+from rendercv.cli.lsp_command.language_server import read_message, write_message
+from rendercv.schema.sample_generator import create_sample_yaml_input_file
+
+number_of_entries = 500
+number_of_edits = 100
+uri = "file:///benchmark/cv.yaml"
+
+entry_template = """      - company: Company {index}
+        position: Software Engineer
+        start_date: 2020-01
+        end_date: present
+        location: Remote
+        highlights:
+          - First highlight of entry {index}
+          - Second highlight of entry {index}
+"""
+
+sample_yaml = create_sample_yaml_input_file(file_path=None)
+section_header = "    experience:\n"
+generated_entries = "".join(
+    entry_template.format(index=index) for index in range(number_of_entries)
+)
+base_text = sample_yaml.replace(section_header, section_header + generated_entries, 1)
+edited_line = f"          - First highlight of entry {number_of_entries // 2}\n"
+assert edited_line in base_text
+
+
+def send(stream: BinaryIO, message: dict[str, Any]) -> None:
+    write_message(stream, {"jsonrpc": "2.0", **message})
+
+
+def wait_for_diagnostics(stream: BinaryIO, version: int) -> dict[str, Any]:
+    while True:
+        message = read_message(stream)
+        assert message is not None, "The language server exited unexpectedly."
+        if (
+            message.get("method") == "textDocument/publishDiagnostics"
+            and message["params"].get("version") == version
+        ):
+            return message["params"]
+
+
+def measure(texts: list[str], first_version: int) -> list[float]:
+    latencies = []
+    for version, text in enumerate(texts, start=first_version):
+        start = time.perf_counter()
+        send(
+            input_stream,
+            {
+                "method": "textDocument/didChange",
+                "params": {
+                    "textDocument": {"uri": uri, "version": version},
+                    "contentChanges": [{"text": text}],
+                },
+            },
+        )
+        wait_for_diagnostics(output_stream, version)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def summarize(name: str, latencies: list[float]) -> dict[str, Any]:
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "edit": name,
+        "p50_ms": round(statistics.median(latencies), 1),
+        "p95_ms": round(percentiles[94], 1),
+        "max_ms": round(max(latencies), 1),
+    }
+
+
+server = subprocess.Popen(
+    [sys.executable, "-m", "rendercv", "lsp"],
+    stdin=subprocess.PIPE,
+    stdout=subprocess.PIPE,
+)
+input_stream = cast(BinaryIO, server.stdin)
+output_stream = cast(BinaryIO, server.stdout)
+
+send(
+    input_stream,
+    {
+        "id": 1,
+        "method": "initialize",
+        "params": {"processId": None, "capabilities": {}},
+    },
+)
+send(input_stream, {"method": "initialized", "params": {}})
+send(
+    input_stream,
+    {
+        "method": "textDocument/didOpen",
+        "params": {
+            "textDocument": {
+                "uri": uri,
+                "languageId": "yaml",
+                "version": 1,
+                "text": base_text,
+            }
+        },
+    },
+)
+wait_for_diagnostics(output_stream, 1)
+
+# Typing inside a line keeps the line count, so the rest of the document is
+# reused as is:
+in_line_edits = [
+    base_text.replace(edited_line, edited_line.replace("First", f"First {i}"), 1)
+    for i in range(number_of_edits)
+]
+# Inserting a line shifts every block below it:
+inserted_lines = [
+    base_text.replace(
+        edited_line, edited_line + f"          - Inserted highlight {i}\n", 1
+    )
+    for i in range(number_of_edits)
+]
+
+results = [
+    summarize("in-line edit", measure(in_line_edits, 2)),
+    summarize("inserted line", measure(inserted_lines, 2 + number_of_edits)),
+]
+
+send(input_stream, {"id": 2, "method": "shutdown"})
+send(input_stream, {"method": "exit"})
+input_stream.close()
+server.wait()
+
+print(f"{number_of_entries} entries, {len(base_text.splitlines())} lines")  # NOQA: T201
+for result in results:
+    print(json.dumps(result))  # NOQA: T201
@@ -2,7 +2,7 @@ import pathlib
 import shutil
 import tempfile
 
-from rendercv.cli.render_command.progress_panel import ProgressPanel
+from rendercv.cli.render_command.progress_reporter import PlainProgressReporter
 from rendercv.cli.render_command.run_rendercv import run_rendercv
 from rendercv.schema.models.design.built_in_design import available_themes
 from rendercv.schema.sample_generator import create_sample_yaml_input_file
@@ -35,7 +35,7 @@ for theme in available_themes:
         temp_directory_path = pathlib.Path(temp_directory)
         run_rendercv(
             yaml_file_path,
-            progress=ProgressPanel(),
+            progress=PlainProgressReporter(exit_on_error=True),
             typst_path=temp_directory_path / f"{yaml_file_path.stem}.typ",
             pdf_path=examples_directory_path / f"{yaml_file_path.stem}.pdf",
             png_path=temp_directory_path / f"{yaml_file_path.stem}.png",
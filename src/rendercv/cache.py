@@ -0,0 +1,32 @@
+import os
+import pathlib
+import sys
+
+
+def get_cache_dir() -> pathlib.Path:
+    """Return the platform-appropriate cache directory for RenderCV.
+
+    Why:
+        Several stages keep persistent caches between runs (version checks,
+        compiled templates, bundled Typst packages). They live in the core
+        package so the renderer can use them without the CLI dependencies.
+        `RENDERCV_CACHE_DIR` overrides the location, e.g., for container images
+        or isolated test runs.
+
+    Returns:
+        Path to the RenderCV cache directory. It may not exist yet.
+    """
+    if "RENDERCV_CACHE_DIR" in os.environ:
+        return pathlib.Path(os.environ["RENDERCV_CACHE_DIR"])
+
+    if sys.platform == "win32":
+        base = pathlib.Path(
+            os.environ.get("LOCALAPPDATA", pathlib.Path.home() / "AppData" / "Local")
+        )
+    elif sys.platform == "darwin":
+        base = pathlib.Path.home() / "Library" / "Caches"
+    else:
+        base = pathlib.Path(
+            os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache")
+        )
+    return base / "rendercv"
@@ -1,8 +1,6 @@
 import importlib
 import json
-import os
 import pathlib
-import sys
 import threading
 import time
 import urllib.request
@@ -13,6 +11,7 @@ import typer
 from rich import print
 
 from rendercv import __version__
+from rendercv.cache import get_cache_dir
 
 VERSION_CHECK_TTL_SECONDS = 86400  # 24 hours
 
@@ -34,7 +33,9 @@ def cli_command_no_args(
     """RenderCV is a command-line tool for rendering CVs from YAML input files. For more
     information, see https://docs.rendercv.com.
     """
-    warn_if_new_version_is_available()
+    # The language server's stdout is reserved for protocol messages:
+    if ctx.invoked_subcommand != "lsp":
+        warn_if_new_version_is_available()
 
     if version_requested:
         print(f"RenderCV v{__version__}")
@@ -44,21 +45,6 @@ def cli_command_no_args(
         raise typer.Exit()
 
 
-def get_cache_dir() -> pathlib.Path:
-    """Return the platform-appropriate cache directory for RenderCV."""
-    if sys.platform == "win32":
-        base = pathlib.Path(
-            os.environ.get("LOCALAPPDATA", pathlib.Path.home() / "AppData" / "Local")
-        )
-    elif sys.platform == "darwin":
-        base = pathlib.Path.home() / "Library" / "Caches"
-    else:
-        base = pathlib.Path(
-            os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache")
-        )
-    return base / "rendercv"
-
-
 def get_version_cache_file() -> pathlib.Path:
     """Return the path to the version check cache file."""
     return get_cache_dir() / "version_check.json"
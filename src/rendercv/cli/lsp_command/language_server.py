@@ -0,0 +1,464 @@
+import dataclasses
+import json
+import pathlib
+import threading
+import time
+import traceback
+import urllib.parse
+import urllib.request
+from typing import Any, BinaryIO
+
+import ruamel.yaml
+from ruamel.yaml.comments import CommentedMap
+
+from rendercv import __version__
+from rendercv.exception import (
+    RenderCVInternalError,
+    RenderCVUserError,
+    RenderCVUserValidationError,
+    RenderCVValidationError,
+)
+from rendercv.schema.rendercv_model_builder import build_rendercv_dictionary_and_model
+from rendercv.schema.sample_generator import create_sample_yaml_input_file
+from rendercv.schema.yaml_reader import IncrementalYamlReader
+
+# A document is validated once it hasn't changed for this long:
+diagnostics_debounce_in_seconds = 0.01
+
+# JSON-RPC error codes:
+method_not_found_error_code = -32601
+server_not_initialized_error_code = -32002
+invalid_request_error_code = -32600
+
+# LSP enumerations:
+full_text_document_sync = 1
+error_diagnostic_severity = 1
+error_message_type = 1
+
+
+@dataclasses.dataclass
+class OpenDocument:
+    """An open text document and the reader that parses its versions."""
+
+    text: str
+    version: int
+    yaml_reader: IncrementalYamlReader = dataclasses.field(
+        default_factory=IncrementalYamlReader
+    )
+
+
+def read_message(input_stream: BinaryIO) -> dict[str, Any] | None:
+    """Read a JSON-RPC message framed with LSP base protocol headers.
+
+    Args:
+        input_stream: Stream the client writes to.
+
+    Returns:
+        The message, or None if the stream is closed.
+    """
+    content_length = None
+    while True:
+        header = input_stream.readline()
+        if not header:
+            return None
+        header = header.strip()
+        if not header:
+            break
+        name, _, value = header.decode("ascii").partition(":")
+        if name.strip().lower() == "content-length":
+            content_length = int(value)
+
+    if content_length is None:
+        return {}
+    return json.loads(input_stream.read(content_length).decode("utf-8"))
+
+
+def write_message(output_stream: BinaryIO, message: dict[str, Any]) -> None:
+    """Write a JSON-RPC message framed with LSP base protocol headers.
+
+    Args:
+        output_stream: Stream the client reads from.
+        message: Message to send.
+    """
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    output_stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    output_stream.flush()
+
+
+def get_path_from_uri(uri: str) -> pathlib.Path | None:
+    """Convert a document URI to a file path.
+
+    Args:
+        uri: Document URI.
+
+    Returns:
+        The file path, or None for documents that aren't files (e.g., unsaved
+        editor buffers).
+    """
+    parsed_uri = urllib.parse.urlparse(uri)
+    if parsed_uri.scheme != "file":
+        return None
+    return pathlib.Path(urllib.request.url2pathname(parsed_uri.path))
+
+
+def convert_column_to_utf16(line: str, column: int) -> int:
+    """Convert a character column to the UTF-16 code units LSP positions count.
+
+    Args:
+        line: Line the column is on.
+        column: 0-indexed column in characters.
+
+    Returns:
+        0-indexed column in UTF-16 code units.
+    """
+    return len(line[:column].encode("utf-16-le")) // 2
+
+
+def build_diagnostic(
+    lines: list[str], line_number: int, column: int, message: str
+) -> dict[str, Any]:
+    """Build an error diagnostic spanning from a position to the end of its line.
+
+    Args:
+        lines: Lines of the document.
+        line_number: 0-indexed line of the error.
+        column: 0-indexed column of the error, in characters.
+        message: Error message.
+
+    Returns:
+        LSP diagnostic.
+    """
+    line_number = min(max(line_number, 0), max(len(lines) - 1, 0))
+    line = lines[line_number].rstrip("\r\n") if lines else ""
+    column = min(max(column, 0), len(line))
+    return {
+        "range": {
+            "start": {
+                "line": line_number,
+                "character": convert_column_to_utf16(line, column),
+            },
+            "end": {
+                "line": line_number,
+                "character": convert_column_to_utf16(line, len(line)),
+            },
+        },
+        "severity": error_diagnostic_severity,
+        "source": "rendercv",
+        "message": message,
+    }
+
+
+def convert_validation_error_to_diagnostic(
+    lines: list[str], validation_error: RenderCVValidationError
+) -> dict[str, Any]:
+    """Convert a validation error to an LSP diagnostic.
+
+    Args:
+        lines: Lines of the document.
+        validation_error: Error with 1-indexed YAML coordinates.
+
+    Returns:
+        LSP diagnostic starting where the error's YAML location starts.
+    """
+    if validation_error.yaml_location is None:
+        line_number, column = 1, 1
+    else:
+        (line_number, column), _ = validation_error.yaml_location
+    message = validation_error.message
+    if validation_error.schema_location:
+        message = f"{'.'.join(validation_error.schema_location)}: {message}"
+    return build_diagnostic(lines, line_number - 1, column - 1, message)
+
+
+def get_diagnostics(
+    text: str,
+    yaml_reader: IncrementalYamlReader,
+    input_file_path: pathlib.Path | None,
+) -> list[dict[str, Any]]:
+    """Validate a document and list its problems as LSP diagnostics.
+
+    Why:
+        Diagnostics come from the same pipeline as `rendercv render`
+        (`build_rendercv_dictionary_and_model` and the coordinate mapping of
+        `parse_validation_errors`), so the editor reports exactly what rendering
+        would. The document is parsed with an `IncrementalYamlReader`, which
+        only reparses the parts that changed since the last version. Documents
+        without a top-level `cv` key (e.g., separate design or locale files)
+        aren't CV input files and get no diagnostics.
+
+    Args:
+        text: Document contents.
+        yaml_reader: Reader that parsed the document's previous versions.
+        input_file_path: Path of the document, if it is a file.
+
+    Returns:
+        LSP diagnostics, empty if the document is valid.
+    """
+    lines = text.splitlines()
+    main_yaml_file: str | CommentedMap
+    try:
+        main_yaml_file = yaml_reader.read(text)
+    except ruamel.yaml.YAMLError:
+        # Let the model builder report the syntax error:
+        main_yaml_file = text
+    except (RenderCVUserError, RenderCVInternalError):
+        # Empty documents and plain strings:
+        return []
+    else:
+        if not isinstance(main_yaml_file, CommentedMap) or "cv" not in main_yaml_file:
+            return []
+
+    try:
+        build_rendercv_dictionary_and_model(
+            main_yaml_file, input_file_path=input_file_path
+        )
+    except RenderCVUserValidationError as e:
+        return [
+            convert_validation_error_to_diagnostic(lines, validation_error)
+            for validation_error in e.validation_errors
+            if validation_error.yaml_source == "main_yaml_file"
+        ]
+    except RenderCVUserError as e:
+        return [build_diagnostic(lines, 0, 0, e.message or "Invalid input file.")]
+
+    return []
+
+
+class LanguageServer:
+    """Language server publishing RenderCV validation errors as diagnostics.
+
+    Why:
+        Editors show problems while the YAML input file is edited, without a
+        full `rendercv render`. Messages are read on the calling thread, and
+        documents are validated on a single worker thread, so the model
+        machinery stays warm and a slow validation never blocks reading the
+        next change. Changes arriving while a document waits or is validated
+        are coalesced, and only the latest version is validated and published.
+
+    Args:
+        input_stream: Stream the client writes messages to.
+        output_stream: Stream the client reads messages from.
+    """
+
+    def __init__(self, input_stream: BinaryIO, output_stream: BinaryIO) -> None:
+        self.input_stream = input_stream
+        self.output_stream = output_stream
+        self.output_lock = threading.Lock()
+
+        self.documents: dict[str, OpenDocument] = {}
+        # Documents waiting to be validated, by the time they are due:
+        self.pending_documents: dict[str, float] = {}
+        self.condition = threading.Condition()
+        self.is_stopped = False
+        self.is_initialized = False
+        self.is_shut_down = False
+
+        self.worker = threading.Thread(
+            target=self.run_worker, name="rendercv-lsp-worker", daemon=True
+        )
+
+    def serve(self) -> int:
+        """Handle messages until the client exits or closes the stream.
+
+        Returns:
+            Exit code: 0 if the client shut the server down before exiting,
+            otherwise 1.
+        """
+        self.worker.start()
+        try:
+            while True:
+                message = read_message(self.input_stream)
+                if message is None:
+                    return 1
+                if message.get("method") == "exit":
+                    return 0 if self.is_shut_down else 1
+                self.handle_message(message)
+        finally:
+            with self.condition:
+                self.is_stopped = True
+                self.condition.notify()
+            self.worker.join()
+
+    def send(self, message: dict[str, Any]) -> None:
+        """Send a message to the client.
+
+        Args:
+            message: JSON-RPC message without the `jsonrpc` member.
+        """
+        with self.output_lock:
+            write_message(self.output_stream, {"jsonrpc": "2.0", **message})
+
+    def log(self, message: str) -> None:
+        """Show an error in the client's log.
+
+        Args:
+            message: Message to log.
+        """
+        self.send(
+            {
+                "method": "window/logMessage",
+                "params": {"type": error_message_type, "message": message},
+            }
+        )
+
+    def handle_message(self, message: dict[str, Any]) -> None:
+        """Dispatch a request or notification.
+
+        Args:
+            message: JSON-RPC message from the client.
+        """
+        method = message.get("method")
+        params = message.get("params") or {}
+        is_request = "id" in message
+
+        if method == "initialize":
+            self.is_initialized = True
+            result = {
+                "capabilities": {
+                    "textDocumentSync": {
+                        "openClose": True,
+                        "change": full_text_document_sync,
+                    }
+                },
+                "serverInfo": {"name": "rendercv", "version": __version__},
+            }
+            self.send({"id": message["id"], "result": result})
+            return
+
+        if is_request and not self.is_initialized:
+            self.send(
+                {
+                    "id": message["id"],
+                    "error": {
+                        "code": server_not_initialized_error_code,
+                        "message": "The server isn't initialized.",
+                    },
+                }
+            )
+            return
+
+        if method == "shutdown":
+            self.is_shut_down = True
+            self.send({"id": message["id"], "result": None})
+        elif method == "textDocument/didOpen":
+            text_document = params["textDocument"]
+            self.update_document(
+                text_document["uri"], text_document["text"], text_document["version"]
+            )
+        elif method == "textDocument/didChange":
+            text_document = params["textDocument"]
+            # Full document sync: the last change holds the whole new text.
+            self.update_document(
+                text_document["uri"],
+                params["contentChanges"][-1]["text"],
+                text_document["version"],
+            )
+        elif method == "textDocument/didClose":
+            uri = params["textDocument"]["uri"]
+            with self.condition:
+                self.documents.pop(uri, None)
+                self.pending_documents.pop(uri, None)
+            self.publish_diagnostics(uri, None, [])
+        elif is_request:
+            self.send(
+                {
+                    "id": message["id"],
+                    "error": {
+                        "code": (
+                            method_not_found_error_code
+                            if method
+                            else invalid_request_error_code
+                        ),
+                        "message": f"Unsupported method: {method}",
+                    },
+                }
+            )
+
+    def update_document(self, uri: str, text: str, version: int) -> None:
+        """Store a document's new version and schedule its validation.
+
+        Args:
+            uri: Document URI.
+            text: Document contents.
+            version: Document version.
+        """
+        with self.condition:
+            document = self.documents.get(uri)
+            if document is None:
+                self.documents[uri] = OpenDocument(text=text, version=version)
+            else:
+                document.text = text
+                document.version = version
+            # Postpone a pending validation until the changes stop:
+            self.pending_documents[uri] = (
+                time.monotonic() + diagnostics_debounce_in_seconds
+            )
+            self.condition.notify()
+
+    def run_worker(self) -> None:
+        """Validate scheduled documents as they become due, until stopped."""
+        # Build the schema and model machinery before the first document arrives:
+        try:
+            get_diagnostics(
+                create_sample_yaml_input_file(file_path=None),
+                IncrementalYamlReader(),
+                None,
+            )
+        except Exception:
+            self.log(f"Warming up failed:\n{traceback.format_exc()}")
+
+        while True:
+            with self.condition:
+                while True:
+                    if self.is_stopped:
+                        return
+                    now = time.monotonic()
+                    due_uri = next(
+                        (
+                            uri
+                            for uri, due_time in self.pending_documents.items()
+                            if due_time <= now
+                        ),
+                        None,
+                    )
+                    if due_uri is not None:
+                        break
+                    self.condition.wait(
+                        min(self.pending_documents.values()) - now
+                        if self.pending_documents
+                        else None
+                    )
+                del self.pending_documents[due_uri]
+                document = self.documents[due_uri]
+                text, version = document.text, document.version
+
+            try:
+                diagnostics = get_diagnostics(
+                    text, document.yaml_reader, get_path_from_uri(due_uri)
+                )
+            except Exception:
+                # A bug in validation must not stop the server:
+                self.log(f"Validating {due_uri} failed:\n{traceback.format_exc()}")
+                continue
+
+            with self.condition:
+                # Publish only if the document wasn't changed or closed meanwhile:
+                if self.documents.get(due_uri) is document and (
+                    document.version == version
+                ):
+                    self.publish_diagnostics(due_uri, version, diagnostics)
+
+    def publish_diagnostics(
+        self, uri: str, version: int | None, diagnostics: list[dict[str, Any]]
+    ) -> None:
+        """Send a document's diagnostics to the client.
+
+        Args:
+            uri: Document URI.
+            version: Document version the diagnostics are for.
+            diagnostics: LSP diagnostics.
+        """
+        params: dict[str, Any] = {"uri": uri, "diagnostics": diagnostics}
+        if version is not None:
+            params["version"] = version
+        self.send({"method": "textDocument/publishDiagnostics", "params": params})
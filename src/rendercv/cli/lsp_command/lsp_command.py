@@ -0,0 +1,18 @@
+import sys
+
+import typer
+
+from ..app import app
+from .language_server import LanguageServer
+
+
+@app.command(
+    name="lsp",
+    help=(
+        "Start a language server that shows validation errors in your editor while"
+        " you edit a YAML input file. It communicates over stdin and stdout."
+    ),
+)
+def cli_command_lsp():
+    server = LanguageServer(sys.stdin.buffer, sys.stdout.buffer)
+    raise typer.Exit(code=server.serve())
@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+import pathlib
+from typing import Any
+
+from rendercv.exception import RenderCVUserError
+
+
+def parse_variants_file(file_path: pathlib.Path) -> list[dict[str, Any]]:
+    """Parse a variants file into one dotted-path override map per variant.
+
+    Why:
+        Tailoring a CV to many applications means rendering one base CV with a
+        few different fields each time. A table of overrides, with the same
+        dotted paths as CLI overrides, describes all variants in one file.
+
+    Example:
+        ```py
+        # variants.csv:
+        # cv.headline,design.theme
+        # Backend Engineer,classic
+        # Data Engineer,
+        variants = parse_variants_file(pathlib.Path("variants.csv"))
+        # Returns: [
+        #     {"cv.headline": "Backend Engineer", "design.theme": "classic"},
+        #     {"cv.headline": "Data Engineer"},
+        # ]
+        ```
+
+    Args:
+        file_path: A JSON Lines file with one object per line, or a CSV file with
+            dotted paths in its header row. CSV headers and cells are stripped of
+            surrounding spaces; empty cells keep the base CV's value, and columns
+            without a header are ignored.
+
+    Returns:
+        Map of dotted paths to override values for each variant.
+    """
+    if not file_path.is_file():
+        message = f"The variants file `{file_path}` doesn't exist!"
+        raise RenderCVUserError(message)
+
+    content = file_path.read_text(encoding="utf-8")
+
+    variants: list[dict[str, Any]] = []
+    if file_path.suffix == ".csv":
+        for row in csv.DictReader(io.StringIO(content)):
+            variant: dict[str, Any] = {}
+            for header, cell in row.items():
+                # Cells beyond the header are listed under None, and missing
+                # cells are None:
+                if not isinstance(header, str) or not isinstance(cell, str):
+                    continue
+                if header.strip() and cell.strip():
+                    variant[header.strip()] = cell.strip()
+            variants.append(variant)
+    elif file_path.suffix == ".jsonl":
+        for line_number, line in enumerate(content.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                variant = json.loads(line)
+            except json.JSONDecodeError as e:
+                message = (
+                    f"Line {line_number} of the variants file `{file_path.name}` is"
+                    f" not valid JSON: {e.msg}."
+                )
+                raise RenderCVUserError(message) from e
+            if not isinstance(variant, dict):
+                message = (
+                    f"Line {line_number} of the variants file `{file_path.name}`"
+                    " should be a JSON object of dotted paths and values."
+                )
+                raise RenderCVUserError(message)
+            variants.append(variant)
+    else:
+        message = (
+            "The variants file should have one of the following extensions: .jsonl,"
+            f" .csv. The variants file is {file_path.name}."
+        )
+        raise RenderCVUserError(message)
+
+    if not variants:
+        message = f"The variants file `{file_path.name}` doesn't have any variants."
+        raise RenderCVUserError(message)
+
+    return variants
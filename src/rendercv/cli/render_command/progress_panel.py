@@ -1,4 +1,5 @@
 import pathlib
+import threading
 from dataclasses import dataclass
 
 import rich.box
@@ -10,30 +11,11 @@ import typer
 
 from rendercv.exception import RenderCVUserError, RenderCVValidationError
 
-
-def format_validation_error_location(error_object: RenderCVValidationError) -> str:
-    """Format schema/YAML location for validation error table rows.
-
-    Why:
-        YAML parsing errors don't have schema locations, so we show source file
-        and line/column coordinates to keep the location column actionable.
-
-    Args:
-        error_object: Validation error with schema and YAML location metadata.
-
-    Returns:
-        Human-readable location string for table display.
-    """
-    if error_object.schema_location is not None:
-        return ".".join(error_object.schema_location)
-
-    if error_object.yaml_location is None:
-        return error_object.yaml_source
-
-    (start_line, _), (end_line, _) = error_object.yaml_location
-    if start_line == end_line:
-        return f"{error_object.yaml_source}: line {start_line}"
-    return f"{error_object.yaml_source}: line {start_line} to line {end_line}"
+from .progress_reporter import (
+    MemoryUse,
+    format_memory_use,
+    format_validation_error_location,
+)
 
 
 class ProgressPanel(rich.live.Live):
@@ -49,10 +31,14 @@ class ProgressPanel(rich.live.Live):
 
     Args:
         quiet: Suppress all terminal output.
+        measure_memory: Measure and display each step's memory use (see
+            `measure_memory`).
     """
 
-    def __init__(self, quiet: bool = False):
+    def __init__(self, quiet: bool = False, measure_memory: bool = False):
         self.completed_steps: list[CompletedStep] = []
+        self.measure_memory = measure_memory
+        self.lock = threading.Lock()
         super().__init__(
             rich.panel.Panel(
                 "...",
@@ -65,22 +51,36 @@ class ProgressPanel(rich.live.Live):
         )
 
     def update_progress(
-        self, time_took: str, message: str, paths: list[pathlib.Path]
+        self,
+        time_took: str,
+        message: str,
+        paths: list[pathlib.Path],
+        memory: MemoryUse | None = None,
     ) -> None:
         """Add completed step to progress display.
 
+        Why:
+            PDFs and PNGs of several CVs are compiled on a thread pool, so steps
+            can complete on several threads at once. The lock keeps each step's
+            append and redraw together.
+
         Args:
             time_took: Execution time in milliseconds as string.
             message: Step description.
             paths: Generated file paths to display.
+            memory: Memory use of the step, if measured.
         """
-        self.completed_steps.append(CompletedStep(time_took, message, paths))
-        self.print_progress_panel(title="Rendering your CV...")
+        with self.lock:
+            self.completed_steps.append(
+                CompletedStep(time_took, message, paths, memory)
+            )
+            self.print_progress_panel(title="Rendering your CV...")
 
     def finish_progress(self) -> None:
         """Display final success panel and clear state."""
-        self.print_progress_panel(title="Your CV is ready")
-        self.completed_steps.clear()
+        with self.lock:
+            self.print_progress_panel(title="Your CV is ready")
+            self.completed_steps.clear()
 
     def print_progress_panel(self, title: str) -> None:
         """Render progress panel with all completed steps.
@@ -102,6 +102,9 @@ class ProgressPanel(rich.live.Live):
                 paths_str = "; ".join(paths_as_strings)
 
             timing = f"[bold green]{step.timing_ms + ' ms':<8}[/bold green]"
+            if step.memory is not None:
+                memory = format_memory_use(step.memory)
+                timing += f" [bold cyan]{memory:<29}[/bold cyan]"
             message = step.message + (": " if paths_str else ".")
             paths_display = f"[purple]{paths_str}[/purple]" if paths_str else ""
             lines.append(f"[green]✓[/green] {timing} {message:<26} {paths_display}")
@@ -179,3 +182,4 @@ class CompletedStep:
     timing_ms: str
     message: str
     paths: list[pathlib.Path]
+    memory: MemoryUse | None = None
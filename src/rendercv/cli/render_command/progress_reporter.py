@@ -0,0 +1,314 @@
+import json
+import pathlib
+import sys
+import threading
+from dataclasses import asdict, dataclass
+from typing import Protocol, TextIO
+
+import typer
+
+from rendercv.exception import RenderCVUserError, RenderCVValidationError
+
+
+def format_validation_error_location(error_object: RenderCVValidationError) -> str:
+    """Format schema/YAML location for validation error table rows.
+
+    Why:
+        YAML parsing errors don't have schema locations, so we show source file
+        and line/column coordinates to keep the location column actionable.
+
+    Args:
+        error_object: Validation error with schema and YAML location metadata.
+
+    Returns:
+        Human-readable location string for table display.
+    """
+    if error_object.schema_location is not None:
+        return ".".join(error_object.schema_location)
+
+    if error_object.yaml_location is None:
+        return error_object.yaml_source
+
+    (start_line, _), (end_line, _) = error_object.yaml_location
+    if start_line == end_line:
+        return f"{error_object.yaml_source}: line {start_line}"
+    return f"{error_object.yaml_source}: line {start_line} to line {end_line}"
+
+
+@dataclass
+class MemoryUse:
+    """Memory use of a render step, as measured by `measure_memory`.
+
+    Why:
+        Reporters show it to people, but scripts sizing render workers need the
+        figures as numbers, so they are kept in bytes and formatted only for
+        display (see `format_memory_use`).
+    """
+
+    traced_peak_bytes: int
+    # Growth of the process's all-time peak resident set size, so zero unless
+    # the step pushed that peak higher. None on Windows:
+    peak_rss_increase_bytes: int | None = None
+
+
+def format_memory_use(memory: MemoryUse) -> str:
+    """Format a step's memory use for display.
+
+    Example:
+        ```py
+        format_memory_use(MemoryUse(12_897_484, 0))
+        # Returns: "12.3 MiB, peak RSS +0.0 MiB"
+        ```
+
+    Args:
+        memory: Memory use of the step.
+
+    Returns:
+        Memory use in mebibytes.
+    """
+    mebibyte = 1024 * 1024
+    text = f"{memory.traced_peak_bytes / mebibyte:.1f} MiB"
+    if memory.peak_rss_increase_bytes is not None:
+        text += f", peak RSS +{memory.peak_rss_increase_bytes / mebibyte:.1f} MiB"
+    return text
+
+
+class ProgressReporter(Protocol):
+    """Receiver of a render's progress, such as `ProgressPanel`.
+
+    Why:
+        The rich progress panel is meant for people watching a terminal. Batch
+        scripts and servers render many CVs with nobody looking, or need
+        machine-readable progress, so `run_rendercv` reports to any object with
+        these methods. `update_progress` can be called from several threads at
+        once, as variants are compiled on a thread pool.
+    """
+
+    measure_memory: bool
+
+    def update_progress(
+        self,
+        time_took: str,
+        message: str,
+        paths: list[pathlib.Path],
+        memory: MemoryUse | None = None,
+    ) -> None:
+        """Report a completed step.
+
+        Args:
+            time_took: Execution time in milliseconds as string.
+            message: Step description.
+            paths: Generated file paths.
+            memory: Memory use of the step, if measured.
+        """
+        ...
+
+    def finish_progress(self) -> None:
+        """Report that the render finished successfully."""
+        ...
+
+    def print_user_error(self, user_error: RenderCVUserError) -> None:
+        """Report an error that ended the render.
+
+        Args:
+            user_error: User-facing error.
+        """
+        ...
+
+    def print_validation_errors(self, errors: list[RenderCVValidationError]) -> None:
+        """Report the validation errors that ended the render.
+
+        Args:
+            errors: Validation errors with location, input, and message.
+        """
+        ...
+
+
+class SilentProgressReporter:
+    """Progress reporter that reports nothing.
+
+    Args:
+        exit_on_error: End the CLI command with exit code 1 on errors.
+    """
+
+    measure_memory = False
+
+    def __init__(self, exit_on_error: bool = False):
+        self.exit_on_error = exit_on_error
+
+    def update_progress(
+        self,
+        time_took: str,
+        message: str,
+        paths: list[pathlib.Path],
+        memory: MemoryUse | None = None,
+    ) -> None:
+        pass
+
+    def finish_progress(self) -> None:
+        pass
+
+    def print_user_error(self, user_error: RenderCVUserError) -> None:  # NOQA: ARG002
+        if self.exit_on_error:
+            raise typer.Exit(code=1)
+
+    def print_validation_errors(self, errors: list[RenderCVValidationError]) -> None:  # NOQA: ARG002
+        if self.exit_on_error:
+            raise typer.Exit(code=1)
+
+
+class PlainProgressReporter:
+    """Progress reporter that prints one plain line per step.
+
+    Example:
+        ```py
+        run_rendercv(input_file_path, PlainProgressReporter())
+        # Prints: Generated PDF (150 ms): /cv/rendercv_output/John_Doe_CV.pdf
+        ```
+
+    Args:
+        file: Stream steps are written to. Defaults to standard output; errors
+            always go to standard error.
+        exit_on_error: End the CLI command with exit code 1 on errors.
+        measure_memory: Measure and print each step's memory use (see
+            `measure_memory`).
+    """
+
+    def __init__(
+        self,
+        file: TextIO | None = None,
+        exit_on_error: bool = False,
+        measure_memory: bool = False,
+    ):
+        self.file = file
+        self.exit_on_error = exit_on_error
+        self.measure_memory = measure_memory
+        self.lock = threading.Lock()
+
+    def write(self, line: str, file: TextIO | None = None) -> None:
+        """Write a line, keeping lines of steps run on several threads apart.
+
+        Args:
+            line: Line without its line break.
+            file: Stream to write to. Defaults to the reporter's stream.
+        """
+        with self.lock:
+            (file or self.file or sys.stdout).write(f"{line}\n")
+
+    def update_progress(
+        self,
+        time_took: str,
+        message: str,
+        paths: list[pathlib.Path],
+        memory: MemoryUse | None = None,
+    ) -> None:
+        details = f"{time_took} ms"
+        if memory is not None:
+            details += f", {format_memory_use(memory)}"
+        paths_str = "; ".join(str(path) for path in paths)
+        self.write(f"{message} ({details})" + (f": {paths_str}" if paths_str else ""))
+
+    def finish_progress(self) -> None:
+        self.write("Your CV is ready.")
+
+    def print_user_error(self, user_error: RenderCVUserError) -> None:
+        message = user_error.message or "An unknown error occurred."
+        self.write(f"Error: {message}", sys.stderr)
+        if self.exit_on_error:
+            raise typer.Exit(code=1)
+
+    def print_validation_errors(self, errors: list[RenderCVValidationError]) -> None:
+        self.write("There are validation errors!", sys.stderr)
+        for error_object in errors:
+            self.write(
+                f"{format_validation_error_location(error_object)}:"
+                f" {error_object.message} (input: {error_object.input})",
+                sys.stderr,
+            )
+        if self.exit_on_error:
+            raise typer.Exit(code=1)
+
+
+class JsonProgressReporter:
+    """Progress reporter that writes one JSON object per event (JSON Lines).
+
+    Example:
+        ```py
+        run_rendercv(input_file_path, JsonProgressReporter())
+        # Prints: {"event": "step", "message": "Generated PDF", "time_ms": 150,
+        #          "paths": ["/cv/rendercv_output/John_Doe_CV.pdf"]}
+        #         {"event": "finished"}
+        ```
+
+        With `measure_memory`, step events get a `memory` object with the
+        `MemoryUse` fields in bytes.
+
+    Args:
+        file: Stream events are written to. Defaults to standard output.
+        exit_on_error: End the CLI command with exit code 1 on errors.
+        measure_memory: Measure each step's memory use (see `measure_memory`)
+            and add it to the step events.
+    """
+
+    def __init__(
+        self,
+        file: TextIO | None = None,
+        exit_on_error: bool = False,
+        measure_memory: bool = False,
+    ):
+        self.file = file
+        self.exit_on_error = exit_on_error
+        self.measure_memory = measure_memory
+        self.lock = threading.Lock()
+
+    def write_event(self, event: dict) -> None:
+        """Write an event as one line of JSON.
+
+        Args:
+            event: JSON-serializable event.
+        """
+        line = json.dumps(event, ensure_ascii=False)
+        with self.lock:
+            (self.file or sys.stdout).write(f"{line}\n")
+
+    def update_progress(
+        self,
+        time_took: str,
+        message: str,
+        paths: list[pathlib.Path],
+        memory: MemoryUse | None = None,
+    ) -> None:
+        event: dict = {
+            "event": "step",
+            "message": message,
+            "time_ms": int(time_took),
+            "paths": [str(path) for path in paths],
+        }
+        if memory is not None:
+            event["memory"] = asdict(memory)
+        self.write_event(event)
+
+    def finish_progress(self) -> None:
+        self.write_event({"event": "finished"})
+
+    def print_user_error(self, user_error: RenderCVUserError) -> None:
+        self.write_event({"event": "error", "message": user_error.message})
+        if self.exit_on_error:
+            raise typer.Exit(code=1)
+
+    def print_validation_errors(self, errors: list[RenderCVValidationError]) -> None:
+        self.write_event(
+            {
+                "event": "validation_errors",
+                "errors": [
+                    {
+                        "location": format_validation_error_location(error_object),
+                        "input": error_object.input,
+                        "message": error_object.message,
+                    }
+                    for error_object in errors
+                ],
+            }
+        )
+        if self.exit_on_error:
+            raise typer.Exit(code=1)
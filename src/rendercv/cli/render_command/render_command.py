@@ -1,8 +1,13 @@
+import contextlib
 import pathlib
+import sys
+from collections.abc import Iterator
 from typing import Annotated
 
 import typer
+from ruamel.yaml.comments import CommentedMap
 
+from rendercv.exception import RenderCVUserError
 from rendercv.schema.rendercv_model_builder import (
     BuildRendercvModelArguments,
 )
@@ -10,11 +15,79 @@ from rendercv.schema.rendercv_model_builder import (
 from ..app import app
 from ..error_handler import handle_user_errors
 from .parse_override_arguments import parse_override_arguments
+from .parse_variants_file import parse_variants_file
 from .progress_panel import ProgressPanel
-from .run_rendercv import collect_input_file_paths, run_rendercv
+from .progress_reporter import (
+    JsonProgressReporter,
+    PlainProgressReporter,
+    ProgressReporter,
+    SilentProgressReporter,
+)
+from .run_rendercv import (
+    collect_input_file_paths,
+    read_main_yaml_file,
+    run_rendercv,
+)
 from .watcher import run_function_if_files_change
 
 
+def split_comma_separated_list(value: str | None) -> list[str] | None:
+    """Split a comma-separated CLI option value into its items.
+
+    Args:
+        value: Option value (e.g., `classic, sb2nov`).
+
+    Returns:
+        Non-empty, stripped items, or None if there are none.
+    """
+    if value is None:
+        return None
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    return items or None
+
+
+progress_formats = ("auto", "rich", "plain", "json")
+
+
+@contextlib.contextmanager
+def open_progress_reporter(
+    progress_format: str, quiet: bool, measure_memory: bool
+) -> Iterator[ProgressReporter]:
+    """Open the progress reporter for a render command's output.
+
+    Why:
+        The live rich panel only helps people watching a terminal. When the
+        output is piped (e.g., in CI logs), plain lines are cheaper and easier
+        to read, so `auto` picks the panel only for interactive terminals.
+
+    Args:
+        progress_format: One of `progress_formats`.
+        quiet: Report nothing.
+        measure_memory: Measure and report each step's memory use.
+
+    Returns:
+        Progress reporter that ends the command with exit code 1 on errors.
+    """
+    if progress_format not in progress_formats:
+        message = (
+            f"The progress format {progress_format} is not available. Available"
+            f" progress formats are: {', '.join(progress_formats)}"
+        )
+        raise RenderCVUserError(message)
+
+    if quiet:
+        yield SilentProgressReporter(exit_on_error=True)
+    elif progress_format == "json":
+        yield JsonProgressReporter(exit_on_error=True, measure_memory=measure_memory)
+    elif progress_format == "plain" or (
+        progress_format == "auto" and not sys.stdout.isatty()
+    ):
+        yield PlainProgressReporter(exit_on_error=True, measure_memory=measure_memory)
+    else:
+        with ProgressPanel(measure_memory=measure_memory) as progress_panel:
+            yield progress_panel
+
+
 @app.command(
     name="render",
     help=(
@@ -125,10 +198,7 @@ def cli_command_render(
         typer.Option(
             "--dont-generate-markdown",
             "-nomd",
-            help=(
-                "If provided, the Markdown file will not be generated. Disabling"
-                " Markdown generation implicitly disables HTML."
-            ),
+            help="If provided, the Markdown file will not be generated.",
         ),
     ] = None,
     dont_generate_html: Annotated[
@@ -166,6 +236,50 @@ def cli_command_render(
             help="If provided, the PNG file will not be generated.",
         ),
     ] = None,
+    narrow_fonts: Annotated[
+        bool | None,
+        typer.Option(
+            "--narrow-fonts",
+            "-nf",
+            help=(
+                "If provided, only the font families used by the design will be"
+                " loaded for PDF and PNG generation."
+            ),
+        ),
+    ] = None,
+    themes: Annotated[
+        str | None,
+        typer.Option(
+            "--themes",
+            help=(
+                "Comma-separated themes to render the CV in (e.g., classic,sb2nov)."
+                " The theme and locale language are appended to the output file names."
+            ),
+        ),
+    ] = None,
+    locales: Annotated[
+        str | None,
+        typer.Option(
+            "--locales",
+            help=(
+                "Comma-separated locale languages to render the CV in (e.g.,"
+                " english,turkish). The theme and locale language are appended to the"
+                " output file names."
+            ),
+        ),
+    ] = None,
+    variants: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--variants",
+            help=(
+                "A JSON Lines or CSV file of dotted-path overrides (e.g., cv.headline)"
+                " to render the CV with, one variant per line or row. The variant's"
+                " number is appended to the output file names, unless the variant"
+                " sets its own output paths."
+            ),
+        ),
+    ] = None,
     watch: Annotated[
         bool | None,
         typer.Option(
@@ -185,6 +299,29 @@ def cli_command_render(
             help="If provided, RenderCV will not print any messages.",
         ),
     ] = False,
+    progress_format: Annotated[
+        str,
+        typer.Option(
+            "--progress-format",
+            help=(
+                "How progress is reported: auto (a live panel in interactive"
+                " terminals, plain lines otherwise), rich, plain, or json (one JSON"
+                " object per event)."
+            ),
+        ),
+    ] = "auto",
+    measure_memory: Annotated[
+        bool,
+        typer.Option(
+            "--measure-memory",
+            "-mem",
+            help=(
+                "If provided, the peak Python memory and the growth of the peak"
+                " resident set size of each step are shown next to its timing."
+                " Measured steps run one at a time."
+            ),
+        ),
+    ] = False,
     # Dummy argument that only exists to show the override syntax in --help:
     yaml_field_override: Annotated[  # noqa: ARG001
         str | None,
@@ -199,9 +336,12 @@ def cli_command_render(
     input_file_path = pathlib.Path(input_file_name).absolute()
 
     # Resolve design/locale overlay files from YAML settings when not
-    # provided via CLI flags. collect_input_file_paths already handles
-    # parsing the YAML and resolving paths relative to the input file.
-    resolved_files = collect_input_file_paths(input_file_path, design, locale, settings)
+    # provided via CLI flags. The main YAML file is parsed once, here, and the
+    # parsed document is reused by the first render.
+    main_yaml_file: str | CommentedMap | None = read_main_yaml_file(input_file_path)
+    resolved_files = collect_input_file_paths(
+        input_file_path, design, locale, settings, main_yaml_file
+    )
     if design is None and "design" in resolved_files:
         design = resolved_files["design"]
     if locale is None and "locale" in resolved_files:
@@ -224,14 +364,42 @@ def cli_command_render(
         "dont_generate_markdown": dont_generate_markdown,
         "dont_generate_pdf": dont_generate_pdf,
         "dont_generate_png": dont_generate_png,
+        "narrow_fonts": narrow_fonts,
         "overrides": parse_override_arguments(extra_data_model_override_arguments),
     }
 
-    with ProgressPanel(quiet=quiet) as progress_panel:
+    theme_list = split_comma_separated_list(themes)
+    locale_list = split_comma_separated_list(locales)
+    variant_list = parse_variants_file(variants) if variants else None
+
+    with open_progress_reporter(
+        progress_format, quiet, measure_memory
+    ) as progress_panel:
         if watch:
-            run_function_if_files_change(
-                list(resolved_files.values()),
-                lambda: run_rendercv(input_file_path, progress_panel, **arguments),
-            )
+
+            def render() -> None:
+                nonlocal main_yaml_file
+                # Renders after the first one are triggered by file changes, so
+                # they read the main YAML file again:
+                main_yaml_file, current_main_yaml_file = None, main_yaml_file
+                run_rendercv(
+                    input_file_path,
+                    progress_panel,
+                    main_yaml_file=current_main_yaml_file,
+                    themes=theme_list,
+                    locales=locale_list,
+                    variants=variant_list,
+                    **arguments,
+                )
+
+            run_function_if_files_change(list(resolved_files.values()), render)
         else:
-            run_rendercv(input_file_path, progress_panel, **arguments)
+            run_rendercv(
+                input_file_path,
+                progress_panel,
+                main_yaml_file=main_yaml_file,
+                themes=theme_list,
+                locales=locale_list,
+                variants=variant_list,
+                **arguments,
+            )
@@ -1,37 +1,138 @@
-import contextlib
+import concurrent.futures
+import dataclasses
+import os
 import pathlib
+import sys
+import threading
 import time
+import tracemalloc
 from collections.abc import Callable
-from typing import Literal, Unpack
+from typing import Any, Literal, Unpack
 
 import jinja2
+from ruamel.yaml.comments import CommentedMap
 
 from rendercv.exception import RenderCVUserError, RenderCVUserValidationError
 from rendercv.renderer.html import generate_html
 from rendercv.renderer.markdown import generate_markdown
 from rendercv.renderer.pdf_png import generate_pdf, generate_png
+from rendercv.renderer.photo import (
+    build_rendercv_model,
+    get_local_photo_path,
+    start_photo_download_of_input,
+    wait_for_photo_download,
+)
+from rendercv.renderer.templater.model_processor import download_photo_from_url
 from rendercv.renderer.typst import generate_typst
+from rendercv.schema.models.rendercv_model import RenderCVModel
+from rendercv.schema.override_dictionary import apply_overrides_to_dictionary
 from rendercv.schema.rendercv_model_builder import (
     BuildRendercvModelArguments,
-    build_rendercv_dictionary_and_model,
+    build_rendercv_dictionary,
+    build_rendercv_model_variants,
     read_yaml_with_validation_errors,
 )
 
-from .progress_panel import ProgressPanel
+from .progress_reporter import MemoryUse, ProgressReporter
+
+# At most this many theme/locale variants are compiled to PDF and PNG at once:
+variant_compilation_pool_size = os.cpu_count() or 1
+
+# Held by `measure_memory` while a step runs, so measured steps run one at a time:
+memory_measurement_lock = threading.Lock()
+
+
+def get_peak_resident_set_size() -> int | None:
+    """Get the most memory the process has held in RAM so far.
+
+    Why:
+        The Typst compiler allocates natively, so tracemalloc doesn't see its
+        memory. It only shows in the process's peak resident set size.
+
+    Returns:
+        Peak resident set size in bytes, or None on Windows.
+    """
+    if sys.platform == "win32":
+        return None
+    import resource  # NOQA: PLC0415
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes:
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure_memory[T, **P](
+    func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+) -> tuple[T, MemoryUse]:
+    """Execute function and measure the memory it used.
+
+    Why:
+        Sizing render workers needs each step's memory use. tracemalloc reports
+        the peak of the Python allocations made during the step (validation,
+        model processing, templating), and the growth of the process's peak
+        resident set size covers native allocations, such as the Typst
+        compiler's. That peak only grows when a step needs more memory than the
+        process ever held before, so a step reusing memory freed earlier shows
+        no increase. Tracing runs only while steps are measured.
+
+        Both figures are process-wide, and `tracemalloc.reset_peak` resets the
+        peak of every thread. Steps measured concurrently (e.g., variants
+        compiled on a thread pool) would reset and free into each other's
+        figures, so measured steps run one at a time. Threads that aren't
+        measured, such as photo downloads, can still add to a step's figures.
+
+    Example:
+        ```py
+        typst_path, memory = measure_memory(generate_typst, rendercv_model)
+        # memory: MemoryUse(traced_peak_bytes=12897484, peak_rss_increase_bytes=0)
+        ```
+
+    Args:
+        func: Function to execute and measure.
+        args: Positional arguments for func.
+        kwargs: Keyword arguments for func.
+
+    Returns:
+        Function result and its memory use as reported to the progress reporter.
+    """
+    with memory_measurement_lock:
+        # Tracing started elsewhere is left running:
+        owns_tracing = not tracemalloc.is_tracing()
+        if owns_tracing:
+            tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            traced_before, _ = tracemalloc.get_traced_memory()
+            peak_rss_before = get_peak_resident_set_size()
+
+            result = func(*args, **kwargs)
+
+            _, traced_peak = tracemalloc.get_traced_memory()
+            peak_rss_after = get_peak_resident_set_size()
+        finally:
+            if owns_tracing:
+                tracemalloc.stop()
+
+    memory = MemoryUse(traced_peak_bytes=traced_peak - traced_before)
+    if peak_rss_before is not None and peak_rss_after is not None:
+        memory.peak_rss_increase_bytes = peak_rss_after - peak_rss_before
+
+    return result, memory
 
 
 def timed_step[T, **P](
     message: str,
-    progress_panel: ProgressPanel,
+    progress_panel: ProgressReporter,
     func: Callable[P, T],
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> T:
-    """Execute function, measure timing, and update progress panel with result.
+    """Execute function, measure timing, and report result to progress reporter.
 
     Why:
         Each generation step (Typst, PDF, PNG) returns file paths. This wrapper
-        times execution and automatically displays results in progress panel.
+        times execution and automatically reports results to the progress
+        reporter.
 
     Example:
         ```py
@@ -41,9 +142,14 @@ def timed_step[T, **P](
         # Progress shows: ✓ 150 ms  Generated PDF: ./cv.pdf
         ```
 
+        If the progress reporter measures memory, each step's memory use (see
+        `measure_memory`) is shown next to its timing, including steps that
+        don't generate files, such as validation, unless they are disabled.
+        Otherwise, nothing is measured.
+
     Args:
         message: Step description for progress display.
-        progress_panel: Progress panel to update.
+        progress_panel: Progress reporter to update (see `ProgressReporter`).
         func: Function to execute and time.
         args: Positional arguments for func.
         kwargs: Keyword arguments for func.
@@ -51,8 +157,12 @@ def timed_step[T, **P](
     Returns:
         Function result.
     """
+    memory: MemoryUse | None = None
     start = time.perf_counter()
-    result = func(*args, **kwargs)
+    if progress_panel.measure_memory:
+        result, memory = measure_memory(func, *args, **kwargs)
+    else:
+        result = func(*args, **kwargs)
     end = time.perf_counter()
     timing_ms = f"{(end - start) * 1000:.0f}"
 
@@ -64,19 +174,43 @@ def timed_step[T, **P](
             message = f"{message}s"
         paths = [p for p in result if isinstance(p, pathlib.Path)]
 
-    if paths:
+    if paths or (memory is not None and result is not None):
         progress_panel.update_progress(
-            time_took=timing_ms, message=message, paths=paths
+            time_took=timing_ms, message=message, paths=paths, memory=memory
         )
 
     return result
 
 
+def read_main_yaml_file(input_file_path: pathlib.Path) -> str | CommentedMap:
+    """Read and parse the main YAML input file once for a whole render.
+
+    Why:
+        Both `collect_input_file_paths` and `run_rendercv` need the parsed main
+        YAML file. Parsing it once and passing the result to both halves the
+        work before validation, which matters in watch mode. Invalid YAML is
+        returned as its text, so its syntax errors are reported by `run_rendercv`
+        like any other validation error.
+
+    Args:
+        input_file_path: Path to the main YAML input file.
+
+    Returns:
+        Parsed YAML map, or the file's contents if it isn't valid YAML.
+    """
+    main_yaml_file = input_file_path.read_text(encoding="utf-8")
+    try:
+        return read_yaml_with_validation_errors(main_yaml_file, "main_yaml_file")
+    except RenderCVUserValidationError:
+        return main_yaml_file
+
+
 def collect_input_file_paths(
     input_file_path: pathlib.Path,
     design: pathlib.Path | None = None,
     locale: pathlib.Path | None = None,
     settings: pathlib.Path | None = None,
+    main_yaml_file: str | CommentedMap | None = None,
 ) -> dict[Literal["input", "design", "locale", "settings"], pathlib.Path]:
     """Collect all input file paths involved in a render.
 
@@ -92,6 +226,8 @@ def collect_input_file_paths(
         design: CLI-provided design file path.
         locale: CLI-provided locale file path.
         settings: CLI-provided settings file path.
+        main_yaml_file: The main YAML input file as returned by
+            `read_main_yaml_file`. If not given, the file is read.
 
     Returns:
         Mapping from role ("input", "design", "locale", "settings") to path.
@@ -107,15 +243,14 @@ def collect_input_file_paths(
     if settings:
         files["settings"] = settings
 
+    if main_yaml_file is None:
+        main_yaml_file = read_main_yaml_file(input_file_path)
+
     # Also include design/locale files referenced in the YAML itself
     # (CLI flags take precedence, so skip if already provided).
     # If YAML is invalid, watch mode should still start by watching the main file.
-    with contextlib.suppress(RenderCVUserValidationError):
-        main_dict = read_yaml_with_validation_errors(
-            input_file_path.read_text(encoding="utf-8"),
-            "main_yaml_file",
-        )
-        rc = main_dict.get("settings", {}).get("render_command", {})
+    if isinstance(main_yaml_file, dict):
+        rc = main_yaml_file.get("settings", {}).get("render_command", {})
         if "design" not in files and rc.get("design"):
             files["design"] = (input_file_path.parent / rc["design"]).resolve()
         if "locale" not in files and rc.get("locale"):
@@ -124,29 +259,287 @@ def collect_input_file_paths(
     return files
 
 
+def build_rendercv_models(
+    main_yaml_file: str | CommentedMap,
+    input_file_path: pathlib.Path,
+    themes: list[str] | None,
+    locales: list[str] | None,
+    variants: list[dict[str, Any]] | None = None,
+    **kwargs: Unpack[BuildRendercvModelArguments],
+) -> list[RenderCVModel]:
+    """Validate the input files once per variant, theme, and locale combination.
+
+    Why:
+        Like `build_rendercv_model`, but the input is read once and only the
+        parts that differ between combinations are validated again (see
+        `build_rendercv_model_variants`). Each variant's overrides are applied
+        to the merged dictionary by copying only the overridden paths, so its
+        other subtrees are shared with the base CV and reused from the validated
+        subtree pool.
+
+    Args:
+        main_yaml_file: Primary CV YAML content string, or its already parsed
+            contents.
+        input_file_path: Path to the main YAML input file.
+        themes: Themes to render with, or None for the input's design.
+        locales: Locale languages to render with, or None for the input's locale.
+        variants: Dotted-path overrides of each variant (see
+            `parse_variants_file`), or None for the input itself.
+        kwargs: Optional YAML overlay strings, output paths, and generation flags.
+
+    Returns:
+        Validated CV models, ordered by variant, theme, then locale.
+    """
+    dictionary, overlay_sources = build_rendercv_dictionary(main_yaml_file, **kwargs)
+    start_photo_download_of_input(dictionary)
+
+    rendercv_models: list[RenderCVModel] = []
+    for variant_number, overrides in enumerate(variants or [None], start=1):
+        variant_dictionary = dictionary
+        if overrides is not None:
+            variant_dictionary = apply_overrides_to_dictionary(dictionary, overrides)
+        try:
+            variant_models = build_rendercv_model_variants(
+                variant_dictionary, themes, locales, input_file_path, overlay_sources
+            )
+        except RenderCVUserValidationError as e:
+            if overrides is None:
+                raise
+            raise RenderCVUserValidationError(
+                validation_errors=[
+                    dataclasses.replace(
+                        error, message=f"Variant {variant_number}: {error.message}"
+                    )
+                    for error in e.validation_errors
+                ]
+            ) from e
+
+        for variant_model in variant_models:
+            rendercv_model = variant_model
+            if overrides is not None and not output_file_paths_are_overridden(
+                overrides
+            ):
+                rendercv_model = add_suffix_to_output_file_names(
+                    rendercv_model, f"_{variant_number}"
+                )
+            if themes or locales:
+                rendercv_model = add_variant_to_output_file_names(rendercv_model)
+            rendercv_models.append(rendercv_model)
+
+    return rendercv_models
+
+
+def output_file_paths_are_overridden(overrides: dict[str, Any]) -> bool:
+    """Check whether a variant sets its own output folder or file paths.
+
+    Args:
+        overrides: Dotted-path overrides of a variant.
+
+    Returns:
+        True if any of the output folder or file paths are overridden.
+    """
+    return any(
+        key
+        in {
+            "settings.render_command.output_folder",
+            "settings.render_command.typst_path",
+            "settings.render_command.pdf_path",
+            "settings.render_command.markdown_path",
+            "settings.render_command.html_path",
+            "settings.render_command.png_path",
+        }
+        for key in overrides
+    )
+
+
+def add_suffix_to_output_file_names(
+    rendercv_model: RenderCVModel, suffix: str
+) -> RenderCVModel:
+    """Append a suffix to the model's output file names.
+
+    Why:
+        All models of a render matrix are rendered from the same settings, so
+        their output files would overwrite each other. The settings may be
+        shared with other models (see `validate_rendercv_model_incrementally`),
+        so copies are modified instead.
+
+    Example:
+        ```py
+        model = add_suffix_to_output_file_names(model, "_2")
+        # model.settings.render_command.pdf_path is now
+        # /cv/OUTPUT_FOLDER/NAME_IN_SNAKE_CASE_CV_2.pdf
+        ```
+
+    Args:
+        rendercv_model: Validated CV model.
+        suffix: Text to append to the output file names' stems.
+
+    Returns:
+        Copy of the model with the suffix in its output file names.
+    """
+    render_command = rendercv_model.settings.render_command
+    file_paths = {
+        field_name: file_path.with_name(f"{file_path.stem}{suffix}{file_path.suffix}")
+        for field_name in (
+            "typst_path",
+            "pdf_path",
+            "markdown_path",
+            "html_path",
+            "png_path",
+        )
+        if isinstance(file_path := getattr(render_command, field_name), pathlib.Path)
+    }
+    settings = rendercv_model.settings.model_copy(
+        update={"render_command": render_command.model_copy(update=file_paths)}
+    )
+    return rendercv_model.model_copy(update={"settings": settings})
+
+
+def add_variant_to_output_file_names(rendercv_model: RenderCVModel) -> RenderCVModel:
+    """Append the model's theme and locale language to its output file names.
+
+    Example:
+        ```py
+        # Given model with theme="sb2nov" and language="turkish"
+        model = add_variant_to_output_file_names(model)
+        # model.settings.render_command.pdf_path is now
+        # /cv/OUTPUT_FOLDER/NAME_IN_SNAKE_CASE_CV_sb2nov_turkish.pdf
+        ```
+
+    Args:
+        rendercv_model: Validated CV model.
+
+    Returns:
+        Copy of the model with the variant in its output file names.
+    """
+    return add_suffix_to_output_file_names(
+        rendercv_model,
+        f"_{rendercv_model.design.theme}_{rendercv_model.locale.language}",
+    )
+
+
+def compile_typst(
+    rendercv_model: RenderCVModel,
+    typst_path: pathlib.Path | None,
+    progress: ProgressReporter,
+) -> None:
+    """Compile a Typst file to PDF and PNG.
+
+    Args:
+        rendercv_model: CV model for path resolution and photo handling.
+        typst_path: Path to Typst source file to compile.
+        progress: Progress reporter for output display.
+    """
+    timed_step("Generated PDF", progress, generate_pdf, rendercv_model, typst_path)
+    timed_step("Generated PNG", progress, generate_png, rendercv_model, typst_path)
+
+
+def render_rendercv_models(
+    rendercv_models: list[RenderCVModel], progress: ProgressReporter
+) -> None:
+    """Generate all output files of several CV models.
+
+    Why:
+        Typst, Markdown, and HTML files are generated one after another, since
+        templating holds the GIL. Compiling PDFs and PNGs doesn't, so the Typst
+        files are compiled on a thread pool while the next ones are generated.
+        Models sharing an output folder copy their photo to the same path,
+        downscaled to their theme's photo width, so if these widths differ, the
+        CVs are compiled one at a time.
+
+    Args:
+        rendercv_models: Validated CV models with distinct output file names.
+        progress: Progress reporter for output display.
+    """
+    rendercv_models = [
+        download_photo_from_url(rendercv_model) for rendercv_model in rendercv_models
+    ]
+    photo_widths = {
+        getattr(getattr(rendercv_model.design, "header", None), "photo_width", None)
+        for rendercv_model in rendercv_models
+        if rendercv_model.cv.photo is not None
+    }
+    max_workers = 1 if len(photo_widths) > 1 else variant_compilation_pool_size
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        compilations: list[concurrent.futures.Future[None]] = []
+        for rendercv_model in rendercv_models:
+            typst_path = timed_step(
+                "Generated Typst", progress, generate_typst, rendercv_model
+            )
+            compilations.append(
+                executor.submit(compile_typst, rendercv_model, typst_path, progress)
+            )
+            timed_step(
+                "Generated Markdown", progress, generate_markdown, rendercv_model
+            )
+            timed_step("Generated HTML", progress, generate_html, rendercv_model)
+        for compilation in compilations:
+            compilation.result()
+    for rendercv_model in rendercv_models:
+        wait_for_photo_download(get_local_photo_path(rendercv_model))
+
+
 def run_rendercv(
     input_file_path: pathlib.Path,
-    progress: ProgressPanel,
+    progress: ProgressReporter,
+    *,
+    main_yaml_file: str | CommentedMap | None = None,
+    themes: list[str] | None = None,
+    locales: list[str] | None = None,
+    variants: list[dict[str, Any]] | None = None,
     **kwargs: Unpack[BuildRendercvModelArguments],
 ) -> None:
     """Execute complete CV generation pipeline with progress tracking and error handling.
 
     Args:
         input_file_path: Path to the main YAML input file.
-        progress: Progress panel for output display.
+        progress: Progress reporter for output display.
+        main_yaml_file: The main YAML input file as returned by
+            `read_main_yaml_file`. If not given, the file is read.
+        themes: If given, the CV is rendered once per theme (and locale), with the
+            theme and locale language appended to the output file names.
+        locales: If given, the CV is rendered once per locale language (and
+            theme), with the theme and locale language appended to the output
+            file names.
+        variants: If given, the CV is rendered once per variant (and theme and
+            locale), with each variant's dotted-path overrides applied and, unless
+            it sets its own output paths, its 1-based number appended to the
+            output file names.
         kwargs: Optional YAML overlay strings, output paths, and generation flags.
     """
     try:
-        main_yaml = input_file_path.read_text(encoding="utf-8")
+        main_yaml = (
+            input_file_path.read_text(encoding="utf-8")
+            if main_yaml_file is None
+            else main_yaml_file
+        )
 
-        _, rendercv_model = timed_step(
+        if themes or locales or variants:
+            rendercv_models = timed_step(
+                "Validated the input file",
+                progress,
+                build_rendercv_models,
+                main_yaml,
+                input_file_path,
+                themes,
+                locales,
+                variants,
+                **kwargs,
+            )
+            render_rendercv_models(rendercv_models, progress)
+            progress.finish_progress()
+            return
+
+        rendercv_model = timed_step(
             "Validated the input file",
             progress,
-            build_rendercv_dictionary_and_model,
+            build_rendercv_model,
             main_yaml,
-            input_file_path=input_file_path,
+            input_file_path,
             **kwargs,
         )
+        # Schedule the photo download once for all output files:
+        rendercv_model = download_photo_from_url(rendercv_model)
         typst_path = timed_step(
             "Generated Typst",
             progress,
@@ -167,7 +560,7 @@ def run_rendercv(
             rendercv_model,
             typst_path,
         )
-        md_path = timed_step(
+        timed_step(
             "Generated Markdown",
             progress,
             generate_markdown,
@@ -178,8 +571,10 @@ def run_rendercv(
             progress,
             generate_html,
             rendercv_model,
-            md_path,
         )
+        # Reports a photo URL that can't be downloaded even if no PDF or PNG
+        # needed the photo:
+        wait_for_photo_download(get_local_photo_path(rendercv_model))
         progress.finish_progress()
     except RenderCVUserError as e:
         progress.print_user_error(e)
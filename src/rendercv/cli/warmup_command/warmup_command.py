@@ -0,0 +1,73 @@
+import pathlib
+import time
+from collections.abc import Callable
+
+import rich.panel
+from rich import print
+
+from rendercv.cache import get_cache_dir
+from rendercv.renderer.pdf_png import get_font_index, get_font_paths, get_package_path
+from rendercv.renderer.templater.templater import compile_built_in_templates
+
+from ..app import app
+from ..error_handler import handle_user_errors
+
+
+def index_fonts() -> pathlib.Path:
+    """Scan the bundled and system fonts into the stored font index.
+
+    Why:
+        System fonts aren't part of the index's fingerprint, so the index is
+        rebuilt in case fonts were installed since it was stored.
+
+    Returns:
+        Directory of the stored font indexes.
+    """
+    get_font_index(get_font_paths(None), rebuild=True)
+    return get_cache_dir() / "font_indexes"
+
+
+def compile_templates() -> pathlib.Path:
+    """Compile the built-in templates into the bytecode cache.
+
+    Returns:
+        Directory of the bytecode cache.
+    """
+    compile_built_in_templates()
+    return get_cache_dir() / "jinja2"
+
+
+@app.command(
+    name="warmup",
+    help=(
+        "Fill RenderCV's caches so that the first render is as fast as later ones"
+        " (e.g., while building a container image). Example: [yellow]rendercv"
+        " warmup[/yellow]."
+    ),
+)
+@handle_user_errors
+def cli_command_warmup() -> None:
+    steps: list[tuple[str, Callable[[], pathlib.Path]]] = [
+        ("Installed the Typst packages", get_package_path),
+        ("Indexed the fonts", index_fonts),
+        ("Compiled the templates", compile_templates),
+    ]
+
+    lines: list[str] = []
+    for message, step in steps:
+        start = time.perf_counter()
+        path = step()
+        timing = f"{(time.perf_counter() - start) * 1000:.0f} ms"
+        lines.append(
+            f"[green]✓[/green] [bold green]{timing:<8}[/bold green] {message:<28}"
+            f" [purple]{path}[/purple]"
+        )
+
+    print(
+        rich.panel.Panel(
+            "\n".join(lines),
+            title="RenderCV's caches are ready",
+            title_align="left",
+            border_style="bright_black",
+        )
+    )
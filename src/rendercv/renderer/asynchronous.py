@@ -0,0 +1,189 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import os
+import pathlib
+from typing import TypedDict, Unpack
+
+from ruamel.yaml.comments import CommentedMap
+
+from rendercv.schema.models.rendercv_model import RenderCVModel
+from rendercv.schema.rendercv_model_builder import BuildRendercvModelArguments
+
+from .html import generate_html
+from .markdown import generate_markdown
+from .pdf_png import generate_pdf, generate_png
+from .photo import (
+    build_rendercv_model,
+    forget_photo_download,
+    get_photo_download,
+    wait_for_photo_download,
+)
+from .templater.model_processor import download_photo_from_url
+from .typst import generate_typst
+
+# At most this many CVs are validated or templated at the same time:
+async_rendering_pool_size = os.cpu_count() or 1
+# At most this many Typst files are compiled to PDF and PNG at the same time:
+async_compilation_pool_size = os.cpu_count() or 1
+
+
+class RenderedFiles(TypedDict):
+    typst: pathlib.Path | None
+    pdf: pathlib.Path | None
+    png: list[pathlib.Path] | None
+    markdown: pathlib.Path | None
+    html: pathlib.Path | None
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_rendering_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the worker pool input files are read, validated, and templated on.
+
+    Returns:
+        Thread pool with `async_rendering_pool_size` workers.
+    """
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=async_rendering_pool_size,
+        thread_name_prefix="rendercv-async-rendering",
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_compilation_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the worker pool Typst files are compiled on.
+
+    Why:
+        Each compilation holds a Typst compiler, and its memory, for as long as
+        it runs, and each thread keeps its own compiler (see
+        `get_typst_compiler`). A bounded pool limits concurrent compilations,
+        and the number of compilers kept, however many requests arrive. Queued
+        compilations are dropped when their render is cancelled.
+
+    Returns:
+        Thread pool with `async_compilation_pool_size` workers.
+    """
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=async_compilation_pool_size,
+        thread_name_prefix="rendercv-async-compilation",
+    )
+
+
+async def async_build_model(
+    main_yaml_file: pathlib.Path | str | CommentedMap,
+    input_file_path: pathlib.Path | None = None,
+    **kwargs: Unpack[BuildRendercvModelArguments],
+) -> RenderCVModel:
+    """Read and validate a CV without blocking the event loop.
+
+    Why:
+        Services built on asyncio can't afford to read files or validate on the
+        event loop. Both run on a managed worker pool, and a photo URL starts
+        downloading in the background right away.
+
+    Example:
+        ```py
+        rendercv_model = await async_build_model(
+            request_body, output_folder=output_folder
+        )
+        rendered_files = await async_render(rendercv_model)
+        ```
+
+    Args:
+        main_yaml_file: Path to the main YAML input file, its contents, or its
+            already parsed contents.
+        input_file_path: Path relative paths in the input are resolved against.
+            Defaults to `main_yaml_file` if it is a path.
+        kwargs: Optional YAML overlay strings, output paths, generation flags,
+            and overrides.
+
+    Returns:
+        Validated CV model.
+
+    Raises:
+        RenderCVUserValidationError: If the input is invalid.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_async_rendering_executor()
+    if isinstance(main_yaml_file, pathlib.Path):
+        input_file_path = input_file_path or main_yaml_file
+        main_yaml_file = await loop.run_in_executor(
+            executor, functools.partial(main_yaml_file.read_text, encoding="utf-8")
+        )
+
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(
+            build_rendercv_model, main_yaml_file, input_file_path, **kwargs
+        ),
+    )
+
+
+async def async_render(rendercv_model: RenderCVModel) -> RenderedFiles:
+    """Generate all output files of a CV without blocking the event loop.
+
+    Why:
+        Templating runs on the rendering pool and compilation on the bounded
+        compilation pool (see `get_async_compilation_executor`). A photo URL is
+        awaited on the event loop while the Markdown and HTML files are
+        generated, so no thread waits for the network. Cancelling the render
+        (e.g., when a client disconnects) stops it before its next step; a step
+        already running on a worker pool finishes in the background, and
+        downloads shared with other renders continue.
+
+    Args:
+        rendercv_model: Validated CV model.
+
+    Returns:
+        Paths of the generated files, None for the disabled ones.
+    """
+    loop = asyncio.get_running_loop()
+    rendering_executor = get_async_rendering_executor()
+    compilation_executor = get_async_compilation_executor()
+
+    rendercv_model = download_photo_from_url(rendercv_model)
+    photo_path = rendercv_model.cv.photo
+    photo_download = (
+        get_photo_download(photo_path) if isinstance(photo_path, pathlib.Path) else None
+    )
+
+    try:
+        markdown_path = await loop.run_in_executor(
+            rendering_executor, generate_markdown, rendercv_model
+        )
+        html_path = await loop.run_in_executor(
+            rendering_executor, generate_html, rendercv_model
+        )
+        if photo_download is not None:
+            # Shielded, so that cancelling this render doesn't cancel a download
+            # other renders may be waiting for. A failed download is raised
+            # below, once it is unregistered:
+            with contextlib.suppress(Exception):
+                await asyncio.shield(asyncio.wrap_future(photo_download))
+    except asyncio.CancelledError:
+        if photo_download is not None and isinstance(photo_path, pathlib.Path):
+            forget_photo_download(photo_path, photo_download)
+        raise
+    if isinstance(photo_path, pathlib.Path):
+        # Puts the photo in place, or raises the download's error:
+        await loop.run_in_executor(
+            rendering_executor, wait_for_photo_download, photo_path
+        )
+    typst_path = await loop.run_in_executor(
+        rendering_executor, generate_typst, rendercv_model
+    )
+    pdf_path = await loop.run_in_executor(
+        compilation_executor, generate_pdf, rendercv_model, typst_path
+    )
+    png_paths = await loop.run_in_executor(
+        compilation_executor, generate_png, rendercv_model, typst_path
+    )
+
+    return {
+        "typst": typst_path,
+        "pdf": pdf_path,
+        "png": png_paths,
+        "markdown": markdown_path,
+        "html": html_path,
+    }
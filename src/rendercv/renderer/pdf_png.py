@@ -1,17 +1,32 @@
 import atexit
+import collections
+import contextlib
 import functools
+import hashlib
+import json
+import os
 import pathlib
 import shutil
 import tempfile
+import threading
+import time
 import tomllib
 
 import rendercv_fonts
 import typst
 
+from rendercv.cache import get_cache_dir
 from rendercv.exception import RenderCVInternalError
 from rendercv.schema.models.rendercv_model import RenderCVModel
 
 from .path_resolver import resolve_rendercv_file_path
+from .photo import (
+    copy_file_if_changed,
+    get_local_photo_path,
+    get_photo_derivative,
+    get_temporary_path,
+    wait_for_photo_download,
+)
 
 
 def generate_pdf(
@@ -37,7 +52,11 @@ def generate_pdf(
         rendercv_model, rendercv_model.settings.render_command.pdf_path
     )
     typst_compiler = get_typst_compiler(
-        rendercv_model._input_file_path, typst_path.parent
+        rendercv_model._input_file_path,
+        typst_path.parent,
+        get_required_font_families(rendercv_model)
+        if rendercv_model.settings.render_command.narrow_fonts
+        else None,
     )
     copy_photo_next_to_typst_file(rendercv_model, typst_path)
     typst_compiler.compile(input=typst_path, format="pdf", output=pdf_path)
@@ -73,7 +92,11 @@ def generate_png(
             existing_png_file.unlink()
 
     typst_compiler = get_typst_compiler(
-        rendercv_model._input_file_path, typst_path.parent
+        rendercv_model._input_file_path,
+        typst_path.parent,
+        get_required_font_families(rendercv_model)
+        if rendercv_model.settings.render_command.narrow_fonts
+        else None,
     )
     copy_photo_next_to_typst_file(rendercv_model, typst_path)
     png_files_bytes = typst_compiler.compile(input=typst_path, format="png")
@@ -100,17 +123,25 @@ def copy_photo_next_to_typst_file(
     Why:
         Typst compiler resolves image paths relative to source file location.
         Copying photo ensures compilation succeeds regardless of original
-        photo location.
+        photo location. The copy is downscaled to the photo's printed width
+        when possible and skipped when the existing file has the same contents.
+        Photo URLs are resolved to where `download_photo_from_url` downloads
+        them, since the model isn't modified when the Typst file is generated.
 
     Args:
         rendercv_model: CV model containing photo path.
         typst_path: Path to Typst source file.
     """
-    photo_path = rendercv_model.cv.photo
-    if isinstance(photo_path, pathlib.Path):
+    photo_path = get_local_photo_path(rendercv_model)
+    if photo_path is not None:
+        wait_for_photo_download(photo_path)
         copy_to = typst_path.parent / photo_path.name
         if photo_path != copy_to:
-            shutil.copy(photo_path, copy_to)
+            header = getattr(rendercv_model.design, "header", None)
+            photo_width = getattr(header, "photo_width", None)
+            if photo_width is not None:
+                photo_path = get_photo_derivative(photo_path, photo_width)
+            copy_file_if_changed(photo_path, copy_to)
 
 
 def read_version_from_typst_toml(typst_toml_path: pathlib.Path) -> str:
@@ -140,7 +171,7 @@ def install_bundled_typst_package(
     temp_dir: pathlib.Path,
     typ_files: list[str],
 ) -> None:
-    """Copy a bundled Typst package into the temporary package cache.
+    """Copy a bundled Typst package into a package cache directory.
 
     Why:
         The Typst compiler expects packages in a directory structure of
@@ -150,7 +181,7 @@ def install_bundled_typst_package(
     Args:
         bundled_path: Path to the bundled package directory.
         package_name: Name of the Typst package (used in directory structure).
-        temp_dir: Root of the temporary package cache.
+        temp_dir: Root of the package cache being created.
         typ_files: List of .typ filenames to copy alongside typst.toml.
     """
     version = read_version_from_typst_toml(bundled_path / "typst.toml")
@@ -161,6 +192,66 @@ def install_bundled_typst_package(
         shutil.copy2(bundled_path / typ_file, package_directory / typ_file)
 
 
+renderer_directory = pathlib.Path(__file__).parent
+
+# Bundled Typst packages: (bundled path, package name, .typ files to install).
+bundled_typst_packages: list[tuple[pathlib.Path, str, list[str]]] = [
+    (renderer_directory / "rendercv_typst", "rendercv", ["lib.typ"]),
+    (
+        renderer_directory / "typst_fontawesome",
+        "fontawesome",
+        ["lib.typ", "lib-impl.typ", "lib-gen-func.typ", "lib-gen-map.typ"],
+    ),
+]
+
+# Installed package directories that haven't been used for this long are removed:
+stale_package_path_age_in_seconds = 30 * 24 * 60 * 60
+
+
+def compute_bundled_typst_packages_hash() -> str:
+    """Hash the contents of all bundled Typst package files.
+
+    Why:
+        The installed package directory is named after this hash, so a new
+        RenderCV version (or an edited development checkout) gets a fresh
+        directory while unchanged packages keep being reused.
+
+    Returns:
+        Short hexadecimal content hash.
+    """
+    digest = hashlib.sha256()
+    for bundled_path, package_name, typ_files in bundled_typst_packages:
+        digest.update(package_name.encode("utf-8"))
+        for file_name in ["typst.toml", *typ_files]:
+            digest.update(file_name.encode("utf-8"))
+            digest.update((bundled_path / file_name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def remove_stale_package_paths(
+    packages_directory: pathlib.Path, current_package_path: pathlib.Path
+) -> None:
+    """Delete installed package directories that are no longer in use.
+
+    Why:
+        Every RenderCV upgrade installs its packages into a new directory. Old
+        ones are kept for a while in case another installed RenderCV version
+        still uses them, and removed once they haven't been used for
+        `stale_package_path_age_in_seconds`.
+
+    Args:
+        packages_directory: Directory containing all installed package directories.
+        current_package_path: Package directory used by this process.
+    """
+    now = time.time()
+    for package_path in packages_directory.iterdir():
+        if package_path == current_package_path:
+            continue
+        with contextlib.suppress(OSError):
+            if now - package_path.stat().st_mtime > stale_package_path_age_in_seconds:
+                shutil.rmtree(package_path)
+
+
 @functools.lru_cache(maxsize=1)
 def get_package_path() -> pathlib.Path:
     """Set up local Typst package resolution from bundled Typst packages.
@@ -169,69 +260,330 @@ def get_package_path() -> pathlib.Path:
         Bundled Typst packages (rendercv, fontawesome) are shipped inside the
         Python package so that PDF compilation works without downloading from
         Typst Universe. The Typst compiler expects packages in a directory
-        structure of preview/{name}/{version}/, so this creates a temporary
-        directory with that layout.
+        structure of preview/{name}/{version}/. That layout is installed once
+        into a content-hashed directory under the RenderCV cache directory and
+        reused by later runs. Concurrent processes install into private
+        temporary directories and atomically rename them into place, so a
+        half-written installation is never visible.
 
     Returns:
-        Path to temporary package cache directory.
+        Path to package cache directory.
     """
-    temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="rendercv-pkg-"))
-    atexit.register(shutil.rmtree, str(temp_dir), True)
+    packages_directory = get_cache_dir() / "typst_packages"
+    package_path = packages_directory / compute_bundled_typst_packages_hash()
 
-    renderer_dir = pathlib.Path(__file__).parent
+    try:
+        if package_path.is_dir():
+            # Mark as used so it isn't considered stale:
+            os.utime(package_path)
+        else:
+            packages_directory.mkdir(parents=True, exist_ok=True)
+            temp_dir = pathlib.Path(
+                tempfile.mkdtemp(prefix=".tmp-", dir=packages_directory)
+            )
+            try:
+                install_bundled_typst_packages(temp_dir)
+                temp_dir.rename(package_path)
+            except OSError:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                # Renaming fails if another process installed it first:
+                if not package_path.is_dir():
+                    raise
+        remove_stale_package_paths(packages_directory, package_path)
+    except OSError:
+        # The cache directory isn't writable; use a per-process directory instead:
+        temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="rendercv-pkg-"))
+        atexit.register(shutil.rmtree, str(temp_dir), True)
+        install_bundled_typst_packages(temp_dir)
+        return temp_dir
+
+    return package_path
+
+
+def install_bundled_typst_packages(temp_dir: pathlib.Path) -> None:
+    """Copy all bundled Typst packages into a package cache directory.
 
-    install_bundled_typst_package(
-        bundled_path=renderer_dir / "rendercv_typst",
-        package_name="rendercv",
-        temp_dir=temp_dir,
-        typ_files=["lib.typ"],
-    )
+    Args:
+        temp_dir: Root of the package cache being created.
+    """
+    for bundled_path, package_name, typ_files in bundled_typst_packages:
+        install_bundled_typst_package(
+            bundled_path=bundled_path,
+            package_name=package_name,
+            temp_dir=temp_dir,
+            typ_files=typ_files,
+        )
+
+
+typst_compiler_pool_size = 8
+# Each entry holds the compilers of one font set and root, one per thread:
+typst_compiler_pool: collections.OrderedDict[
+    tuple[tuple[pathlib.Path, ...], bool, pathlib.Path], threading.local
+] = collections.OrderedDict()
+typst_compiler_pool_lock = threading.Lock()
 
-    install_bundled_typst_package(
-        bundled_path=renderer_dir / "typst_fontawesome",
-        package_name="fontawesome",
-        temp_dir=temp_dir,
-        typ_files=[
-            "lib.typ",
-            "lib-impl.typ",
-            "lib-gen-func.typ",
-            "lib-gen-map.typ",
-        ],
+# Families the bundled fontawesome package draws its icons from:
+icon_font_families = frozenset(
+    {"Font Awesome 7 Free", "Font Awesome 7 Free Solid", "Font Awesome 7 Brands"}
+)
+
+
+def get_font_paths(input_file_path: pathlib.Path | None) -> tuple[pathlib.Path, ...]:
+    """Collect the font folders a compilation actually draws fonts from.
+
+    Why:
+        The user's `fonts` folder next to the input file only contributes fonts if
+        it exists. Leaving out missing folders lets every CV without custom fonts
+        share one font set, no matter which directory it is rendered from.
+
+    Args:
+        input_file_path: Original input file path for relative font resolution.
+
+    Returns:
+        Bundled font folders, followed by the user's font folder if it exists.
+    """
+    user_fonts_folder = (
+        input_file_path.parent / "fonts"
+        if input_file_path
+        else pathlib.Path.cwd() / "fonts"
     )
+    font_paths = [pathlib.Path(path) for path in rendercv_fonts.paths_to_font_folders]
+    if user_fonts_folder.is_dir():
+        font_paths.append(user_fonts_folder)
+    return tuple(font_paths)
+
+
+def get_required_font_families(rendercv_model: RenderCVModel) -> frozenset[str]:
+    """Collect the font families a CV's Typst source refers to.
 
-    return temp_dir
+    Args:
+        rendercv_model: CV model whose typography is used.
+
+    Returns:
+        Families from `design.typography.font_family` and the icon font families.
+    """
+    font_family = rendercv_model.design.typography.font_family
+    return frozenset(font_family.model_dump().values()) | icon_font_families
 
 
 @functools.lru_cache(maxsize=1)
+def get_embedded_font_families() -> frozenset[str]:
+    """Get the families of the fonts embedded in the Typst compiler.
+
+    Returns:
+        Embedded font families (e.g., New Computer Modern).
+    """
+    return frozenset(
+        typst.Fonts(
+            include_system_fonts=False, include_embedded_fonts=True, font_paths=[]
+        ).families()
+    )
+
+
+def compute_font_paths_fingerprint(font_paths: tuple[pathlib.Path, ...]) -> str:
+    """Fingerprint font folders by their paths and modification times.
+
+    Why:
+        Adding or removing a font file changes its folder's modification time, so
+        a font index stored under this fingerprint is never used for a different
+        set of font files.
+
+    Args:
+        font_paths: Font folders.
+
+    Returns:
+        Short hexadecimal fingerprint.
+    """
+    digest = hashlib.sha256()
+    for font_path in font_paths:
+        digest.update(str(font_path).encode("utf-8"))
+        digest.update(str(font_path.stat().st_mtime_ns).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def build_font_index(
+    font_paths: tuple[pathlib.Path, ...],
+) -> dict[str, list[pathlib.Path]]:
+    """Scan font folders and system fonts and map each family to its folders.
+
+    Args:
+        font_paths: Font folders to scan in addition to the system fonts.
+
+    Returns:
+        Font family names mapped to the folders containing their files.
+    """
+    fonts = typst.Fonts(
+        include_system_fonts=True,
+        include_embedded_fonts=False,
+        font_paths=list(font_paths),
+    )
+    font_index: dict[str, set[pathlib.Path]] = {}
+    for font in fonts.fonts():
+        if font.path is not None:
+            font_index.setdefault(font.family, set()).add(
+                pathlib.Path(font.path).parent
+            )
+    return {family: sorted(folders) for family, folders in font_index.items()}
+
+
+def get_font_index(
+    font_paths: tuple[pathlib.Path, ...], *, rebuild: bool = False
+) -> dict[str, list[pathlib.Path]]:
+    """Get the family-to-folders index of font folders and system fonts.
+
+    Why:
+        Building the index scans every available font. It is stored in the
+        RenderCV cache directory, so later runs with the same font folders read
+        it instead of scanning again. System fonts aren't fingerprinted; callers
+        rebuild the index when it doesn't know a family they need.
+
+    Args:
+        font_paths: Font folders to index in addition to the system fonts.
+        rebuild: Scan the fonts again even if a stored index exists.
+
+    Returns:
+        Font family names mapped to the folders containing their files.
+    """
+    font_index_path = (
+        get_cache_dir()
+        / "font_indexes"
+        / f"{compute_font_paths_fingerprint(font_paths)}.json"
+    )
+    if not rebuild:
+        with contextlib.suppress(OSError, ValueError):
+            stored_font_index = json.loads(font_index_path.read_text(encoding="utf-8"))
+            return {
+                family: [pathlib.Path(folder) for folder in folders]
+                for family, folders in stored_font_index.items()
+            }
+
+    font_index = build_font_index(font_paths)
+    with contextlib.suppress(OSError):
+        font_index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = get_temporary_path(font_index_path)
+        temp_path.write_text(
+            json.dumps(
+                {
+                    family: [str(folder) for folder in folders]
+                    for family, folders in font_index.items()
+                }
+            ),
+            encoding="utf-8",
+        )
+        temp_path.replace(font_index_path)
+    return font_index
+
+
+def get_narrowed_font_paths(
+    font_paths: tuple[pathlib.Path, ...], font_families: frozenset[str]
+) -> tuple[pathlib.Path, ...] | None:
+    """Find the font folders that contain the given font families.
+
+    Why:
+        Typst loads fonts per folder. Handing the compiler only the folders of the
+        families a CV uses skips scanning all other bundled and system fonts.
+
+    Args:
+        font_paths: Font folders the families may come from, besides system fonts.
+        font_families: Font families to find.
+
+    Returns:
+        Folders containing the families, or None if some family can't be found.
+    """
+    font_families = font_families - get_embedded_font_families()
+    font_index = get_font_index(font_paths)
+    if not all(
+        family in font_index and all(folder.is_dir() for folder in font_index[family])
+        for family in font_families
+    ):
+        # Fonts may have been installed or removed since the index was built:
+        font_index = get_font_index(font_paths, rebuild=True)
+        if not font_families <= font_index.keys():
+            return None
+
+    return tuple(
+        sorted({folder for family in font_families for folder in font_index[family]})
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def get_typst_fonts(
+    font_paths: tuple[pathlib.Path, ...], include_system_fonts: bool = True
+) -> typst.Fonts:
+    """Scan font folders once and share the result across compilers.
+
+    Why:
+        Scanning and indexing every bundled font is the most expensive part of
+        creating a compiler. Compilers with the same font folders (e.g., for
+        different project roots) reuse one scanned font set.
+
+    Args:
+        font_paths: Font folders to scan.
+        include_system_fonts: Whether to scan the system fonts too.
+
+    Returns:
+        Scanned fonts, including Typst's embedded fonts.
+    """
+    return typst.Fonts(
+        include_system_fonts=include_system_fonts,
+        include_embedded_fonts=True,
+        font_paths=list(font_paths),
+    )
+
+
 def get_typst_compiler(
     input_file_path: pathlib.Path | None,
     root: pathlib.Path,
+    font_families: frozenset[str] | None = None,
 ) -> typst.Compiler:
-    """Create cached Typst compiler with font paths configured.
+    """Get pooled Typst compiler for the effective font set and project root.
 
     Why:
-        Compiler initialization is expensive. Caching enables reuse across
-        all compilations. The source file is passed per compile() call, so
-        the compiler survives output filename changes (e.g., when cv.name
-        changes). Font paths include package fonts and optional user fonts
-        from input file directory.
+        Compiler initialization is expensive. Compilers are pooled per font set and
+        root, so rendering CVs from several folders in one process doesn't rebuild
+        them, and the least recently used one is evicted once the pool holds
+        `typst_compiler_pool_size` compilers. The source file is passed per
+        compile() call, so a compiler survives output filename changes (e.g., when
+        cv.name changes). A compiler can't compile two documents at once, so each
+        thread gets its own, kept in a thread-local of the pool entry; the scanned
+        fonts are still shared between them. The pool size therefore counts font
+        set and root combinations, however many threads compile.
 
     Args:
         input_file_path: Original input file path for relative font resolution.
         root: Root directory for Typst project. Must contain the input file.
+        font_families: If given, only fonts of these families (and Typst's
+            embedded fonts) are loaded. If some family can't be found, all fonts
+            are loaded.
 
     Returns:
         Configured Typst compiler instance.
     """
-    return typst.Compiler(
-        root=root,
-        font_paths=[
-            *rendercv_fonts.paths_to_font_folders,
-            (
-                input_file_path.parent / "fonts"
-                if input_file_path
-                else pathlib.Path.cwd() / "fonts"
-            ),
-        ],
-        package_path=get_package_path(),
-    )
+    font_paths = get_font_paths(input_file_path)
+    include_system_fonts = True
+    if font_families is not None:
+        narrowed_font_paths = get_narrowed_font_paths(font_paths, font_families)
+        if narrowed_font_paths is not None:
+            font_paths = narrowed_font_paths
+            include_system_fonts = False
+    key = (font_paths, include_system_fonts, root)
+
+    with typst_compiler_pool_lock:
+        thread_compilers = typst_compiler_pool.get(key)
+        if thread_compilers is None:
+            thread_compilers = threading.local()
+            typst_compiler_pool[key] = thread_compilers
+        typst_compiler_pool.move_to_end(key)
+        while len(typst_compiler_pool) > typst_compiler_pool_size:
+            typst_compiler_pool.popitem(last=False)
+
+    compiler: typst.Compiler | None = getattr(thread_compilers, "compiler", None)
+    if compiler is None:
+        compiler = typst.Compiler(
+            root=root,
+            font_paths=get_typst_fonts(font_paths, include_system_fonts),
+            package_path=get_package_path(),
+        )
+        thread_compilers.compiler = compiler
+
+    return compiler
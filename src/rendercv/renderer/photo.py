@@ -0,0 +1,553 @@
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import pathlib
+import re
+import shutil
+import tempfile
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Any, Unpack
+
+import pydantic
+from ruamel.yaml.comments import CommentedMap
+
+from rendercv.cache import get_cache_dir
+from rendercv.exception import RenderCVUserError
+from rendercv.schema.models.rendercv_model import RenderCVModel
+from rendercv.schema.rendercv_model_builder import (
+    BuildRendercvModelArguments,
+    build_rendercv_dictionary,
+    build_rendercv_model_from_commented_map,
+)
+
+# Photos are downscaled to this resolution at their printed size:
+photo_derivative_dpi = 300
+
+inches_per_unit = {"in": 1.0, "cm": 1 / 2.54, "mm": 1 / 25.4, "pt": 1 / 72}
+
+# At most this many photos are downloaded at the same time:
+photo_download_pool_size = 4
+photo_download_timeout_in_seconds = 30
+
+# Downloads started ahead of time, by URL, until a render claims them:
+photo_downloads: dict[str, concurrent.futures.Future[pathlib.Path]] = {}
+# Claimed downloads, by the local path the photo must end up at:
+pending_photo_paths: dict[pathlib.Path, concurrent.futures.Future[pathlib.Path]] = {}
+photo_downloads_lock = threading.Lock()
+
+
+def get_file_hash(file_path: pathlib.Path) -> str:
+    """Hash a file's contents.
+
+    Why:
+        Photos are compared and cached by content. The hash is memoized per
+        file size and modification time, so an unchanged multi-megabyte photo
+        isn't read again on every render.
+
+    Args:
+        file_path: File to hash.
+
+    Returns:
+        Hexadecimal SHA-256 digest of the file's contents.
+    """
+    stat = file_path.stat()
+    return compute_file_hash(file_path, stat.st_size, stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def compute_file_hash(
+    file_path: pathlib.Path,
+    size: int,  # noqa: ARG001
+    mtime_ns: int,  # noqa: ARG001
+) -> str:
+    """Hash a file's contents, memoized per file size and modification time.
+
+    Args:
+        file_path: File to hash.
+        size: File size in bytes, part of the memoization key.
+        mtime_ns: File modification time, part of the memoization key.
+
+    Returns:
+        Hexadecimal SHA-256 digest of the file's contents.
+    """
+    with file_path.open("rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def convert_typst_dimension_to_pixels(dimension: str, dpi: int) -> int | None:
+    """Convert an absolute Typst dimension to pixels at the given resolution.
+
+    Args:
+        dimension: Typst dimension (e.g., 3.5cm).
+        dpi: Pixels per inch.
+
+    Returns:
+        Number of pixels, or None for relative dimensions (e.g., 2em).
+    """
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)(cm|in|pt|mm)", dimension)
+    if match is None:
+        return None
+    return round(float(match.group(1)) * inches_per_unit[match.group(2)] * dpi)
+
+
+def get_photo_derivative(photo_path: pathlib.Path, photo_width: str) -> pathlib.Path:
+    """Get a copy of the photo downscaled to the size it is printed at.
+
+    Why:
+        Photos straight from a camera are often several megabytes, while the
+        header prints them a few centimeters wide. Typst embeds and decodes
+        images as they are, so a smaller derivative makes compilation faster
+        and the PDF smaller. Derivatives are stored in the RenderCV cache
+        directory under the photo's content hash and target size.
+
+    Args:
+        photo_path: Original photo.
+        photo_width: Width of the photo in the header, as a Typst dimension.
+
+    Returns:
+        Path to the derivative, or the original photo if it is already small
+        enough or can't be read as an image.
+    """
+    width_in_pixels = convert_typst_dimension_to_pixels(
+        photo_width, photo_derivative_dpi
+    )
+    if width_in_pixels is None or width_in_pixels <= 0:
+        return photo_path
+
+    try:
+        derivative_path = (
+            get_cache_dir()
+            / "photos"
+            / f"{get_file_hash(photo_path)}-{width_in_pixels}{photo_path.suffix}"
+        )
+        if derivative_path.is_file():
+            return derivative_path
+        if create_photo_derivative(photo_path, derivative_path, width_in_pixels):
+            return derivative_path
+    except (OSError, ValueError):
+        pass
+
+    return photo_path
+
+
+def create_photo_derivative(
+    photo_path: pathlib.Path, derivative_path: pathlib.Path, width_in_pixels: int
+) -> bool:
+    """Downscale and recompress a photo with Pillow.
+
+    Why:
+        Pillow is imported here rather than at the top of the module, since
+        photos are only downscaled for PDF and PNG compilation, and importing
+        it would slow down every other command.
+
+    Args:
+        photo_path: Original photo.
+        derivative_path: Where to write the downscaled photo.
+        width_in_pixels: Maximum width of the downscaled photo.
+
+    Returns:
+        True if the derivative was written, False if the photo is already small
+        enough.
+    """
+    from PIL import Image, ImageOps  # noqa: PLC0415
+
+    with Image.open(photo_path) as image:
+        image_format = image.format
+        # Apply the EXIF orientation, since the derivative doesn't keep EXIF data:
+        derivative = ImageOps.exif_transpose(image)
+    if derivative.width <= width_in_pixels:
+        return False
+    derivative.thumbnail((width_in_pixels, derivative.height), Image.Resampling.LANCZOS)
+
+    derivative_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = get_temporary_path(derivative_path)
+    try:
+        if image_format == "JPEG":
+            derivative.save(temp_path, image_format, quality=90, optimize=True)
+        else:
+            derivative.save(temp_path, image_format, optimize=True)
+        temp_path.replace(derivative_path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            temp_path.unlink()
+
+    return True
+
+
+def get_temporary_path(file_path: pathlib.Path) -> pathlib.Path:
+    """Get a hidden sibling path to write a file through before moving it in place.
+
+    Why:
+        Several threads or processes may write the same file at once (e.g., a
+        photo shared by CVs rendered in parallel). Each thread gets its own
+        temporary file, so they never write into each other's, and the last move
+        wins with complete contents.
+
+    Args:
+        file_path: File to be written.
+
+    Returns:
+        Temporary path next to the file, unique to the calling thread.
+    """
+    return file_path.with_name(
+        f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+
+
+def copy_file_if_changed(source: pathlib.Path, destination: pathlib.Path) -> None:
+    """Copy a file unless the destination already has the same contents.
+
+    Why:
+        The photo is copied next to the Typst file before every PDF and PNG
+        compilation. Skipping identical copies avoids rewriting the file, which
+        also keeps its modification time stable for the Typst compiler's file
+        cache.
+
+    Args:
+        source: File to copy.
+        destination: Target path.
+    """
+    if (
+        destination.is_file()
+        and destination.stat().st_size == source.stat().st_size
+        and get_file_hash(destination) == get_file_hash(source)
+    ):
+        return
+
+    temp_path = get_temporary_path(destination)
+    try:
+        shutil.copyfile(source, temp_path)
+        temp_path.replace(destination)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            temp_path.unlink()
+
+
+def write_file_atomically(file_path: pathlib.Path, content: bytes) -> None:
+    """Write a file through a temporary sibling, so readers never see a partial file.
+
+    Args:
+        file_path: File to write.
+        content: Bytes to write.
+    """
+    temp_path = get_temporary_path(file_path)
+    try:
+        temp_path.write_bytes(content)
+        temp_path.replace(file_path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            temp_path.unlink()
+
+
+def get_photo_download_directory() -> pathlib.Path:
+    """Get the directory downloaded photos are cached in.
+
+    Returns:
+        Photo download cache directory. Falls back to the temporary directory if
+        the RenderCV cache directory isn't writable.
+    """
+    download_directory = get_cache_dir() / "photo_downloads"
+    try:
+        download_directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        download_directory = (
+            pathlib.Path(tempfile.gettempdir()) / "rendercv_photo_downloads"
+        )
+        download_directory.mkdir(parents=True, exist_ok=True)
+    return download_directory
+
+
+def download_photo_to_cache(url: str) -> pathlib.Path:
+    """Download a photo into the content-addressed photo cache.
+
+    Why:
+        Photos are stored under their content hash, and each URL's ETag and
+        Last-Modified headers are kept next to them. Later runs send a
+        conditional request, so an unchanged remote photo isn't downloaded
+        again while a changed one is picked up. If the server can't be reached,
+        the cached photo is used.
+
+    Args:
+        url: Photo URL.
+
+    Returns:
+        Path to the cached photo.
+    """
+    download_directory = get_photo_download_directory()
+    url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+    metadata_path = download_directory / "urls" / f"{url_hash}.json"
+
+    metadata: dict[str, str] = {}
+    with contextlib.suppress(OSError, ValueError):
+        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    cached_path: pathlib.Path | None = None
+    if "file_name" in metadata:
+        cached_path = download_directory / "objects" / metadata["file_name"]
+        if not cached_path.is_file():
+            cached_path = None
+
+    request = urllib.request.Request(url)
+    if cached_path is not None:
+        if "etag" in metadata:
+            request.add_header("If-None-Match", metadata["etag"])
+        if "last_modified" in metadata:
+            request.add_header("If-Modified-Since", metadata["last_modified"])
+
+    try:
+        with urllib.request.urlopen(
+            request, timeout=photo_download_timeout_in_seconds
+        ) as response:
+            content = response.read()
+            headers = response.headers
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached_path is not None:
+            return cached_path
+        raise RenderCVUserError(
+            message=f"Failed to download photo from {url}: {e}"
+        ) from e
+    except (urllib.error.URLError, OSError) as e:
+        if cached_path is not None:
+            return cached_path
+        raise RenderCVUserError(
+            message=f"Failed to download photo from {url}: {e}"
+        ) from e
+
+    suffix = pathlib.PurePosixPath(urllib.parse.urlparse(url).path).suffix or ".jpg"
+    file_name = f"{hashlib.sha256(content).hexdigest()}{suffix}"
+    object_path = download_directory / "objects" / file_name
+    object_path.parent.mkdir(exist_ok=True)
+    if not object_path.is_file():
+        write_file_atomically(object_path, content)
+
+    metadata = {"file_name": file_name}
+    if headers.get("ETag"):
+        metadata["etag"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        metadata["last_modified"] = headers["Last-Modified"]
+    metadata_path.parent.mkdir(exist_ok=True)
+    write_file_atomically(metadata_path, json.dumps(metadata).encode("utf-8"))
+
+    return object_path
+
+
+@functools.lru_cache(maxsize=1)
+def get_photo_download_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the worker pool photos are downloaded on.
+
+    Returns:
+        Thread pool with `photo_download_pool_size` workers.
+    """
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=photo_download_pool_size,
+        thread_name_prefix="rendercv-photo-download",
+    )
+
+
+def start_photo_download(url: str) -> concurrent.futures.Future[pathlib.Path] | None:
+    """Start downloading a photo in the background, unless it is already started.
+
+    Why:
+        The photo URL is known as soon as the YAML is read, but the photo is only
+        needed once the Typst file is written. Starting the download early lets
+        it run while the input is validated and the Typst source is generated.
+
+    Args:
+        url: Photo URL as written in the input. Local paths are ignored.
+
+    Returns:
+        The download, or None if `url` isn't a URL.
+    """
+    try:
+        url = str(pydantic.HttpUrl(url))
+    except pydantic.ValidationError:
+        return None
+
+    with photo_downloads_lock:
+        # Drop finished downloads no render claimed (e.g., because the input
+        # turned out to be invalid); the photo stays in the cache directory:
+        for started_url, started_future in list(photo_downloads.items()):
+            if started_future.done() and started_url != url:
+                del photo_downloads[started_url]
+        future = photo_downloads.get(url)
+        if future is None:
+            future = get_photo_download_executor().submit(download_photo_to_cache, url)
+            photo_downloads[url] = future
+        return future
+
+
+def start_photo_download_of_input(dictionary: dict[str, Any]) -> None:
+    """Start downloading the photo of a merged input dictionary, if it is a URL.
+
+    Args:
+        dictionary: Merged input dictionary, before validation.
+    """
+    cv = dictionary.get("cv")
+    if isinstance(cv, dict) and isinstance(cv.get("photo"), str):
+        start_photo_download(cv["photo"])
+
+
+def build_rendercv_model(
+    main_yaml_file: str | CommentedMap,
+    input_file_path: pathlib.Path | None,
+    **kwargs: Unpack[BuildRendercvModelArguments],
+) -> RenderCVModel:
+    """Validate the input, downloading a photo URL in the meantime.
+
+    Why:
+        The photo URL is known once the YAML is read, so its download starts
+        before the comparatively slow validation and runs in the background
+        until the Typst file is written. Both the CLI and `async_build_model`
+        build their models this way.
+
+    Args:
+        main_yaml_file: Primary CV YAML content string, or its already parsed
+            contents.
+        input_file_path: Path to the main YAML input file, if any.
+        kwargs: Optional YAML overlay strings, output paths, generation flags,
+            and overrides.
+
+    Returns:
+        Validated CV model.
+    """
+    dictionary, overlay_sources = build_rendercv_dictionary(main_yaml_file, **kwargs)
+    start_photo_download_of_input(dictionary)
+    return build_rendercv_model_from_commented_map(
+        dictionary, input_file_path, overlay_sources
+    )
+
+
+def get_photo_download_path(url: str, output_folder: pathlib.Path) -> pathlib.Path:
+    """Get the local path a photo URL is downloaded to.
+
+    Args:
+        url: Photo URL.
+        output_folder: Folder the output files are written to.
+
+    Returns:
+        Path in the output folder, named after the URL's file name, or
+        `photo.jpg` if the URL doesn't end with one.
+    """
+    file_name = pathlib.PurePosixPath(urllib.parse.urlparse(url).path).name
+    if not file_name or "." not in file_name:
+        file_name = "photo.jpg"
+    return output_folder / file_name
+
+
+def schedule_photo_download(url: str, photo_path: pathlib.Path) -> None:
+    """Arrange for a photo URL to be downloaded to a local path.
+
+    Why:
+        Templates only need the photo's file name, so rendering continues while
+        the photo is downloaded. `wait_for_photo_download` puts the photo in
+        place when its contents are needed. CVs rendered at the same time may
+        schedule the same path; they share a download that is still running.
+
+    Args:
+        url: Photo URL.
+        photo_path: Local path the photo must end up at.
+    """
+    with photo_downloads_lock:
+        future = pending_photo_paths.get(photo_path)
+        if future is not None and not future.done():
+            return
+
+    start_photo_download(url)
+    with photo_downloads_lock:
+        future = photo_downloads.pop(url, None)
+        if future is None:
+            future = get_photo_download_executor().submit(download_photo_to_cache, url)
+        pending_photo_paths[photo_path] = future
+
+
+def get_photo_download(
+    photo_path: pathlib.Path | None,
+) -> concurrent.futures.Future[pathlib.Path] | None:
+    """Get the download scheduled for a local photo path.
+
+    Why:
+        Asynchronous callers await the download itself, rather than blocking a
+        thread in `wait_for_photo_download` while it runs.
+
+    Args:
+        photo_path: Local photo path.
+
+    Returns:
+        The download, or None if none is scheduled for the path.
+    """
+    if photo_path is None:
+        return None
+    with photo_downloads_lock:
+        return pending_photo_paths.get(photo_path)
+
+
+def wait_for_photo_download(photo_path: pathlib.Path | None) -> None:
+    """Wait for a scheduled photo download and place the photo at its local path.
+
+    Why:
+        The download is unregistered once the photo is in place (or the download
+        failed), so long-running processes such as the language server don't
+        keep every download they ever scheduled. CVs waiting for the same path
+        afterwards (e.g., variants compiled on several threads) find the photo
+        already in place.
+
+    Args:
+        photo_path: Local photo path. Nothing happens if no download is scheduled
+            for it.
+
+    Raises:
+        RenderCVUserError: If the photo couldn't be downloaded.
+    """
+    with photo_downloads_lock:
+        future = pending_photo_paths.get(photo_path) if photo_path else None
+    if future is None or photo_path is None:
+        return
+
+    try:
+        cached_path = future.result()
+        photo_path.parent.mkdir(parents=True, exist_ok=True)
+        copy_file_if_changed(cached_path, photo_path)
+    finally:
+        forget_photo_download(photo_path, future)
+
+
+def forget_photo_download(
+    photo_path: pathlib.Path, future: concurrent.futures.Future[pathlib.Path]
+) -> None:
+    """Unregister a download scheduled for a local photo path.
+
+    Args:
+        photo_path: Local photo path.
+        future: The download. Nothing happens if another download has been
+            scheduled for the path since.
+    """
+    with photo_downloads_lock:
+        if pending_photo_paths.get(photo_path) is future:
+            del pending_photo_paths[photo_path]
+
+
+def get_local_photo_path(rendercv_model: RenderCVModel) -> pathlib.Path | None:
+    """Get the local path of the CV's photo, following photo URLs to their download.
+
+    Why:
+        Output generators may be given the model before `download_photo_from_url`
+        pointed it to the downloaded file, so photo URLs are resolved to the same
+        path here.
+
+    Args:
+        rendercv_model: CV model.
+
+    Returns:
+        Local photo path, or None if the CV has no photo.
+    """
+    photo = rendercv_model.cv.photo
+    if photo is None or isinstance(photo, pathlib.Path):
+        return photo
+    return get_photo_download_path(
+        str(photo), rendercv_model.settings.render_command.output_folder
+    )
@@ -1,12 +1,13 @@
+import functools
+import html
 from dataclasses import dataclass
 from typing import Literal
 
-import phonenumbers
-
 from rendercv.exception import RenderCVInternalError
+from rendercv.schema.models.design.classic_theme import PhoneNumberFormatType
 from rendercv.schema.models.rendercv_model import RenderCVModel
 
-from .markdown_parser import markdown_to_typst
+from .markdown_parser import markdown_to_inline_html, markdown_to_typst
 from .string_processor import clean_url
 
 fontawesome_icons = {
@@ -35,7 +36,7 @@ fontawesome_icons = {
 
 
 def compute_connections(
-    rendercv_model: RenderCVModel, file_type: Literal["typst", "markdown"]
+    rendercv_model: RenderCVModel, file_type: Literal["typst", "markdown", "html"]
 ) -> list[str]:
     """Route to format-specific connection generator.
 
@@ -49,6 +50,7 @@ def compute_connections(
     return {
         "typst": compute_connections_for_typst,
         "markdown": compute_connections_for_markdown,
+        "html": compute_connections_for_html,
     }[file_type](rendercv_model)
 
 
@@ -99,12 +101,9 @@ def parse_connections(rendercv_model: RenderCVModel) -> list[Connection]:
 
                 for phone in phones:
                     url = str(phone)
-                    body = phonenumbers.format_number(
-                        phonenumbers.parse(phone, None),
-                        getattr(
-                            phonenumbers.PhoneNumberFormat,
-                            rendercv_model.design.header.connections.phone_number_format.upper(),
-                        ),
+                    body = format_phone_number(
+                        phone,
+                        rendercv_model.design.header.connections.phone_number_format,
                     )
                     connections.append(
                         Connection(
@@ -183,6 +182,31 @@ def parse_connections(rendercv_model: RenderCVModel) -> list[Connection]:
     return connections
 
 
+@functools.lru_cache(maxsize=64)
+def format_phone_number(phone: str, phone_number_format: PhoneNumberFormatType) -> str:
+    """Format a phone number for display, memoized per number and format.
+
+    Why:
+        Connections are computed for both the Typst and the Markdown output, and
+        parsing a phone number is comparatively expensive. The `phonenumbers`
+        library is imported here, on first use, since it loads large metadata
+        tables and most CVs have no phone number.
+
+    Args:
+        phone: Validated phone number.
+        phone_number_format: Display format.
+
+    Returns:
+        Formatted phone number.
+    """
+    import phonenumbers  # noqa: PLC0415
+
+    return phonenumbers.format_number(
+        phonenumbers.parse(phone, None),
+        getattr(phonenumbers.PhoneNumberFormat, phone_number_format.upper()),
+    )
+
+
 def compute_connections_for_typst(rendercv_model: RenderCVModel) -> list[str]:
     """Format connections with Typst markup, Font Awesome icons, and conditional hyperlinks.
 
@@ -242,3 +266,25 @@ def compute_connections_for_markdown(rendercv_model: RenderCVModel) -> list[str]
         )
         for connection in connections
     ]
+
+
+def compute_connections_for_html(rendercv_model: RenderCVModel) -> list[str]:
+    """Format connections as HTML links without icons.
+
+    Args:
+        rendercv_model: CV model with contact information.
+
+    Returns:
+        List of HTML-formatted connection strings.
+    """
+    connections = parse_connections(rendercv_model)
+
+    return [
+        (
+            f'<a href="{html.escape(connection.url)}">'
+            f"{markdown_to_inline_html(connection.body)}</a>"
+            if connection.url
+            else markdown_to_inline_html(connection.body)
+        )
+        for connection in connections
+    ]
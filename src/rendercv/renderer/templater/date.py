@@ -1,3 +1,5 @@
+import functools
+from collections.abc import Sequence
 from datetime import date as Date
 
 from rendercv.exception import RenderCVInternalError
@@ -6,7 +8,20 @@ from rendercv.schema.models.cv.entries.bases.entry_with_complex_fields import (
 )
 from rendercv.schema.models.locale.locale import Locale
 
-from .string_processor import substitute_placeholders
+from .string_processor import compile_placeholder_template, substitute_placeholders
+
+date_placeholder_names = frozenset(
+    {
+        "MONTH_NAME",
+        "MONTH_ABBREVIATION",
+        "MONTH",
+        "MONTH_IN_TWO_DIGITS",
+        "DAY",
+        "DAY_IN_TWO_DIGITS",
+        "YEAR",
+        "YEAR_IN_TWO_DIGITS",
+    }
+)
 
 
 def build_date_placeholders(date: Date, *, locale: Locale) -> dict[str, str]:
@@ -21,6 +36,26 @@ def build_date_placeholders(date: Date, *, locale: Locale) -> dict[str, str]:
         date: Date to extract components from.
         locale: Locale providing month names and abbreviations.
 
+    Returns:
+        Dict mapping placeholder names to their string values.
+    """
+    return build_date_placeholders_from_month_names(
+        date,
+        month_names=locale.month_names,
+        month_abbreviations=locale.month_abbreviations,
+    )
+
+
+def build_date_placeholders_from_month_names(
+    date: Date, *, month_names: Sequence[str], month_abbreviations: Sequence[str]
+) -> dict[str, str]:
+    """Build all date-related template placeholders from a date and month names.
+
+    Args:
+        date: Date to extract components from.
+        month_names: Month names of the locale.
+        month_abbreviations: Month abbreviations of the locale.
+
     Returns:
         Dict mapping placeholder names to their string values.
     """
@@ -29,8 +64,8 @@ def build_date_placeholders(date: Date, *, locale: Locale) -> dict[str, str]:
     year = date.year
 
     return {
-        "MONTH_NAME": locale.month_names[month - 1],
-        "MONTH_ABBREVIATION": locale.month_abbreviations[month - 1],
+        "MONTH_NAME": month_names[month - 1],
+        "MONTH_ABBREVIATION": month_abbreviations[month - 1],
         "MONTH": str(month),
         "MONTH_IN_TWO_DIGITS": f"{month:02d}",
         "DAY": str(day),
@@ -68,9 +103,42 @@ def date_object_to_string(
     Returns:
         Formatted date string with placeholders substituted.
     """
-    return substitute_placeholders(
-        single_date_template, build_date_placeholders(date, locale=locale)
+    return format_date_object(
+        date,
+        tuple(locale.month_names),
+        tuple(locale.month_abbreviations),
+        single_date_template,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def format_date_object(
+    date: Date,
+    month_names: tuple[str, ...],
+    month_abbreviations: tuple[str, ...],
+    single_date_template: str,
+) -> str:
+    """Format a date, memoized per date, locale month names, and template.
+
+    Why:
+        The same few dates (the current date and entry dates) are formatted for
+        every entry, the footer, the top note, and the PDF title of each render.
+
+    Args:
+        date: Date to format.
+        month_names: Month names of the locale.
+        month_abbreviations: Month abbreviations of the locale.
+        single_date_template: Template with date placeholders.
+
+    Returns:
+        Formatted date string with placeholders substituted.
+    """
+    placeholders = build_date_placeholders_from_month_names(
+        date, month_names=month_names, month_abbreviations=month_abbreviations
     )
+    return compile_placeholder_template(
+        single_date_template, date_placeholder_names
+    ).render(placeholders)
 
 
 def format_date_range(
@@ -1,5 +1,7 @@
+import functools
 import re
 import textwrap
+from collections.abc import Callable
 from datetime import date as Date
 
 from rendercv.exception import RenderCVInternalError
@@ -9,7 +11,13 @@ from rendercv.schema.models.design.classic_theme import Templates
 from rendercv.schema.models.locale.locale import Locale
 
 from .date import compute_time_span_string, format_date_range, format_single_date
-from .string_processor import clean_url, substitute_placeholders
+from .string_processor import (
+    PlaceholderTemplate,
+    apply_string_processors,
+    clean_url,
+    compile_placeholder_template,
+    substitute_placeholders,
+)
 
 uppercase_word_pattern = re.compile(r"\b[A-Z_]+\b")
 
@@ -54,28 +62,28 @@ def remove_connectors_of_missing_placeholders(
         Template with connector words adjacent to missing placeholders removed.
     """
     tokens = re.split(r"(\b[A-Z_]+\b)", template)
+    is_placeholder = [bool(uppercase_word_pattern.fullmatch(t)) for t in tokens]
+
+    # Nearest placeholder on each side of every token, found in one pass each way:
+    previous_placeholders: list[str | None] = []
+    previous_placeholder: str | None = None
+    for token, token_is_placeholder in zip(tokens, is_placeholder, strict=True):
+        previous_placeholders.append(previous_placeholder)
+        if token_is_placeholder:
+            previous_placeholder = token
+    next_placeholders: list[str | None] = [None] * len(tokens)
+    next_placeholder: str | None = None
+    for i in range(len(tokens) - 1, -1, -1):
+        next_placeholders[i] = next_placeholder
+        if is_placeholder[i]:
+            next_placeholder = tokens[i]
 
     for i, token in enumerate(tokens):
-        if uppercase_word_pattern.fullmatch(token):
+        if is_placeholder[i]:
             continue
 
-        # Find the nearest placeholder on each side of this separator
-        prev_ph = next(
-            (
-                tokens[j]
-                for j in range(i - 1, -1, -1)
-                if uppercase_word_pattern.fullmatch(tokens[j])
-            ),
-            None,
-        )
-        next_ph = next(
-            (
-                tokens[j]
-                for j in range(i + 1, len(tokens))
-                if uppercase_word_pattern.fullmatch(tokens[j])
-            ),
-            None,
-        )
+        prev_ph = previous_placeholders[i]
+        next_ph = next_placeholders[i]
 
         # Only strip connectors from separators between two placeholders
         # where at least one side is missing:
@@ -92,6 +100,143 @@ def remove_connectors_of_missing_placeholders(
     return "".join(tokens)
 
 
+class EntryTemplatePlan:
+    """Entry templates of one entry type, compiled for one locale.
+
+    Why:
+        Every entry of a type is rendered with the same templates. Expanding
+        the locale phrases, removing the connectors and placeholders of missing
+        fields, and locating the placeholders to substitute only depend on the
+        templates, the locale, and which fields an entry provides. Doing this
+        once per plan, instead of once per entry, leaves entries with a single
+        pass over their fields.
+
+    Args:
+        entry_templates: Templates of the entry type, by attribute name.
+        phrases: Locale phrases, by name.
+    """
+
+    def __init__(self, entry_templates: dict[str, str], phrases: dict[str, str]):
+        # Expand locale phrases into templates by replacing phrase placeholders
+        # (e.g., DEGREE_WITH_AREA) with their locale-specific template text
+        # (e.g., "DEGREE in AREA" for English, "DEGREE en AREA" for French).
+        # The sub-placeholders (DEGREE, AREA) remain as normal placeholders for
+        # the rest of the pipeline to handle, preserving identical behavior for
+        # English.
+        for phrase_name, phrase_template in phrases.items():
+            phrase_placeholder = phrase_name.upper()
+            entry_templates = {
+                key: template.replace(phrase_placeholder, phrase_template)
+                for key, template in entry_templates.items()
+            }
+        self.entry_templates = entry_templates
+        self.used_placeholders = frozenset(
+            uppercase_word_pattern.findall(" ".join(entry_templates.values()))
+        )
+        self.summary_is_standalone = any(
+            line.strip() == "SUMMARY"
+            for template in entry_templates.values()
+            for line in template.split("\n")
+        )
+        # Templates with the placeholders of missing fields removed, by the set
+        # of missing placeholders:
+        self.templates_without_missing_placeholders: dict[
+            frozenset[str], dict[str, str]
+        ] = {}
+        # Parsed templates, by the set of provided fields:
+        self.compiled_templates: dict[
+            frozenset[str], dict[str, PlaceholderTemplate]
+        ] = {}
+
+    def get_compiled_templates(
+        self, provided_placeholders: frozenset[str]
+    ) -> dict[str, PlaceholderTemplate]:
+        """Get the templates for an entry providing the given fields.
+
+        Args:
+            provided_placeholders: Uppercase names of the entry's non-empty fields.
+
+        Returns:
+            Templates parsed into literal text and placeholder slots.
+        """
+        compiled_templates = self.compiled_templates.get(provided_placeholders)
+        if compiled_templates is not None:
+            return compiled_templates
+
+        not_provided_placeholders = self.used_placeholders - provided_placeholders
+        entry_templates = self.templates_without_missing_placeholders.get(
+            not_provided_placeholders
+        )
+        if entry_templates is None:
+            entry_templates = remove_not_provided_placeholders(
+                self.entry_templates, dict.fromkeys(provided_placeholders, "")
+            )
+            self.templates_without_missing_placeholders[not_provided_placeholders] = (
+                entry_templates
+            )
+
+        compiled_templates = {
+            key: compile_placeholder_template(template, provided_placeholders)
+            for key, template in entry_templates.items()
+        }
+        self.compiled_templates[provided_placeholders] = compiled_templates
+        return compiled_templates
+
+    def render(self, entry_fields: dict[str, str]) -> dict[str, str]:
+        """Substitute an entry's field values into the templates.
+
+        Args:
+            entry_fields: Processed field values of the entry, by uppercase name.
+
+        Returns:
+            Rendered templates, by attribute name.
+        """
+        compiled_templates = self.get_compiled_templates(frozenset(entry_fields))
+        return {
+            key: template.render(entry_fields)
+            for key, template in compiled_templates.items()
+        }
+
+
+@functools.lru_cache(maxsize=64)
+def compile_entry_template_plan(
+    entry_templates: tuple[tuple[str, str], ...],
+    phrases: tuple[tuple[str, str], ...],
+) -> EntryTemplatePlan:
+    """Compile an entry template plan, reusing it for identical templates and locales.
+
+    Args:
+        entry_templates: Templates of the entry type as (name, template) pairs.
+        phrases: Locale phrases as (name, phrase) pairs.
+
+    Returns:
+        Compiled plan.
+    """
+    return EntryTemplatePlan(dict(entry_templates), dict(phrases))
+
+
+def get_entry_template_plan(
+    entry_type_in_snake_case: str, *, templates: Templates, locale: Locale
+) -> EntryTemplatePlan:
+    """Get the compiled plan of an entry type's templates.
+
+    Args:
+        entry_type_in_snake_case: Entry type, as named in `templates`.
+        templates: Template collection for entry types and dates.
+        locale: Locale whose phrases are expanded into the templates.
+
+    Returns:
+        Compiled plan.
+    """
+    entry_templates: dict[str, str] = getattr(
+        templates, entry_type_in_snake_case
+    ).model_dump(exclude_none=True)
+    return compile_entry_template_plan(
+        tuple(entry_templates.items()),
+        tuple(locale.phrases.model_dump().items()),
+    )
+
+
 def render_entry_templates[EntryType: Entry](
     entry: EntryType,
     *,
@@ -99,6 +244,8 @@ def render_entry_templates[EntryType: Entry](
     locale: Locale,
     show_time_span: bool,
     current_date: Date,
+    entry_template_plans: dict[str, EntryTemplatePlan] | None = None,
+    string_processors: list[Callable[[str], str]] | None = None,
 ) -> EntryType:
     """Expand entry templates by substituting field placeholders with processed values.
 
@@ -113,37 +260,38 @@ def render_entry_templates[EntryType: Entry](
         locale: Locale for date and text formatting.
         show_time_span: Whether to include duration calculation in dates.
         current_date: Reference date for "present" and time span calculations.
+        entry_template_plans: Compiled plans by entry type, shared by all entries
+            rendered with the same `templates` and `locale`. Filled on demand.
+        string_processors: If given, the fields are also processed like
+            `process_fields` does, in the same pass.
 
     Returns:
         Entry with template-generated display fields.
     """
     if isinstance(entry, str) or not hasattr(templates, entry.entry_type_in_snake_case):
         # It's a TextEntry, or an entry type without templates. Return it as is:
-        return entry
-
-    entry_templates: dict[str, str] = getattr(
-        templates, entry.entry_type_in_snake_case
-    ).model_dump(exclude_none=True)
+        if string_processors is None:
+            return entry
+        return process_fields(entry, string_processors)  # ty: ignore[invalid-return-type]
+
+    entry_type = entry.entry_type_in_snake_case
+    plan = (
+        entry_template_plans.get(entry_type)
+        if entry_template_plans is not None
+        else None
+    )
+    if plan is None:
+        plan = get_entry_template_plan(entry_type, templates=templates, locale=locale)
+        if entry_template_plans is not None:
+            entry_template_plans[entry_type] = plan
 
-    entry_fields: dict[str, str] = {
-        key.upper(): value for key, value in entry.model_dump(exclude_none=True).items()
-    }
+    entry_data = entry.model_dump(exclude_none=True)
 
     # Treat empty-string values as not provided so their surrounding
     # formatting characters (like ** for bold, commas) are cleaned up:
-    entry_fields = {k: v for k, v in entry_fields.items() if v != ""}
-
-    # Expand locale phrases into templates by replacing phrase placeholders
-    # (e.g., DEGREE_WITH_AREA) with their locale-specific template text
-    # (e.g., "DEGREE in AREA" for English, "DEGREE en AREA" for French).
-    # The sub-placeholders (DEGREE, AREA) remain as normal placeholders for the
-    # rest of the pipeline to handle, preserving identical behavior for English.
-    for phrase_name, phrase_template in locale.phrases.model_dump().items():
-        phrase_placeholder = phrase_name.upper()
-        entry_templates = {
-            key: template.replace(phrase_placeholder, phrase_template)
-            for key, template in entry_templates.items()
-        }
+    entry_fields: dict[str, str] = {
+        key.upper(): value for key, value in entry_data.items() if value != ""
+    }
 
     # Handle special placeholders:
     if "HIGHLIGHTS" in entry_fields:
@@ -205,23 +353,77 @@ def render_entry_templates[EntryType: Entry](
         entry_fields["URL"] = process_url(entry)  # ty: ignore[invalid-argument-type]
         entry_fields["DOI"] = process_doi(entry)  # ty: ignore[invalid-argument-type]
 
-    if "SUMMARY" in entry_fields:
-        summary_is_standalone = any(
-            line.strip() == "SUMMARY"
-            for template in entry_templates.values()
-            for line in template.split("\n")
-        )
-        if summary_is_standalone:
-            entry_fields["SUMMARY"] = process_summary(entry_fields["SUMMARY"])
+    if "SUMMARY" in entry_fields and plan.summary_is_standalone:
+        entry_fields["SUMMARY"] = process_summary(entry_fields["SUMMARY"])
 
-    entry_templates = remove_not_provided_placeholders(entry_templates, entry_fields)
+    rendered_fields = plan.render(entry_fields) | {
+        key: substitute_placeholders(value, entry_fields)
+        for key, value in entry_fields.items()
+    }
 
-    for template_name, template in (entry_templates | entry_fields).items():
-        setattr(
-            entry,
-            template_name,
-            substitute_placeholders(template, entry_fields),
-        )
+    if string_processors is None:
+        for field, value in rendered_fields.items():
+            setattr(entry, field, value)
+    else:
+        for field, value in (entry_data | rendered_fields).items():
+            if field in fields_skipped_by_string_processors or field.startswith("_"):
+                continue
+            setattr(entry, field, process_field_value(value, string_processors))
+
+    return entry
+
+
+# Fields that must stay unprocessed for correct linking and date formatting:
+fields_skipped_by_string_processors = frozenset(
+    {"start_date", "end_date", "doi", "url"}
+)
+
+
+def process_field_value(
+    value: object, string_processors: list[Callable[[str], str]]
+) -> str | list[str]:
+    """Apply string processors to a field value.
+
+    Args:
+        value: String, list of strings, or other value to convert to a string.
+        string_processors: Transformation functions to apply.
+
+    Returns:
+        Processed string, or list of processed strings for list values.
+    """
+    if isinstance(value, str):
+        return apply_string_processors(value, string_processors)
+    if isinstance(value, list):
+        return [apply_string_processors(str(item), string_processors) for item in value]
+    return apply_string_processors(str(value), string_processors)
+
+
+def process_fields(
+    entry: Entry, string_processors: list[Callable[[str], str]]
+) -> Entry:
+    """Apply string processors to all entry fields except skipped technical fields.
+
+    Why:
+        Entry fields need markdown parsing and formatting, but dates, DOIs, and
+        URLs must remain unprocessed for correct linking and formatting. Field-
+        level processing enables selective transformation.
+
+    Args:
+        entry: Entry to process (model or string).
+        string_processors: Transformation functions to apply.
+
+    Returns:
+        Entry with processed fields.
+    """
+    if isinstance(entry, str):
+        return apply_string_processors(entry, string_processors)
+
+    data = entry.model_dump(exclude_none=True)
+    for field, value in data.items():
+        if field in fields_skipped_by_string_processors or field.startswith("_"):
+            continue
+
+        setattr(entry, field, process_field_value(value, string_processors))
 
     return entry
 
@@ -1,5 +1,7 @@
+import functools
 import itertools
 import re
+import threading
 from xml.etree.ElementTree import Element
 
 import markdown
@@ -143,16 +145,43 @@ def escape_typst_characters(string: str) -> str:
     return string
 
 
-# Create a Markdown instance
-md = markdown.core.Markdown(extensions=["admonition"])
-md.output_formats["typst"] = to_typst_string  # pyright: ignore[reportArgumentType]
-md.set_output_format("typst")  # pyright: ignore[reportArgumentType]
-md.parser.blockprocessors.deregister("hashheader")
-md.parser.blockprocessors.deregister("setextheader")
-md.parser.blockprocessors.deregister("olist")
-md.parser.blockprocessors.deregister("ulist")
-md.parser.blockprocessors.deregister("quote")
-md.stripTopLevelTags = False
+def create_markdown_parser() -> markdown.core.Markdown:
+    """Create a Markdown parser that outputs Typst markup.
+
+    Returns:
+        Markdown parser with block-level syntax that doesn't apply to CV fields
+        disabled.
+    """
+    md = markdown.core.Markdown(extensions=["admonition"])
+    md.output_formats["typst"] = to_typst_string  # pyright: ignore[reportArgumentType]
+    md.set_output_format("typst")  # pyright: ignore[reportArgumentType]
+    md.parser.blockprocessors.deregister("hashheader")
+    md.parser.blockprocessors.deregister("setextheader")
+    md.parser.blockprocessors.deregister("olist")
+    md.parser.blockprocessors.deregister("ulist")
+    md.parser.blockprocessors.deregister("quote")
+    md.stripTopLevelTags = False
+    return md
+
+
+markdown_parsers = threading.local()
+
+
+def get_markdown_parser() -> markdown.core.Markdown:
+    """Get the calling thread's Markdown parser.
+
+    Why:
+        A Markdown parser keeps the state of the document it is converting, so
+        one parser can't convert two strings at once. Creating a parser per
+        string is slow, so each thread reuses its own.
+
+    Returns:
+        Markdown parser that outputs Typst markup.
+    """
+    md = getattr(markdown_parsers, "md", None)
+    if md is None:
+        md = markdown_parsers.md = create_markdown_parser()
+    return md
 
 
 def markdown_to_typst(markdown_string: str) -> str:
@@ -172,6 +201,7 @@ def markdown_to_typst(markdown_string: str) -> str:
     Returns:
         Typst-formatted string.
     """
+    md = get_markdown_parser()
     lines = markdown_string.split("\n")
     result_parts: list[str] = []
     i = 0
@@ -192,13 +222,169 @@ def markdown_to_typst(markdown_string: str) -> str:
     return "\n".join(result_parts)
 
 
-def markdown_to_html(markdown_string: str) -> str:
-    """Convert Markdown string to HTML using python-markdown library.
+def create_html_markdown_parser() -> markdown.core.Markdown:
+    """Create a Markdown parser that outputs HTML.
+
+    Returns:
+        Markdown parser with the same block-level syntax disabled as the Typst
+        parser (see `create_markdown_parser`).
+    """
+    md = markdown.core.Markdown()
+    md.parser.blockprocessors.deregister("hashheader")
+    md.parser.blockprocessors.deregister("setextheader")
+    md.parser.blockprocessors.deregister("olist")
+    md.parser.blockprocessors.deregister("ulist")
+    md.parser.blockprocessors.deregister("quote")
+    return md
+
+
+def get_html_markdown_parser() -> markdown.core.Markdown:
+    """Get the calling thread's Markdown parser that outputs HTML.
+
+    Returns:
+        Markdown parser that outputs HTML.
+    """
+    md = getattr(markdown_parsers, "html_md", None)
+    if md is None:
+        md = markdown_parsers.html_md = create_html_markdown_parser()
+    return md
+
+
+def markdown_to_inline_html(markdown_string: str) -> str:
+    """Convert Markdown string to inline HTML, line by line.
+
+    Why:
+        HTML output is rendered straight from the processed model, like Typst.
+        Each line is converted on its own, as in `markdown_to_typst`, and keeps
+        its list marker and indentation (e.g., `- `, or a summary's four
+        spaces), so that HTML templates can still tell highlights and summaries
+        apart (see `html_lines_to_blocks`).
+
+    Example:
+        ```py
+        result = markdown_to_inline_html("**Company**, Engineer\n- Led *5* people")
+        # Returns: "<strong>Company</strong>, Engineer\n- Led <em>5</em> people"
+        ```
 
     Args:
         markdown_string: Markdown content.
 
     Returns:
-        HTML-formatted string.
+        HTML-formatted string without paragraph tags.
     """
-    return markdown.markdown(markdown_string)
+    result_lines: list[str] = []
+    for line in markdown_string.split("\n"):
+        if line.startswith("!!!"):
+            # Admonition line (e.g., `!!! summary`), kept for the templates:
+            result_lines.append(line)
+            continue
+        content = line.lstrip()
+        content = content.removeprefix("- ")
+        prefix = line[: len(line) - len(content)]
+        result_lines.append(prefix + markdown_line_to_html(content))
+    return "\n".join(result_lines)
+
+
+# Lines with none of these characters, and that aren't horizontal rules or code
+# blocks, come out of the Markdown parser as they are, without leading whitespace:
+markdown_syntax_pattern = re.compile(r"[\\`*_\[\]!<>&\t\r]|^[-\s]*$|^\s{4}")
+
+
+@functools.lru_cache(maxsize=4096)
+def markdown_line_to_html(line: str) -> str:
+    """Convert a single line of Markdown to inline HTML.
+
+    Why:
+        Most lines of a CV (names, dates, locations, plain highlights) contain
+        no Markdown, and each parser run costs far more than the line itself.
+        Such lines skip the parser, and converted lines are cached, since the
+        same text shows up in several fields (e.g., a highlight and the entry's
+        main column) and in every render of the same CV.
+
+    Args:
+        line: Markdown line without its list marker and indentation.
+
+    Returns:
+        HTML-formatted line without paragraph tags.
+    """
+    if markdown_syntax_pattern.search(line) is None:
+        return line.lstrip()
+
+    md = get_html_markdown_parser()
+    md.reset()
+    html_string = md.convert(line)
+    if html_string.startswith("<p>") and html_string.endswith("</p>"):
+        html_string = html_string[3:-4]
+    return html_string
+
+
+html_list_item_pattern = re.compile(r"( *)- (.*)")
+
+
+def html_lines_to_blocks(lines: list[str]) -> str:
+    """Arrange lines of inline HTML into paragraphs and (nested) lists.
+
+    Why:
+        Entry columns hold one line per paragraph or highlight, and sub-bullets
+        are indented by two spaces (see `process_highlights`). HTML templates
+        use this as the `html_blocks` filter to build block elements from them
+        without parsing the column as Markdown again.
+
+    Example:
+        ```py
+        result = html_lines_to_blocks(["Summary", "- Item", "  - Sub-item"])
+        # Returns:
+        # <p>Summary</p>
+        # <ul>
+        # <li>Item
+        # <ul>
+        # <li>Sub-item</li>
+        # </ul>
+        # </li>
+        # </ul>
+        ```
+
+    Args:
+        lines: Lines converted by `markdown_to_inline_html`.
+
+    Returns:
+        HTML block elements, one per line.
+    """
+    blocks: list[str] = []
+    depth = 0
+
+    def close_list_item() -> None:
+        if blocks[-1].startswith("<li>"):
+            blocks[-1] += "</li>"
+        else:
+            blocks.append("</li>")
+
+    def close_lists(until_depth: int) -> None:
+        nonlocal depth
+        while depth > until_depth:
+            close_list_item()
+            blocks.append("</ul>")
+            depth -= 1
+
+    for line in lines:
+        if line.startswith("!!!"):
+            continue
+        match = html_list_item_pattern.fullmatch(line)
+        if match is None:
+            close_lists(0)
+            if line.strip():
+                blocks.append(f"<p>{line.strip()}</p>")
+            continue
+
+        indentation, item = match.groups()
+        item_depth = min(len(indentation) // 2 + 1, depth + 1)
+        if item_depth > depth:
+            blocks.append("<ul>")
+            depth = item_depth
+        else:
+            close_lists(item_depth)
+            close_list_item()
+        blocks.append(f"<li>{item}")
+
+    close_lists(0)
+    return "\n".join(blocks)
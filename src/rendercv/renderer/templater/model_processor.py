@@ -1,67 +1,59 @@
 import pathlib
-import urllib.error
-import urllib.parse
-import urllib.request
 from collections.abc import Callable
 from typing import Literal
 
-from rendercv.exception import RenderCVUserError
-from rendercv.schema.models.cv.section import Entry
+from rendercv.renderer.photo import get_photo_download_path, schedule_photo_download
 from rendercv.schema.models.rendercv_model import RenderCVModel
 
 from .connections import compute_connections
 from .date import build_date_placeholders, date_object_to_string
-from .entry_templates_from_input import render_entry_templates
+from .entry_templates_from_input import EntryTemplatePlan, render_entry_templates
 from .footer_and_top_note import render_footer_template, render_top_note_template
-from .markdown_parser import markdown_to_typst
+from .markdown_parser import markdown_to_inline_html, markdown_to_typst
 from .string_processor import (
     apply_string_processors,
+    build_keyword_matcher,
     make_keywords_bold,
     substitute_placeholders,
 )
 
 
-def download_photo_from_url(rendercv_model: RenderCVModel) -> None:
-    """Download photo from URL to output directory and update model to local path.
+def download_photo_from_url(rendercv_model: RenderCVModel) -> RenderCVModel:
+    """Schedule downloading the photo URL to output directory and point the model to it.
 
     Why:
         Templates and Typst compiler require cv.photo to be a local pathlib.Path.
-        When user provides a URL, this downloads the image before template
-        rendering, preserving the local-path invariant for all downstream code.
+        When user provides a URL, this returns a copy of the model with cv.photo
+        pointing to the local file, preserving the local-path invariant for all
+        downstream code. The given model isn't modified, since it may be rendered
+        by other threads at the same time. Templates only use the file name, so
+        the download finishes in the background; `wait_for_photo_download` must
+        be called before the file's contents are used.
 
     Args:
-        rendercv_model: CV model whose photo URL will be downloaded in-place.
+        rendercv_model: CV model whose photo may be a URL.
+
+    Returns:
+        Copy of the model with a local photo path, or the model itself if its
+        photo isn't a URL.
     """
     if rendercv_model.cv.photo is None or isinstance(
         rendercv_model.cv.photo, pathlib.Path
     ):
-        return
+        return rendercv_model
 
     url_str = str(rendercv_model.cv.photo)
+    destination = get_photo_download_path(
+        url_str, rendercv_model.settings.render_command.output_folder
+    )
+    schedule_photo_download(url_str, destination)
 
-    parsed = urllib.parse.urlparse(url_str)
-    filename = pathlib.PurePosixPath(parsed.path).name
-    if not filename or "." not in filename:
-        filename = "photo.jpg"
-
-    output_dir = rendercv_model.settings.render_command.output_folder
-    output_dir.mkdir(parents=True, exist_ok=True)
-    destination = output_dir / filename
-
-    if not destination.exists():
-        try:
-            with urllib.request.urlopen(url_str, timeout=30) as response:
-                destination.write_bytes(response.read())
-        except (urllib.error.URLError, OSError) as e:
-            raise RenderCVUserError(
-                message=f"Failed to download photo from {url_str}: {e}"
-            ) from e
-
-    rendercv_model.cv.photo = destination
+    cv = rendercv_model.cv.model_copy(update={"photo": destination})
+    return rendercv_model.model_copy(update={"cv": cv})
 
 
 def process_model(
-    rendercv_model: RenderCVModel, file_type: Literal["typst", "markdown"]
+    rendercv_model: RenderCVModel, file_type: Literal["typst", "markdown", "html"]
 ) -> RenderCVModel:
     """Pre-process CV model for template rendering with format-specific transformations.
 
@@ -79,11 +71,19 @@ def process_model(
     """
     rendercv_model = rendercv_model.model_copy(deep=True)
 
-    string_processors: list[Callable[[str], str]] = [
-        lambda string: make_keywords_bold(string, rendercv_model.settings.bold_keywords)
-    ]
+    string_processors: list[Callable[[str], str]] = []
+    if rendercv_model.settings.bold_keywords:
+        # Build the keyword matcher once per model instead of once per string:
+        keyword_matcher = build_keyword_matcher(
+            frozenset(rendercv_model.settings.bold_keywords), word_boundary=True
+        )
+        string_processors.append(
+            lambda string: make_keywords_bold(string, keyword_matcher)
+        )
     if file_type == "typst":
         string_processors.extend([markdown_to_typst])
+    elif file_type == "html":
+        string_processors.extend([markdown_to_inline_html])
 
     rendercv_model.cv._plain_name = rendercv_model.cv.name
     rendercv_model.cv.name = apply_string_processors(
@@ -129,6 +129,8 @@ def process_model(
     if rendercv_model.cv.sections is None:
         return rendercv_model
 
+    # Entry templates are compiled once per entry type for this render:
+    entry_template_plans: dict[str, EntryTemplatePlan] = {}
     for section in rendercv_model.cv.rendercv_sections:
         section.title = apply_string_processors(section.title, string_processors)
         show_time_span = (
@@ -136,56 +138,14 @@ def process_model(
             in rendercv_model.design.sections.show_time_spans_in
         )
         for i, entry in enumerate(section.entries):
-            processed_entry = render_entry_templates(
+            section.entries[i] = render_entry_templates(
                 entry,
                 templates=rendercv_model.design.templates,
                 locale=rendercv_model.locale,
                 show_time_span=show_time_span,
                 current_date=rendercv_model.settings._resolved_current_date,
+                entry_template_plans=entry_template_plans,
+                string_processors=string_processors,
             )
-            section.entries[i] = process_fields(processed_entry, string_processors)
 
     return rendercv_model
-
-
-def process_fields(
-    entry: Entry, string_processors: list[Callable[[str], str]]
-) -> Entry:
-    """Apply string processors to all entry fields except skipped technical fields.
-
-    Why:
-        Entry fields need markdown parsing and formatting, but dates, DOIs, and
-        URLs must remain unprocessed for correct linking and formatting. Field-
-        level processing enables selective transformation.
-
-    Args:
-        entry: Entry to process (model or string).
-        string_processors: Transformation functions to apply.
-
-    Returns:
-        Entry with processed fields.
-    """
-    skipped = {"start_date", "end_date", "doi", "url"}
-
-    if isinstance(entry, str):
-        return apply_string_processors(entry, string_processors)
-
-    data = entry.model_dump(exclude_none=True)
-    for field, value in data.items():
-        if field in skipped or field.startswith("_"):
-            continue
-
-        if isinstance(value, str):
-            setattr(entry, field, apply_string_processors(value, string_processors))
-        elif isinstance(value, list):
-            setattr(
-                entry,
-                field,
-                [apply_string_processors(v, string_processors) for v in value],
-            )
-        else:
-            setattr(
-                entry, field, apply_string_processors(str(value), string_processors)
-            )
-
-    return entry
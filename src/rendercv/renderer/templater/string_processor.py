@@ -1,3 +1,4 @@
+import collections
 import functools
 import re
 from collections.abc import Callable
@@ -81,7 +82,194 @@ def build_keyword_matcher_pattern(
     return re.compile(pattern)
 
 
-def make_keywords_bold(string: str, keywords: list[str]) -> str:
+def is_word_character(character: str) -> bool:
+    """Check whether a character is matched by Unicode `\\w` in regular expressions.
+
+    Args:
+        character: Single character to check.
+
+    Returns:
+        True if the character is alphanumeric or an underscore.
+    """
+    return character.isalnum() or character == "_"
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton for finding many keywords in a single pass over text.
+
+    Why:
+        Users may bold thousands of keywords (e.g., terms extracted from a job
+        description). A regex alternation over all of them gets slower as the
+        keyword list grows, while an automaton scans each character once
+        regardless of how many keywords there are. The matcher keeps the same
+        semantics as `build_keyword_matcher_pattern`: the leftmost match wins,
+        the longest keyword wins among matches starting at the same position,
+        and word boundaries are only required on sides where the keyword starts
+        or ends with a word character.
+
+    Example:
+        ```py
+        matcher = KeywordMatcher(frozenset({"Python", "Python 3"}), word_boundary=True)
+        matcher.sub("Python 3 and Python", lambda keyword: f"**{keyword}**")
+        # Returns: "**Python 3** and **Python**"
+        ```
+
+    Args:
+        keywords: Set of keywords to match.
+        word_boundary: When True, only whole-word matches are found.
+    """
+
+    def __init__(self, keywords: frozenset[str], word_boundary: bool = False):
+        if not keywords:
+            message = "Keywords cannot be empty"
+            raise RenderCVInternalError(message)
+
+        self.word_boundary = word_boundary
+
+        # Trie transitions, failure links, and the lengths of all keywords that
+        # end at each node (including the ones reachable through failure links),
+        # sorted longest-first:
+        self.transitions: list[dict[str, int]] = [{}]
+        self.failure_links: list[int] = [0]
+        self.output_lengths: list[tuple[int, ...]] = [()]
+
+        for keyword in keywords:
+            node = 0
+            for character in keyword:
+                next_node = self.transitions[node].get(character)
+                if next_node is None:
+                    next_node = len(self.transitions)
+                    self.transitions[node][character] = next_node
+                    self.transitions.append({})
+                    self.failure_links.append(0)
+                    self.output_lengths.append(())
+                node = next_node
+            if keyword:
+                self.output_lengths[node] = (len(keyword),)
+
+        # Breadth-first traversal so that failure links of shallower nodes are
+        # ready before deeper nodes need them:
+        queue = collections.deque(self.transitions[0].values())
+        while queue:
+            node = queue.popleft()
+            for character, child in self.transitions[node].items():
+                queue.append(child)
+                failure = self.failure_links[node]
+                while failure and character not in self.transitions[failure]:
+                    failure = self.failure_links[failure]
+                child_failure = self.transitions[failure].get(character, 0)
+                self.failure_links[child] = child_failure
+                self.output_lengths[child] = tuple(
+                    sorted(
+                        self.output_lengths[child] + self.output_lengths[child_failure],
+                        reverse=True,
+                    )
+                )
+
+    def is_valid_match(self, string: str, start: int, end: int) -> bool:
+        """Check the conditional word boundaries around a candidate match.
+
+        Args:
+            string: Text being searched.
+            start: Start index of the candidate match.
+            end: End index (exclusive) of the candidate match.
+
+        Returns:
+            True if the match satisfies the word boundary requirements.
+        """
+        if not self.word_boundary:
+            return True
+        if (
+            start > 0
+            and is_word_character(string[start])
+            and is_word_character(string[start - 1])
+        ):
+            return False
+        return not (
+            end < len(string)
+            and is_word_character(string[end - 1])
+            and is_word_character(string[end])
+        )
+
+    def find_all(self, string: str) -> list[tuple[int, int]]:
+        """Find non-overlapping keyword matches, leftmost and then longest first.
+
+        Args:
+            string: Text to search.
+
+        Returns:
+            List of `(start, end)` index pairs in ascending order.
+        """
+        transitions = self.transitions
+        failure_links = self.failure_links
+        output_lengths = self.output_lengths
+
+        # The longest valid match length for each start position:
+        longest_match_at: dict[int, int] = {}
+        node = 0
+        for index, character in enumerate(string):
+            while node and character not in transitions[node]:
+                node = failure_links[node]
+            node = transitions[node].get(character, 0)
+            end = index + 1
+            for length in output_lengths[node]:
+                start = end - length
+                if length <= longest_match_at.get(start, 0):
+                    continue
+                if self.is_valid_match(string, start, end):
+                    longest_match_at[start] = length
+
+        matches: list[tuple[int, int]] = []
+        position = 0
+        for start in sorted(longest_match_at):
+            if start < position:
+                continue
+            position = start + longest_match_at[start]
+            matches.append((start, position))
+
+        return matches
+
+    def sub(self, string: str, replacement: Callable[[str], str]) -> str:
+        """Replace every keyword match with the result of `replacement`.
+
+        Args:
+            string: Text to process.
+            replacement: Function mapping a matched keyword to its replacement.
+
+        Returns:
+            String with all matches replaced.
+        """
+        parts: list[str] = []
+        position = 0
+        for start, end in self.find_all(string):
+            parts.append(string[position:start])
+            parts.append(replacement(string[start:end]))
+            position = end
+        parts.append(string[position:])
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=16)
+def build_keyword_matcher(
+    keywords: frozenset[str], word_boundary: bool = False
+) -> KeywordMatcher:
+    """Build cached Aho-Corasick keyword matcher.
+
+    Why:
+        Building the automaton is linear in the total keyword length, so it
+        should happen once per keyword set, not once per processed string.
+
+    Args:
+        keywords: Set of keywords to match.
+        word_boundary: When True, only whole-word matches are found.
+
+    Returns:
+        Keyword matcher for the given keyword set.
+    """
+    return KeywordMatcher(keywords, word_boundary=word_boundary)
+
+
+def make_keywords_bold(string: str, keywords: list[str] | KeywordMatcher) -> str:
     """Wrap all keyword occurrences in Markdown bold syntax.
 
     Why:
@@ -97,7 +285,8 @@ def make_keywords_bold(string: str, keywords: list[str]) -> str:
 
     Args:
         string: Text to process.
-        keywords: Keywords to make bold.
+        keywords: Keywords to make bold, or a prebuilt word-boundary matcher to
+            avoid rehashing a large keyword list for every string.
 
     Returns:
         String with keywords wrapped in ** markers.
@@ -105,8 +294,76 @@ def make_keywords_bold(string: str, keywords: list[str]) -> str:
     if not keywords:
         return string
 
-    pattern = build_keyword_matcher_pattern(frozenset(keywords), word_boundary=True)
-    return pattern.sub(lambda m: f"**{m.group(0)}**", string)
+    if not isinstance(keywords, KeywordMatcher):
+        keywords = build_keyword_matcher(frozenset(keywords), word_boundary=True)
+    return keywords.sub(string, lambda keyword: f"**{keyword}**")
+
+
+class PlaceholderTemplate:
+    """Template string parsed once into literal text and placeholder slots.
+
+    Why:
+        Date, file name, footer, top note, and entry templates are filled in
+        many times with the same set of placeholders. Parsing a template once
+        leaves rendering as a lookup per slot instead of a regex scan per call.
+        Placeholders are found like `substitute_placeholders` finds them: the
+        leftmost match wins, and the longest name wins at the same position.
+
+    Example:
+        ```py
+        template = PlaceholderTemplate("NAME_CV_YEAR.pdf", frozenset({"NAME", "YEAR"}))
+        template.render({"NAME": "John_Doe", "YEAR": "2025"})
+        # Returns: "John_Doe_CV_2025.pdf"
+        ```
+
+    Args:
+        template: Template string with placeholders.
+        placeholder_names: Names of the placeholders to look for.
+    """
+
+    def __init__(self, template: str, placeholder_names: frozenset[str]):
+        if placeholder_names:
+            # The pattern's capturing group keeps the placeholders in the split:
+            parts = build_keyword_matcher_pattern(placeholder_names).split(template)
+        else:
+            parts = [template]
+        self.literals: list[str] = parts[::2]
+        self.slots: list[str] = parts[1::2]
+
+    def render(self, placeholders: dict[str, str]) -> str:
+        """Fill the slots with placeholder values.
+
+        Args:
+            placeholders: Map of placeholder names to replacement values. Must
+                contain every slot's name.
+
+        Returns:
+            Rendered string, stripped of surrounding whitespace.
+        """
+        if not self.slots:
+            return self.literals[0].strip()
+        parts = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:], strict=True):
+            # Missing values (None) render as empty, as they do with `re.sub`:
+            parts.append(placeholders[slot] or "")
+            parts.append(literal)
+        return "".join(parts).strip()
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_placeholder_template(
+    template: str, placeholder_names: frozenset[str]
+) -> PlaceholderTemplate:
+    """Parse a template for the given placeholders, reusing earlier parses.
+
+    Args:
+        template: Template string with placeholders.
+        placeholder_names: Names of the placeholders to look for.
+
+    Returns:
+        Parsed template.
+    """
+    return PlaceholderTemplate(template, placeholder_names)
 
 
 def substitute_placeholders(string: str, placeholders: dict[str, str]) -> str:
@@ -135,8 +392,9 @@ def substitute_placeholders(string: str, placeholders: dict[str, str]) -> str:
     if not placeholders:
         return string
 
-    pattern = build_keyword_matcher_pattern(frozenset(placeholders.keys()))
-    return pattern.sub(lambda m: placeholders[m.group(0)], string).strip()
+    return compile_placeholder_template(string, frozenset(placeholders)).render(
+        placeholders
+    )
 
 
 def clean_url(url: str | pydantic.HttpUrl) -> str:
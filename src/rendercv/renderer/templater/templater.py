@@ -1,53 +1,170 @@
+import collections
 import contextlib
-import functools
 import pathlib
+import threading
+from collections.abc import Iterator
 from typing import Literal
 
 import jinja2
 
+from rendercv.cache import get_cache_dir
+from rendercv.renderer.photo import get_temporary_path
 from rendercv.schema.models.rendercv_model import RenderCVModel
 
-from .markdown_parser import markdown_to_html
+from .markdown_parser import html_lines_to_blocks
 from .model_processor import download_photo_from_url, process_model
 from .string_processor import clean_url
 
 templates_directory = pathlib.Path(__file__).parent / "templates"
 
 
-@functools.lru_cache(maxsize=1)
+def get_jinja2_bytecode_cache() -> jinja2.FileSystemBytecodeCache | None:
+    """Create on-disk cache for compiled Jinja2 templates.
+
+    Why:
+        Compiling templates to Python bytecode dominates the first render of every
+        process. Storing the bytecode under the RenderCV cache directory lets cold
+        processes skip compilation. Jinja2 validates each cached entry against a
+        checksum of the template source, so edited templates are recompiled.
+
+    Returns:
+        Bytecode cache, or None if the cache directory is not writable.
+    """
+    directory = get_cache_dir() / "jinja2"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return jinja2.FileSystemBytecodeCache(str(directory))
+
+
+jinja2_environment_pool_size = 16
+jinja2_environment_pool: collections.OrderedDict[
+    pathlib.Path, tuple[tuple[tuple[str, int], ...], jinja2.Environment]
+] = collections.OrderedDict()
+jinja2_environment_pool_lock = threading.Lock()
+
+
+def get_user_templates_fingerprint(
+    directory: pathlib.Path,
+) -> tuple[tuple[str, int], ...]:
+    """Collect paths and modification times of user templates in a directory.
+
+    Why:
+        Users override templates by placing them in `<theme>/`, `typst/`,
+        `markdown/`, or `html/` folders next to the input file. Jinja2 only
+        rechecks templates it has already loaded, so adding or removing an
+        override wouldn't be noticed by a cached environment. Comparing this
+        fingerprint detects any such change.
+
+    Args:
+        directory: Directory searched for user template overrides.
+
+    Returns:
+        Sorted tuple of `(path, mtime_ns)` pairs.
+    """
+    fingerprint: list[tuple[str, int]] = []
+    for pattern in ("*/*.j2.*", "*/entries/*.j2.*", "html/Full.html"):
+        for template_path in directory.glob(pattern):
+            with contextlib.suppress(OSError):
+                fingerprint.append(
+                    (str(template_path), template_path.stat().st_mtime_ns)
+                )
+    return tuple(sorted(fingerprint))
+
+
 def get_jinja2_environment(
     input_file_path: pathlib.Path | None = None,
 ) -> jinja2.Environment:
-    """Create cached Jinja2 environment with custom filters and template loaders.
+    """Get pooled Jinja2 environment for the input file's template override directory.
 
     Why:
-        Template rendering is called multiple times per render. Caching environment
-        prevents repeated filesystem scans. Loader hierarchy enables user template
-        overrides by checking input file directory before built-in templates.
+        Template rendering is called multiple times per render, and long-running
+        processes render CVs from many directories. Environments (with their
+        compiled templates) are pooled per override directory and evicted least
+        recently used first. An environment is rebuilt when user templates in its
+        directory are added, removed, or edited. Environments are safe to render
+        with from several threads; the pool itself is guarded by a lock.
 
     Args:
         input_file_path: Path to input file for user template override resolution.
 
+    Returns:
+        Configured Jinja2 environment with filters and loaders.
+    """
+    directory = input_file_path.parent if input_file_path else pathlib.Path.cwd()
+    fingerprint = get_user_templates_fingerprint(directory)
+
+    with jinja2_environment_pool_lock:
+        pooled = jinja2_environment_pool.get(directory)
+        if pooled is not None and pooled[0] == fingerprint:
+            jinja2_environment_pool.move_to_end(directory)
+            return pooled[1]
+
+    env = create_jinja2_environment(directory)
+    with jinja2_environment_pool_lock:
+        jinja2_environment_pool[directory] = (fingerprint, env)
+        jinja2_environment_pool.move_to_end(directory)
+        while len(jinja2_environment_pool) > jinja2_environment_pool_size:
+            jinja2_environment_pool.popitem(last=False)
+
+    return env
+
+
+def create_jinja2_environment(directory: pathlib.Path) -> jinja2.Environment:
+    """Create Jinja2 environment with custom filters and template loaders.
+
+    Why:
+        Loader hierarchy enables user template overrides by checking the input
+        file directory before built-in templates.
+
+    Args:
+        directory: Directory searched for user template overrides.
+
     Returns:
         Configured Jinja2 environment with filters and loaders.
     """
     env = jinja2.Environment(
         loader=jinja2.FileSystemLoader(
             [
-                (  # To allow users to override the templates:
-                    input_file_path.parent if input_file_path else pathlib.Path.cwd()
-                ),
+                directory,  # To allow users to override the templates
                 templates_directory,
             ]
         ),
         trim_blocks=True,
         lstrip_blocks=True,
+        bytecode_cache=get_jinja2_bytecode_cache(),
     )
     env.filters["clean_url"] = clean_url
     env.filters["strip"] = lambda string: string.strip()
+    env.filters["html_blocks"] = html_lines_to_blocks
     return env
 
 
+def compile_built_in_templates() -> list[str]:
+    """Compile every built-in template into the on-disk bytecode cache.
+
+    Why:
+        Templates are otherwise compiled the first time a render needs them.
+        Compiling all of them ahead of time (e.g., while building a container
+        image) spares the first render of every later process. Cache entries
+        are keyed by template name and source path, so renders from any
+        directory use them.
+
+    Returns:
+        Names of the compiled templates.
+    """
+    env = create_jinja2_environment(templates_directory)
+    template_names = sorted(
+        template_path.relative_to(templates_directory).as_posix()
+        for template_path in templates_directory.rglob("*")
+        if template_path.is_file()
+    )
+    for template_name in template_names:
+        env.get_template(template_name)
+    return template_names
+
+
 def render_full_template(
     rendercv_model: RenderCVModel, file_type: Literal["typst", "markdown"]
 ) -> str:
@@ -74,88 +191,168 @@ def render_full_template(
     Returns:
         Complete rendered document as string.
     """
+    return "".join(generate_full_template(rendercv_model, file_type))
+
+
+def write_full_template(
+    rendercv_model: RenderCVModel,
+    file_type: Literal["typst", "markdown"],
+    file_path: pathlib.Path,
+) -> None:
+    """Stream complete CV document into a file without building it in memory.
+
+    Why:
+        CVs with thousands of entries would otherwise be held as one large string
+        before writing. The document is written to a temporary file next to the
+        target and moved into place at the end, so a failed render never leaves a
+        truncated file behind. The temporary file is unique to the calling thread
+        (see `get_temporary_path`), since CVs rendered in parallel may write the
+        same output.
+
+    Args:
+        rendercv_model: CV model to render.
+        file_type: Output format for template selection and processing.
+        file_path: Destination file path.
+    """
+    temporary_file_path = get_temporary_path(file_path)
+    try:
+        with temporary_file_path.open("w", encoding="utf-8") as temporary_file:
+            temporary_file.writelines(generate_full_template(rendercv_model, file_type))
+    except BaseException:
+        temporary_file_path.unlink(missing_ok=True)
+        raise
+
+    temporary_file_path.replace(file_path)
+
+
+def generate_full_template(
+    rendercv_model: RenderCVModel, file_type: Literal["typst", "markdown"]
+) -> Iterator[str]:
+    """Yield complete CV document piece by piece, one template at a time.
+
+    Why:
+        `render_full_template` and `write_full_template` share this generator, so
+        the streamed file and the in-memory string are always identical.
+
+    Args:
+        rendercv_model: CV model to render.
+        file_type: Output format for template selection and processing.
+
+    Yields:
+        Consecutive chunks of the rendered document.
+    """
     extension = {
         "typst": "typ",
         "markdown": "md",
     }[file_type]
 
-    download_photo_from_url(rendercv_model)
+    rendercv_model = download_photo_from_url(rendercv_model)
     rendercv_model = process_model(rendercv_model, file_type)
 
-    header = render_single_template(
-        file_type,
-        f"Header.j2.{extension}",
-        rendercv_model,
-    )
+    templates = resolve_templates(rendercv_model, file_type)
+
     if file_type == "typst":
-        preamble = render_single_template(
-            file_type,
-            f"Preamble.j2.{extension}",
-            rendercv_model,
-        )
-        code = f"{preamble}\n\n{header}\n"
-    else:
-        code = f"{header}\n"
+        yield render_template(templates[f"Preamble.j2.{extension}"], rendercv_model)
+        yield "\n\n"
+    yield render_template(templates[f"Header.j2.{extension}"], rendercv_model)
+    yield "\n"
 
     for rendercv_section in rendercv_model.cv.rendercv_sections:
-        section_beginning = render_single_template(
-            file_type,
-            f"SectionBeginning.j2.{extension}",
+        yield "\n"
+        yield render_template(
+            templates[f"SectionBeginning.j2.{extension}"],
             rendercv_model,
             section_title=rendercv_section.title,
             snake_case_section_title=rendercv_section.snake_case_title,
             entry_type=rendercv_section.entry_type,
         )
-        section_ending = render_single_template(
-            file_type,
-            f"SectionEnding.j2.{extension}",
+        yield "\n"
+        entry_template = templates[
+            f"entries/{rendercv_section.entry_type}.j2.{extension}"
+        ]
+        for i, entry in enumerate(rendercv_section.entries):
+            if i > 0:
+                yield "\n\n"
+            yield render_template(entry_template, rendercv_model, entry=entry)
+        yield "\n"
+        yield render_template(
+            templates[f"SectionEnding.j2.{extension}"],
             rendercv_model,
             entry_type=rendercv_section.entry_type,
         )
-        entry_codes = []
-        for entry in rendercv_section.entries:
-            entry_code = render_single_template(
-                file_type,
-                f"entries/{rendercv_section.entry_type}.j2.{extension}",
-                rendercv_model,
-                entry=entry,
-            )
-            entry_codes.append(entry_code)
-        entries_code = "\n\n".join(entry_codes)
-        section_code = f"{section_beginning}\n{entries_code}\n{section_ending}"
-        code += f"\n{section_code}"
-
-    return code
 
 
-def render_html(rendercv_model: RenderCVModel, markdown: str) -> str:
-    """Convert Markdown to HTML and wrap with full HTML template.
+def render_html(rendercv_model: RenderCVModel) -> str:
+    """Render complete HTML document from the processed model.
 
     Why:
-        HTML output requires both content conversion (Markdown to HTML body) and
-        document structure (head, CSS, metadata). Separate function handles HTML-
-        specific workflow distinct from Typst/Markdown direct generation.
+        HTML used to be converted from the rendered Markdown document, which
+        tied it to the Markdown output and parsed every line twice. The body is
+        now rendered straight from the model with the HTML entry templates, like
+        Typst, and wrapped with the full HTML template (head, CSS, metadata).
 
     Example:
         ```py
-        markdown_content = render_full_template(rendercv_model, "markdown")
-        html_document = render_html(rendercv_model, markdown_content)
-        # Returns complete HTML with <head>, CSS, and converted Markdown body
+        html_document = render_html(rendercv_model)
+        # Returns complete HTML with <head>, CSS, and the CV's sections
         ```
 
     Args:
-        rendercv_model: CV model for template context.
-        markdown: Markdown content to convert.
+        rendercv_model: CV model to render.
 
     Returns:
         Complete HTML document.
     """
-    html_body = markdown_to_html(markdown)
+    html_body = "\n".join(generate_html_body(rendercv_model))
     return render_single_template(
         "html", "Full.html", rendercv_model, html_body=html_body
     )
 
 
+def generate_html_body(rendercv_model: RenderCVModel) -> Iterator[str]:
+    """Yield the HTML body's block elements, one template at a time.
+
+    Why:
+        HTML blocks are separated by single line breaks, so unlike
+        `generate_full_template`, templates that render nothing (e.g., the
+        ending of a section that isn't a list) are skipped instead of leaving
+        blank lines behind.
+
+    Args:
+        rendercv_model: CV model to render.
+
+    Yields:
+        Rendered templates, without surrounding whitespace.
+    """
+    rendercv_model = download_photo_from_url(rendercv_model)
+    rendercv_model = process_model(rendercv_model, "html")
+
+    templates = resolve_templates(rendercv_model, "html")
+
+    def render(relative_template_path: str, **kwargs) -> Iterator[str]:
+        html_string = render_template(
+            templates[relative_template_path], rendercv_model, **kwargs
+        ).strip()
+        if html_string:
+            yield html_string
+
+    yield from render("Header.j2.html")
+    for rendercv_section in rendercv_model.cv.rendercv_sections:
+        yield from render(
+            "SectionBeginning.j2.html",
+            section_title=rendercv_section.title,
+            snake_case_section_title=rendercv_section.snake_case_title,
+            entry_type=rendercv_section.entry_type,
+        )
+        for entry in rendercv_section.entries:
+            yield from render(
+                f"entries/{rendercv_section.entry_type}.j2.html", entry=entry
+            )
+        yield from render(
+            "SectionEnding.j2.html", entry_type=rendercv_section.entry_type
+        )
+
+
 def render_single_template(
     file_type: Literal["markdown", "typst", "html"],
     relative_template_path: str,
@@ -192,20 +389,105 @@ def render_single_template(
     Returns:
         Rendered template as string.
     """
-    jinja2_environment = get_jinja2_environment(rendercv_model._input_file_path)
-    template = None
+    template = resolve_template(
+        get_jinja2_environment(rendercv_model._input_file_path),
+        file_type,
+        relative_template_path,
+        theme=rendercv_model.design.theme,
+    )
+    return render_template(template, rendercv_model, **kwargs)
+
+
+def resolve_template(
+    jinja2_environment: jinja2.Environment,
+    file_type: Literal["markdown", "typst", "html"],
+    relative_template_path: str,
+    *,
+    theme: str,
+) -> jinja2.Template:
+    """Find the template to use for a path, preferring the user's theme override.
+
+    Args:
+        jinja2_environment: Environment to load templates from.
+        file_type: Format for template directory selection.
+        relative_template_path: Template file path relative to format directory.
+        theme: Theme name used as the override directory for Typst templates.
+
+    Returns:
+        User's Typst template if it exists, otherwise the built-in template.
+    """
     if file_type == "typst":
         # Try user's own Typst templates first:
         with contextlib.suppress(jinja2.TemplateNotFound):
-            template = jinja2_environment.get_template(
-                f"{rendercv_model.design.theme}/{relative_template_path}"
-            )
+            return jinja2_environment.get_template(f"{theme}/{relative_template_path}")
+
+    return jinja2_environment.get_template(f"{file_type}/{relative_template_path}")
+
+
+def resolve_templates(
+    rendercv_model: RenderCVModel, file_type: Literal["typst", "markdown", "html"]
+) -> dict[str, jinja2.Template]:
+    """Resolve every template a document needs into a lookup table.
+
+    Why:
+        Looking up a template that the user didn't override raises and suppresses
+        `TemplateNotFound` after checking the filesystem. Doing this once per
+        template instead of once per entry keeps large CVs from paying that cost
+        thousands of times. Jinja2 still checks each template's modification time
+        when it is looked up, so edits are picked up on the next render.
+
+    Args:
+        rendercv_model: CV model providing theme, sections, and input file path.
+        file_type: Output format for template selection.
+
+    Returns:
+        Mapping from relative template path to resolved template.
+    """
+    extension = {
+        "typst": "typ",
+        "markdown": "md",
+        "html": "html",
+    }[file_type]
 
-    if template is None:
-        template = jinja2_environment.get_template(
-            f"{file_type}/{relative_template_path}"
+    relative_template_paths = [
+        f"Header.j2.{extension}",
+        f"SectionBeginning.j2.{extension}",
+        f"SectionEnding.j2.{extension}",
+    ]
+    if file_type == "typst":
+        relative_template_paths.append(f"Preamble.j2.{extension}")
+    relative_template_paths.extend(
+        dict.fromkeys(
+            f"entries/{section.entry_type}.j2.{extension}"
+            for section in rendercv_model.cv.rendercv_sections
         )
+    )
+
+    jinja2_environment = get_jinja2_environment(rendercv_model._input_file_path)
+    return {
+        relative_template_path: resolve_template(
+            jinja2_environment,
+            file_type,
+            relative_template_path,
+            theme=rendercv_model.design.theme,
+        )
+        for relative_template_path in relative_template_paths
+    }
+
 
+def render_template(
+    template: jinja2.Template, rendercv_model: RenderCVModel, **kwargs
+) -> str:
+    """Render a resolved template with the CV model as context. Arbitrary keyword
+    arguments are passed to the template as additional template variables.
+
+    Args:
+        template: Resolved Jinja2 template.
+        rendercv_model: CV model providing template context.
+
+    Returns:
+        Rendered template as string.
+    """
     return template.render(
         cv=rendercv_model.cv,
         design=rendercv_model.design,
@@ -3,7 +3,8 @@ import pathlib
 from rendercv.schema.models.rendercv_model import RenderCVModel
 
 from .path_resolver import resolve_rendercv_file_path
-from .templater.templater import render_full_template
+from .photo import get_local_photo_path, wait_for_photo_download
+from .templater.templater import write_full_template
 
 
 def generate_typst(rendercv_model: RenderCVModel) -> pathlib.Path | None:
@@ -25,6 +26,7 @@ def generate_typst(rendercv_model: RenderCVModel) -> pathlib.Path | None:
     typst_path = resolve_rendercv_file_path(
         rendercv_model, rendercv_model.settings.render_command.typst_path
     )
-    typst_contents = render_full_template(rendercv_model, "typst")
-    typst_path.write_text(typst_contents, encoding="utf-8")
+    write_full_template(rendercv_model, "typst", typst_path)
+    # A photo URL is downloaded while the Typst source is generated:
+    wait_for_photo_download(get_local_photo_path(rendercv_model))
     return typst_path
@@ -0,0 +1,235 @@
+import collections
+import threading
+from collections.abc import Callable, Hashable
+from datetime import date as Date
+from typing import Any
+
+import pydantic
+
+from .models.cv.cv import Cv
+from .models.cv.section import Section
+from .models.design.built_in_design import available_themes, built_in_design_adapter
+from .models.locale.locale import locale_adapter
+from .models.rendercv_model import RenderCVModel
+from .models.settings.settings import Settings
+from .models.validation_context import ValidationContext
+
+section_adapter = pydantic.TypeAdapter[Any](Section)
+
+# At most this many validated subtrees are kept:
+validated_subtree_pool_size = 256
+validated_subtree_pool: collections.OrderedDict[Hashable, Any] = (
+    collections.OrderedDict()
+)
+validated_subtree_pool_lock = threading.Lock()
+
+rendercv_model_fields = frozenset(RenderCVModel.model_fields)
+
+
+class NotSplittableError(Exception):
+    """The input can't be validated subtree by subtree."""
+
+
+def get_structural_key(value: Any) -> Hashable:
+    """Build a hashable key that is equal for structurally equal YAML values.
+
+    Why:
+        Parsed YAML containers are unhashable, and their coordinates don't
+        affect validation. Scalars are paired with their types, since `1`,
+        `1.0`, and `True` are equal in Python but validate differently.
+
+    Args:
+        value: Parsed YAML value.
+
+    Returns:
+        Nested tuples of the value's keys, types, and scalars.
+    """
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple([(key, get_structural_key(item)) for key, item in dict.items(value)]),
+        )
+    if isinstance(value, list):
+        return (list, tuple([get_structural_key(item) for item in value]))
+    return (type(value), value)
+
+
+def get_validated_subtree(
+    kind: str,
+    subtree: Any,
+    context_key: Hashable,
+    validate: Callable[[Any], Any],
+) -> Any:
+    """Validate a subtree of the input, or reuse its validation from the pool.
+
+    Args:
+        kind: What the subtree is (e.g., `section`), part of the pool key.
+        subtree: Input subtree.
+        context_key: Everything besides the subtree its validation depends on.
+        validate: Function validating the subtree.
+
+    Returns:
+        The validated subtree.
+    """
+    key = (kind, context_key, get_structural_key(subtree))
+    with validated_subtree_pool_lock:
+        try:
+            validated_subtree = validated_subtree_pool.get(key)
+        except TypeError as e:
+            # Unhashable scalars, such as sets:
+            raise NotSplittableError from e
+        if validated_subtree is not None:
+            validated_subtree_pool.move_to_end(key)
+            return validated_subtree
+
+    validated_subtree = validate(subtree)
+    with validated_subtree_pool_lock:
+        validated_subtree_pool[key] = validated_subtree
+        if len(validated_subtree_pool) > validated_subtree_pool_size:
+            validated_subtree_pool.popitem(last=False)
+    return validated_subtree
+
+
+def validate_cv(
+    cv: Any, context: dict[str, ValidationContext], context_key: Hashable
+) -> Cv:
+    """Validate the `cv` field from its separately validated header and sections.
+
+    Why:
+        The header is validated with an empty placeholder in place of the
+        sections, so its `_key_order` is captured exactly as it is for the whole
+        `cv` field. The sections, validated one by one, are assigned afterwards.
+        Each model gets its own copy of the header, since rendering replaces
+        photo URLs on it.
+
+    Args:
+        cv: Input of the `cv` field.
+        context: Validation context.
+        context_key: Hashable form of the validation context.
+
+    Returns:
+        The validated `cv` field.
+    """
+    if not isinstance(cv, dict):
+        raise NotSplittableError
+    sections = cv.get("sections")
+    if sections is not None and (
+        not isinstance(sections, dict)
+        or not all(isinstance(title, str) for title in sections)
+    ):
+        raise NotSplittableError
+
+    header = {
+        key: {} if key == "sections" and value is not None else value
+        for key, value in dict.items(cv)
+    }
+    if header.get("photo") is None:
+        validated_cv = get_validated_subtree(
+            "cv",
+            header,
+            context_key,
+            lambda header: Cv.model_validate(header, context=context),
+        ).model_copy()
+    else:
+        # Photo paths are checked for existence, so they can't be reused:
+        validated_cv = Cv.model_validate(header, context=context)
+
+    if sections is not None:
+        validated_cv.sections = {
+            title: get_validated_subtree(
+                "section",
+                section,
+                context_key,
+                lambda section: section_adapter.validate_python(
+                    section, context=context
+                ),
+            )
+            for title, section in dict.items(sections)
+        }
+    return validated_cv
+
+
+def validate_rendercv_model_incrementally(
+    input_dictionary: dict[str, Any], validation_context: ValidationContext
+) -> RenderCVModel:
+    """Validate the input, reusing subtrees validated in earlier calls.
+
+    Why:
+        Watch mode and editors validate the whole input after every edit,
+        although usually a single entry has changed. The `cv` header, each
+        section, `design`, `locale`, and `settings` are validated on their own
+        and pooled by their structure and the validation context, so only
+        changed subtrees are validated again. Subtrees depending on files
+        (photos, custom themes, and overlay file paths) are always validated.
+        Pooled sub-models are shared between the models built from them and must
+        not be modified.
+
+        Whenever a subtree fails, or the input doesn't have the expected shape,
+        the whole input is validated as one, so validation errors are exactly
+        those of `RenderCVModel.model_validate`.
+
+    Args:
+        input_dictionary: Merged input dictionary.
+        validation_context: Input file path and current date for validators.
+
+    Returns:
+        Validated model.
+    """
+    context = {"context": validation_context}
+    current_date = validation_context.current_date
+    context_key = (
+        validation_context.input_file_path,
+        get_structural_key(current_date),
+        # "today" and invalid dates are resolved to today's date:
+        Date.today(),
+    )
+
+    try:
+        if not rendercv_model_fields.issuperset(input_dictionary):
+            raise NotSplittableError
+
+        fields: dict[str, Any] = {}
+        if "cv" in input_dictionary:
+            fields["cv"] = validate_cv(input_dictionary["cv"], context, context_key)
+
+        design = input_dictionary.get("design")
+        if isinstance(design, dict) and design.get("theme") in available_themes:
+            fields["design"] = get_validated_subtree(
+                "design",
+                design,
+                context_key,
+                lambda design: built_in_design_adapter.validate_python(
+                    design, context=context
+                ),
+            )
+        elif "design" in input_dictionary:
+            fields["design"] = design
+
+        if "locale" in input_dictionary:
+            fields["locale"] = get_validated_subtree(
+                "locale",
+                input_dictionary["locale"],
+                context_key,
+                lambda locale: locale_adapter.validate_python(locale, context=context),
+            )
+
+        settings = input_dictionary.get("settings")
+        render_command = (
+            settings.get("render_command") if isinstance(settings, dict) else None
+        )
+        if isinstance(render_command, dict) and (
+            render_command.get("design") is not None
+            or render_command.get("locale") is not None
+        ):
+            fields["settings"] = settings
+        elif "settings" in input_dictionary:
+            fields["settings"] = get_validated_subtree(
+                "settings",
+                settings,
+                context_key,
+                lambda settings: Settings.model_validate(settings, context=context),
+            )
+
+        return RenderCVModel.model_validate(fields, context=context)
+    except (NotSplittableError, pydantic.ValidationError):
+        return RenderCVModel.model_validate(input_dictionary, context=context)
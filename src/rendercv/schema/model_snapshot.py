@@ -0,0 +1,256 @@
+import functools
+import hashlib
+import io
+import pathlib
+import pickle
+import typing
+from collections.abc import Iterator
+from typing import Any
+
+import pydantic
+
+from rendercv import __version__
+from rendercv.exception import RenderCVUserError
+
+from .models.design.built_in_design import BuiltInDesign, available_themes
+from .models.design.design import (
+    create_theme_class_without_options,
+    load_custom_theme_class,
+)
+from .models.locale.locale import Locale
+from .models.rendercv_model import RenderCVModel
+
+type ClassKey = tuple[str, ...]
+
+
+def get_model_classes(annotation: Any) -> Iterator[type[pydantic.BaseModel]]:
+    """Find the Pydantic model classes a field annotation refers to.
+
+    Args:
+        annotation: Field annotation (e.g., `Header | None`).
+
+    Returns:
+        Model classes in the annotation, including unions and type aliases.
+    """
+    if isinstance(annotation, typing.TypeAliasType):
+        yield from get_model_classes(annotation.__value__)
+    elif isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel):
+        yield annotation
+    for argument in typing.get_args(annotation):
+        yield from get_model_classes(argument)
+
+
+def collect_model_classes(
+    model_class: type[pydantic.BaseModel], key: ClassKey
+) -> Iterator[tuple[ClassKey, type[pydantic.BaseModel]]]:
+    """Assign a key to a model class and every model class nested in its fields.
+
+    Why:
+        Built-in themes and locales, and their nested models, are generated
+        from YAML files when RenderCV is imported, so pickle can't look them up
+        by name. Several of them share a name (e.g., every theme has a `Header`),
+        so each one is keyed by its path from the theme or locale class instead.
+
+    Args:
+        model_class: Theme, locale, or nested model class.
+        key: Key of `model_class`.
+
+    Returns:
+        Keys and classes, starting with `model_class` itself.
+    """
+    yield key, model_class
+    for field_name, field_info in model_class.model_fields.items():
+        for nested_class in get_model_classes(field_info.annotation):
+            if nested_class is not model_class:
+                yield from collect_model_classes(
+                    nested_class, (*key, field_name, nested_class.__qualname__)
+                )
+
+
+@functools.lru_cache(maxsize=1)
+def get_generated_model_classes() -> dict[ClassKey, type[pydantic.BaseModel]]:
+    """Key every class generated for the built-in themes and locales.
+
+    Returns:
+        Classes by their key.
+    """
+    root_classes = typing.get_args(
+        typing.get_args(BuiltInDesign.__value__)[0]
+    ) + typing.get_args(typing.get_args(Locale.__value__)[0])
+    generated_classes: dict[ClassKey, type[pydantic.BaseModel]] = {}
+    for root_class in root_classes:
+        generated_classes.update(
+            collect_model_classes(root_class, ("built_in", root_class.__qualname__))
+        )
+    return generated_classes
+
+
+@functools.lru_cache(maxsize=1)
+def get_generated_model_class_keys() -> dict[type[pydantic.BaseModel], ClassKey]:
+    """Map every class generated for the built-in themes and locales to its key.
+
+    Returns:
+        The first key of each class in `get_generated_model_classes`.
+    """
+    class_keys: dict[type[pydantic.BaseModel], ClassKey] = {}
+    for key, model_class in get_generated_model_classes().items():
+        class_keys.setdefault(model_class, key)
+    return class_keys
+
+
+def get_custom_theme_key(rendercv_model: RenderCVModel) -> ClassKey | None:
+    """Build the key a custom theme's class is loaded with again.
+
+    Args:
+        rendercv_model: Validated CV model.
+
+    Returns:
+        Theme folder and content hash of its `__init__.py` (empty if it has
+        none), or None if the model uses a built-in theme.
+    """
+    if rendercv_model.design.theme in available_themes:
+        return None
+    input_file_path = rendercv_model._input_file_path
+    relative_to = input_file_path.parent if input_file_path else pathlib.Path.cwd()
+    custom_theme_folder = (relative_to / rendercv_model.design.theme).absolute()
+    init_file_path = custom_theme_folder / "__init__.py"
+    init_file_hash = (
+        hashlib.sha256(init_file_path.read_bytes()).hexdigest()
+        if init_file_path.is_file()
+        else ""
+    )
+    return ("custom_theme", str(custom_theme_folder), init_file_hash)
+
+
+def load_custom_theme_class_from_key(key: ClassKey) -> type[pydantic.BaseModel]:
+    """Load a custom theme's class for a key from `get_custom_theme_key`.
+
+    Args:
+        key: Custom theme key.
+
+    Returns:
+        The theme's class.
+
+    Raises:
+        RenderCVUserError: If the theme's `__init__.py` changed since the
+            snapshot was created.
+    """
+    _, folder, init_file_hash = key
+    custom_theme_folder = pathlib.Path(folder)
+    if not init_file_hash:
+        return create_theme_class_without_options(custom_theme_folder.name)
+
+    init_file_path = custom_theme_folder / "__init__.py"
+    if (
+        not init_file_path.is_file()
+        or hashlib.sha256(init_file_path.read_bytes()).hexdigest() != init_file_hash
+    ):
+        message = (
+            f"The custom theme `{custom_theme_folder.name}` has changed since the"
+            " snapshot was created. Validate the CV again."
+        )
+        raise RenderCVUserError(message)
+    return load_custom_theme_class(custom_theme_folder, init_file_hash)
+
+
+class RenderCVModelPickler(pickle.Pickler):
+    """Pickler that writes generated model classes as keys.
+
+    Args:
+        file: Binary file the snapshot is written to.
+        class_keys: Keys of the classes pickle can't look up by name.
+    """
+
+    def __init__(
+        self, file: io.BytesIO, class_keys: dict[type[pydantic.BaseModel], ClassKey]
+    ):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.class_keys = class_keys
+
+    def persistent_id(self, obj: Any) -> ClassKey | None:
+        if isinstance(obj, type):
+            return self.class_keys.get(obj)
+        return None
+
+
+class RenderCVModelUnpickler(pickle.Unpickler):
+    """Unpickler that resolves the keys written by `RenderCVModelPickler`."""
+
+    def persistent_load(self, pid: Any) -> type[pydantic.BaseModel]:
+        if pid[0] == "built_in":
+            return get_generated_model_classes()[pid]
+
+        root_key, path = pid[:3], pid[3:]
+        root_class = load_custom_theme_class_from_key(root_key)
+        return dict(collect_model_classes(root_class, ()))[path]
+
+
+def dump_rendercv_model_snapshot(rendercv_model: RenderCVModel) -> bytes:
+    """Serialize a validated CV model, private attributes included.
+
+    Why:
+        Validating a CV (emails, URLs, phone numbers, dates) costs several times
+        more than rebuilding the model from a snapshot. A pipeline can validate
+        once, e.g., at ingestion, and hand snapshots to render workers. Private
+        attributes such as `_key_order`, `_input_file_path`, and the resolved
+        current date are kept, so the loaded model renders exactly like the
+        original.
+
+    Example:
+        ```py
+        snapshot = dump_rendercv_model_snapshot(rendercv_model)
+        # In a worker process:
+        rendercv_model = load_rendercv_model_snapshot(snapshot)
+        ```
+
+    Args:
+        rendercv_model: Validated CV model.
+
+    Returns:
+        Snapshot of the model.
+    """
+    class_keys = get_generated_model_class_keys()
+    custom_theme_key = get_custom_theme_key(rendercv_model)
+    if custom_theme_key is not None:
+        class_keys = class_keys | {
+            model_class: (*custom_theme_key, *path)
+            for path, model_class in reversed(
+                list(collect_model_classes(type(rendercv_model.design), ()))
+            )
+        }
+
+    snapshot = io.BytesIO()
+    pickler = RenderCVModelPickler(snapshot, class_keys)
+    pickler.dump(__version__)
+    pickler.dump(rendercv_model)
+    return snapshot.getvalue()
+
+
+def load_rendercv_model_snapshot(snapshot: bytes) -> RenderCVModel:
+    """Rebuild a CV model from a snapshot without validating it again.
+
+    Why:
+        The model is trusted to be valid, since it was validated before its
+        snapshot was created. Like any pickle, loading a snapshot can run
+        arbitrary code, so only snapshots created by a trusted process should
+        be loaded.
+
+    Args:
+        snapshot: Snapshot created by `dump_rendercv_model_snapshot`.
+
+    Returns:
+        The validated CV model.
+
+    Raises:
+        RenderCVUserError: If the snapshot was created by another RenderCV
+            version, or its custom theme has changed since.
+    """
+    unpickler = RenderCVModelUnpickler(io.BytesIO(snapshot))
+    snapshot_version = unpickler.load()
+    if snapshot_version != __version__:
+        message = (
+            f"The snapshot was created by RenderCV v{snapshot_version}, but this is"
+            f" RenderCV v{__version__}. Validate the CV again."
+        )
+        raise RenderCVUserError(message)
+    return unpickler.load()
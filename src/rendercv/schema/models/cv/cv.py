@@ -2,13 +2,13 @@ import functools
 from typing import Any, Self
 
 import pydantic
-import pydantic_extra_types.phone_numbers as pydantic_phone_numbers
 
 from rendercv.exception import RenderCVInternalError
 
 from ..base import BaseModelWithoutExtraKeys
 from ..path import ExistingPathRelativeToInput
 from .custom_connection import CustomConnection
+from .phone_number import PhoneNumber, validate_phone_number, validate_phone_numbers
 from .section import BaseRenderCVSection, Section, get_rendercv_sections
 from .social_network import SocialNetwork
 
@@ -20,12 +20,6 @@ website_validator = pydantic.TypeAdapter[pydantic.HttpUrl](pydantic.HttpUrl)
 websites_validator = pydantic.TypeAdapter[list[pydantic.HttpUrl]](
     list[pydantic.HttpUrl]
 )
-phone_validator = pydantic.TypeAdapter[pydantic_phone_numbers.PhoneNumber](
-    pydantic_phone_numbers.PhoneNumber
-)
-phones_validator = pydantic.TypeAdapter[list[pydantic_phone_numbers.PhoneNumber]](
-    list[pydantic_phone_numbers.PhoneNumber]
-)
 
 
 class Cv(BaseModelWithoutExtraKeys):
@@ -55,11 +49,7 @@ class Cv(BaseModelWithoutExtraKeys):
         description="Photo file path (relative to the YAML file) or a URL.",
         examples=["photo.jpg", "images/profile.png", "https://example.com/photo.jpg"],
     )
-    phone: (
-        pydantic_phone_numbers.PhoneNumber
-        | list[pydantic_phone_numbers.PhoneNumber]
-        | None
-    ) = pydantic.Field(
+    phone: PhoneNumber | list[PhoneNumber] | None = pydantic.Field(
         default=None,
         description=(
             "Your phone number with country code in international format (e.g., +1 for"
@@ -181,10 +171,10 @@ class Cv(BaseModelWithoutExtraKeys):
     ) -> (
         pydantic.EmailStr
         | pydantic.HttpUrl
-        | pydantic_phone_numbers.PhoneNumber
+        | PhoneNumber
         | list[pydantic.EmailStr]
         | list[pydantic.HttpUrl]
-        | list[pydantic_phone_numbers.PhoneNumber]
+        | list[PhoneNumber]
         | None
     ):
         """Validate fields that accept single value or list with type-specific errors.
@@ -208,19 +198,23 @@ class Cv(BaseModelWithoutExtraKeys):
         if info.field_name is None:
             raise RenderCVInternalError("field_name is None in validator")
 
+        if info.field_name == "phone":
+            # Phone numbers are validated separately so that the phone number
+            # library is only loaded when a CV has a phone number:
+            if isinstance(value, list):
+                return validate_phone_numbers(value)
+            return validate_phone_number(value)
+
         validators: tuple[
             pydantic.TypeAdapter[pydantic.EmailStr]
-            | pydantic.TypeAdapter[pydantic.HttpUrl]
-            | pydantic.TypeAdapter[pydantic_phone_numbers.PhoneNumber],
+            | pydantic.TypeAdapter[pydantic.HttpUrl],
             (
                 pydantic.TypeAdapter[list[pydantic.EmailStr]]
                 | pydantic.TypeAdapter[list[pydantic.HttpUrl]]
-                | pydantic.TypeAdapter[list[pydantic_phone_numbers.PhoneNumber]]
             ),
         ] = {
             "website": (website_validator, websites_validator),
             "email": (email_validator, emails_validator),
-            "phone": (phone_validator, phones_validator),
         }[info.field_name]
 
         if isinstance(value, list):
@@ -229,9 +223,7 @@ class Cv(BaseModelWithoutExtraKeys):
         return validators[0].validate_python(value)
 
     @pydantic.field_serializer("phone")
-    def serialize_phone(
-        self, phone: pydantic_phone_numbers.PhoneNumber | None
-    ) -> str | None:
+    def serialize_phone(self, phone: PhoneNumber | None) -> str | None:
         """Remove tel: prefix from phone number for clean serialization.
 
         Why:
@@ -0,0 +1,51 @@
+import functools
+
+import pydantic
+
+# Phone numbers are validated by `validate_phone_number`, so this alias is only used
+# for annotations. The validated value is a `str` subclass prefixed with "tel:".
+type PhoneNumber = str
+
+
+@functools.cache
+def get_phone_number_validators() -> tuple[pydantic.TypeAdapter, pydantic.TypeAdapter]:
+    """Build the phone number validators on first use.
+
+    Why:
+        Phone number validation needs the `phonenumbers` library, which loads large
+        metadata tables when imported. Most CVs have no phone number at all, so
+        the library is only imported once a phone number is validated.
+
+    Returns:
+        Validators for a single phone number and for a list of phone numbers.
+    """
+    import pydantic_extra_types.phone_numbers as pydantic_phone_numbers  # noqa: PLC0415
+
+    return (
+        pydantic.TypeAdapter(pydantic_phone_numbers.PhoneNumber),
+        pydantic.TypeAdapter(list[pydantic_phone_numbers.PhoneNumber]),
+    )
+
+
+def validate_phone_number(value: object) -> PhoneNumber:
+    """Validate a phone number with country code in international format.
+
+    Args:
+        value: Phone number to validate.
+
+    Returns:
+        Validated phone number, prefixed with "tel:".
+    """
+    return get_phone_number_validators()[0].validate_python(value)
+
+
+def validate_phone_numbers(value: object) -> list[PhoneNumber]:
+    """Validate a list of phone numbers with country code in international format.
+
+    Args:
+        value: Phone numbers to validate.
+
+    Returns:
+        Validated phone numbers, prefixed with "tel:".
+    """
+    return get_phone_number_validators()[1].validate_python(value)
@@ -4,10 +4,10 @@ from typing import Literal, get_args
 
 import pydantic
 import pydantic_core
-import pydantic_extra_types.phone_numbers as pydantic_phone_numbers
 
 from ...pydantic_error_handling import CustomPydanticErrorTypes
 from ..base import BaseModelWithoutExtraKeys
+from .phone_number import validate_phone_number
 
 url_validator = pydantic.TypeAdapter[pydantic.HttpUrl](pydantic.HttpUrl)
 
@@ -130,9 +130,7 @@ class SocialNetwork(BaseModelWithoutExtraKeys):
                     )
             case "WhatsApp":
                 try:
-                    pydantic.TypeAdapter[pydantic_phone_numbers.PhoneNumber](
-                        pydantic_phone_numbers.PhoneNumber
-                    ).validate_python(username)
+                    validate_phone_number(username)
                 except pydantic.ValidationError as e:
                     raise pydantic_core.PydanticCustomError(
                         CustomPydanticErrorTypes.other.value,
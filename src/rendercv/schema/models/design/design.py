@@ -1,3 +1,5 @@
+import functools
+import hashlib
 import importlib
 import importlib.util
 import pathlib
@@ -11,19 +13,138 @@ from rendercv.exception import RenderCVInternalError
 
 from ...pydantic_error_handling import CustomPydanticErrorTypes
 from ..validation_context import get_input_file_path
-from .built_in_design import BuiltInDesign, built_in_design_adapter
+from .built_in_design import (
+    BuiltInDesign,
+    available_themes,
+    built_in_design_adapter,
+)
 from .classic_theme import ClassicTheme
 
 custom_theme_name_pattern = re.compile(r"^[a-z0-9]+$")
 
 
+@functools.lru_cache(maxsize=32)
+def load_custom_theme_class(
+    custom_theme_folder: pathlib.Path,
+    init_file_hash: str,  # noqa: ARG001
+) -> type[pydantic.BaseModel]:
+    """Load the data model class of a custom theme from its `__init__.py`.
+
+    Why:
+        Executing the theme's `__init__.py` and building the schema of its class
+        are by far the most expensive parts of validating a custom-theme design.
+        Classes are memoized per theme folder and content hash of `__init__.py`,
+        so watch mode and repeated renders reuse them until the file is edited.
+
+    Args:
+        custom_theme_folder: Absolute path to the custom theme folder.
+        init_file_hash: Content hash of the folder's `__init__.py`, part of the
+            memoization key.
+
+    Returns:
+        The theme's `<Name>Theme` class.
+    """
+    theme_name = custom_theme_folder.name
+    path_to_init_file = custom_theme_folder / "__init__.py"
+    spec = importlib.util.spec_from_file_location(
+        "theme",
+        path_to_init_file,
+    )
+    if spec is None:
+        msg = f"Failed to load spec from {path_to_init_file}"
+        raise RenderCVInternalError(msg)
+
+    theme_module = importlib.util.module_from_spec(spec)
+    try:
+        if spec.loader is None:
+            msg = f"spec.loader is None for {path_to_init_file}"
+            raise RenderCVInternalError(msg)
+        spec.loader.exec_module(theme_module)
+    except SyntaxError as e:
+        raise pydantic_core.PydanticCustomError(
+            CustomPydanticErrorTypes.other.value,
+            "The custom theme {theme_name}'s __init__.py file has a syntax"
+            " error. Please fix it.",
+            {"theme_name": theme_name},
+        ) from e
+    except ImportError as e:
+        raise pydantic_core.PydanticCustomError(
+            CustomPydanticErrorTypes.other.value,
+            "The custom theme {theme_name}'s __init__.py file has an import error!"
+            " Check the import statements.",
+            {"theme_name": theme_name},
+        ) from e
+
+    model_name = f"{theme_name.capitalize()}Theme"
+    try:
+        return getattr(
+            theme_module,
+            model_name,
+        )
+    except AttributeError as e:
+        message = f"The custom theme {theme_name} does not have a {model_name} class."
+        raise ValueError(message) from e
+
+
+@functools.lru_cache(maxsize=32)
+def check_custom_theme_templates(
+    custom_theme_folder: pathlib.Path,
+    init_file_hash: str | None,  # noqa: ARG001
+) -> None:
+    """Check that a custom theme folder contains at least one `*.j2.typ` file.
+
+    Why:
+        Searching the theme folder recursively costs a file system walk on every
+        validation. Successful checks are memoized with the same key as
+        `load_custom_theme_class`; failed ones raise, so they aren't memoized and
+        templates added afterwards are found.
+
+    Args:
+        custom_theme_folder: Absolute path to the custom theme folder.
+        init_file_hash: Content hash of the folder's `__init__.py`, or None if it
+            has none, part of the memoization key.
+
+    Raises:
+        pydantic_core.PydanticCustomError: If the folder has no `*.j2.typ` file.
+    """
+    if not any(custom_theme_folder.rglob("*.j2.typ")):
+        raise pydantic_core.PydanticCustomError(
+            CustomPydanticErrorTypes.other.value,
+            "The custom theme folder `{custom_theme_folder}` does not contain any"
+            " *.j2.typ files. It should contain at least one *.j2.typ file.",
+            {"custom_theme_folder": custom_theme_folder},
+        )
+
+
+@functools.lru_cache(maxsize=32)
+def create_theme_class_without_options(theme_name: str) -> type[pydantic.BaseModel]:
+    """Create the data model of a custom theme that has no `__init__.py`.
+
+    Why:
+        Defining a Pydantic class builds its schema, so the class is created
+        once per theme name instead of on every validation.
+
+    Args:
+        theme_name: Name of the custom theme.
+
+    Returns:
+        `ClassicTheme` subclass whose `theme` defaults to the theme's name.
+    """
+
+    class ThemeOptionsAreNotProvided(ClassicTheme):
+        theme: str = theme_name
+
+    return ThemeOptionsAreNotProvided
+
+
 def validate_design(design: Any, info: pydantic.ValidationInfo) -> Any:
     """Validate design options for built-in or custom themes with dynamic loading.
 
     Why:
         Users can use built-in themes or create custom themes in local folders.
-        Validation attempts built-in first, then falls back to dynamic import
-        of custom theme classes from theme folder's __init__.py.
+        Theme names that aren't built in skip the built-in validation and are
+        resolved as custom themes, whose classes are loaded from the theme
+        folder's __init__.py (see `load_custom_theme_class`).
 
     Args:
         design: Design dictionary to validate.
@@ -32,27 +153,33 @@ def validate_design(design: Any, info: pydantic.ValidationInfo) -> Any:
     Returns:
         Validated design model (built-in or custom theme class).
     """
-    try:
-        return built_in_design_adapter.validate_python(design)
-    except pydantic.ValidationError as e:
-        errors = e.errors()
-        # Detect if validation failed because the theme name doesn't match any
-        # built-in theme. Pydantic's discriminator errors include the discriminator
-        # field name in ctx. This format is tied to Pydantic's error structure:
-        custom_theme = False
-        for error in errors:
-            if (
-                "ctx" in error
-                and "discriminator" in error["ctx"]
-                and error["ctx"]["discriminator"] == "'theme'"
-            ):
-                custom_theme = True
-                break
-
-        if custom_theme:
-            pass
-        else:
-            raise e
+    if not (
+        isinstance(design, dict)
+        and "theme" in design
+        and design["theme"] not in available_themes
+    ):
+        try:
+            return built_in_design_adapter.validate_python(design)
+        except pydantic.ValidationError as e:
+            errors = e.errors()
+            # Detect if validation failed because the theme name doesn't match any
+            # built-in theme. Pydantic's discriminator errors include the
+            # discriminator field name in ctx. This format is tied to Pydantic's
+            # error structure:
+            custom_theme = False
+            for error in errors:
+                if (
+                    "ctx" in error
+                    and "discriminator" in error["ctx"]
+                    and error["ctx"]["discriminator"] == "'theme'"
+                ):
+                    custom_theme = True
+                    break
+
+            if custom_theme:
+                pass
+            else:
+                raise
 
     # Then it's a custom theme:
     input_file_path = get_input_file_path(info)
@@ -81,68 +208,28 @@ def validate_design(design: Any, info: pydantic.ValidationInfo) -> Any:
             " be in the same directory as the input file.",
             {"custom_theme_folder": custom_theme_folder.absolute()},
         )
-    # Check if at least there is one *.j2.typ file in the custom theme folder:
-    if not any(custom_theme_folder.rglob("*.j2.typ")):
-        raise pydantic_core.PydanticCustomError(
-            CustomPydanticErrorTypes.other.value,
-            "The custom theme folder `{custom_theme_folder}` does not contain any"
-            " *.j2.typ files. It should contain at least one *.j2.typ file.",
-            {"custom_theme_folder": custom_theme_folder.absolute()},
-        )
 
-    # Import __init__.py file from the custom theme folder if it exists:
     path_to_init_file = custom_theme_folder / "__init__.py"
-    if path_to_init_file.exists():
-        spec = importlib.util.spec_from_file_location(
-            "theme",
-            path_to_init_file,
-        )
-        if spec is None:
-            msg = f"Failed to load spec from {path_to_init_file}"
-            raise RenderCVInternalError(msg)
-
-        theme_module = importlib.util.module_from_spec(spec)
-        try:
-            if spec.loader is None:
-                msg = f"spec.loader is None for {path_to_init_file}"
-                raise RenderCVInternalError(msg)
-            spec.loader.exec_module(theme_module)
-        except SyntaxError as e:
-            raise pydantic_core.PydanticCustomError(
-                CustomPydanticErrorTypes.other.value,
-                "The custom theme {theme_name}'s __init__.py file has a syntax"
-                " error. Please fix it.",
-                {"theme_name": theme_name},
-            ) from e
-        except ImportError as e:
-            raise pydantic_core.PydanticCustomError(
-                CustomPydanticErrorTypes.other.value,
-                "The custom theme {theme_name}'s __init__.py file has an import error!"
-                " Check the import statements.",
-                {"theme_name": theme_name},
-            ) from e
-
-        model_name = f"{theme_name.capitalize()}Theme"
-        try:
-            theme_data_model_class = getattr(
-                theme_module,
-                model_name,
-            )
-        except AttributeError as e:
-            message = (
-                f"The custom theme {theme_name} does not have a {model_name} class."
-            )
-            raise ValueError(message) from e
+    init_file_hash = (
+        hashlib.sha256(path_to_init_file.read_bytes()).hexdigest()
+        if path_to_init_file.exists()
+        else None
+    )
+    check_custom_theme_templates(custom_theme_folder.absolute(), init_file_hash)
 
+    # Import __init__.py file from the custom theme folder if it exists:
+    if init_file_hash is not None:
+        theme_data_model_class = load_custom_theme_class(
+            custom_theme_folder.absolute(), init_file_hash
+        )
         # Initialize and validate the custom theme data model:
         theme_data_model = theme_data_model_class(**design)
     else:
         # Then it means there is no __init__.py file in the custom theme folder.
-        # Create a dummy data model and use that instead.
-        class ThemeOptionsAreNotProvided(ClassicTheme):
-            theme: str = theme_name
-
-        theme_data_model = ThemeOptionsAreNotProvided(theme=theme_name)
+        # Use a dummy data model instead.
+        theme_data_model = create_theme_class_without_options(theme_name)(
+            theme=theme_name
+        )
 
     return theme_data_model
 
@@ -87,10 +87,7 @@ class RenderCommand(BaseModelWithoutExtraKeys):
     dont_generate_markdown: bool = pydantic.Field(
         default=False,
         title="Don't Generate Markdown",
-        description=(
-            "Skip Markdown generation. This also disables HTML generation. The default"
-            " value is `false`."
-        ),
+        description=("Skip Markdown generation. The default value is `false`."),
     )
     dont_generate_html: bool = pydantic.Field(
         default=False,
@@ -115,3 +112,14 @@ class RenderCommand(BaseModelWithoutExtraKeys):
         title="Don't Generate PNG",
         description="Skip PNG generation. The default value is `false`.",
     )
+    narrow_fonts: bool = pydantic.Field(
+        default=False,
+        title="Narrow Fonts",
+        description=(
+            "Load only the font families in `design.typography.font_family` (and the"
+            " icon fonts) when generating PDF and PNG files, instead of all bundled"
+            " and system fonts. This makes compilation faster, but characters these"
+            " fonts don't cover (e.g., Chinese, Japanese, or Korean text) won't fall"
+            " back to other fonts. The default value is `false`."
+        ),
+    )
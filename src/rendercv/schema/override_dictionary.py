@@ -91,6 +91,48 @@ def update_value_by_location[T: dict | list](
     return dict_or_list
 
 
+def copy_containers_along_path(
+    dictionary: dict, key: str, copied_containers: set[int]
+) -> None:
+    """Replace the containers a dotted path passes through with shallow copies.
+
+    Why:
+        `update_value_by_location` modifies the containers along the path in
+        place. Copying only these containers, rather than the whole dictionary,
+        lets the overridden dictionary share every other subtree with the
+        original, which is what makes rendering many variants of one large CV
+        cheap. Containers that were already copied for an earlier override are
+        not copied again. Invalid paths are left to `update_value_by_location`
+        to report.
+
+    Args:
+        dictionary: Copy of the top-level dictionary to update.
+        key: Dotted path of the override.
+        copied_containers: Ids of the containers copied so far, updated in place.
+    """
+    container: dict | list = dictionary
+    for segment in key.split(".")[:-1]:
+        index: str | int = segment
+        if isinstance(container, list):
+            try:
+                index = int(segment)
+            except ValueError:
+                return
+            if not -len(container) <= index < len(container):
+                return
+        elif not isinstance(container, dict) or segment not in container:
+            return
+
+        child = container[index]
+        if not isinstance(child, dict | list):
+            return
+        if id(child) not in copied_containers:
+            child = copy.copy(child)
+            copied_containers.add(id(child))
+            container[index] = child
+        container = child
+
+
 def apply_overrides_to_dictionary[T: dict](
     dictionary: T,
     overrides: dict[str, str],
@@ -100,14 +142,17 @@ def apply_overrides_to_dictionary[T: dict](
     Why:
         Users need to test configuration changes without editing YAML files.
         Batching overrides ensures all modifications happen before validation,
-        preventing partial invalid states.
+        preventing partial invalid states. Only the containers on the overridden
+        paths are copied (see `copy_containers_along_path`), so the original is
+        never modified and the result shares its other subtrees.
 
     Example:
         ```py
-        data = {"cv": {"name": "John", "phone": "123"}}
+        data = {"cv": {"name": "John", "phone": "123"}, "design": {"theme": "classic"}}
         overrides = {"cv.name": "Jane", "cv.phone": "456"}
         result = apply_overrides_to_dictionary(data, overrides)
         assert result["cv"]["name"] == "Jane"
+        assert result["design"] is data["design"]
         ```
 
     Args:
@@ -115,10 +160,12 @@ def apply_overrides_to_dictionary[T: dict](
         overrides: Map of dotted paths to new values.
 
     Returns:
-        Deep copy with all overrides applied.
+        Copy with all overrides applied, sharing the subtrees they don't touch.
     """
-    new_dictionary = copy.deepcopy(dictionary)
+    new_dictionary = copy.copy(dictionary)
+    copied_containers = {id(new_dictionary)}
     for key, value in overrides.items():
+        copy_containers_along_path(new_dictionary, key, copied_containers)
         new_dictionary = update_value_by_location(new_dictionary, key, value, key)
 
     return new_dictionary
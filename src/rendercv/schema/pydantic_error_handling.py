@@ -250,6 +250,13 @@ def get_coordinates_of_a_key_in_a_yaml_object(
     coordinates = ((0, 0), (0, 0))
     # start from the first key and move forward:
     for location_key in location:
+        line_column = getattr(current_yaml_object, "lc", None)
+        if isinstance(current_yaml_object, dict) and (
+            line_column is None or location_key not in line_column.data
+        ):
+            # Values added by CLI overrides or theme/locale variants have no
+            # coordinates, so the closest parent with coordinates is used:
+            break
         current_yaml_object, coordinates = get_inner_yaml_object_from_its_key(
             current_yaml_object, location_key
         )
@@ -14,6 +14,7 @@ from rendercv.exception import (
     YamlSource,
 )
 
+from .incremental_validation import validate_rendercv_model_incrementally
 from .models.rendercv_model import RenderCVModel
 from .models.validation_context import ValidationContext
 from .override_dictionary import apply_overrides_to_dictionary
@@ -36,6 +37,7 @@ class BuildRendercvModelArguments(TypedDict, total=False):
     dont_generate_markdown: bool | None
     dont_generate_pdf: bool | None
     dont_generate_png: bool | None
+    narrow_fonts: bool | None
     overrides: dict[str, str] | None
 
 
@@ -102,19 +104,31 @@ def read_yaml_with_validation_errors(
 
 
 def build_rendercv_dictionary(
-    main_yaml_file: str,
+    main_yaml_file: str | CommentedMap,
     **kwargs: Unpack[BuildRendercvModelArguments],
 ) -> tuple[CommentedMap, dict[str, CommentedMap]]:
     """Merge main YAML with overlays and CLI overrides into final dictionary.
 
     Args:
-        main_yaml_file: Primary CV YAML content string.
+        main_yaml_file: Primary CV YAML content string, or its already parsed
+            contents.
         kwargs: Optional YAML overlay strings, output paths, generation flags, and CLI overrides.
 
     Returns:
         Tuple of merged dictionary and overlay source CommentedMaps (for error reporting).
     """
-    input_dict = read_yaml_with_validation_errors(main_yaml_file, "main_yaml_file")
+    if isinstance(main_yaml_file, str):
+        input_dict = read_yaml_with_validation_errors(main_yaml_file, "main_yaml_file")
+    else:
+        # Parsed documents may share unchanged containers with earlier versions
+        # (see `IncrementalYamlReader`), so the containers written to below are
+        # copied instead of modified:
+        input_dict = main_yaml_file.copy()
+        settings = input_dict.get("settings")
+        if isinstance(settings, dict):
+            input_dict["settings"] = settings = settings.copy()
+            if isinstance(settings.get("render_command"), dict):
+                settings["render_command"] = settings["render_command"].copy()
     input_dict.setdefault("settings", {}).setdefault("render_command", {})
 
     yaml_overlays: dict[OverlaySourceKey, str | None] = {
@@ -144,6 +158,7 @@ def build_rendercv_dictionary(
         "dont_generate_markdown": kwargs.get("dont_generate_markdown"),
         "dont_generate_pdf": kwargs.get("dont_generate_pdf"),
         "dont_generate_png": kwargs.get("dont_generate_png"),
+        "narrow_fonts": kwargs.get("narrow_fonts"),
     }
 
     for key, value in render_overrides.items():
@@ -173,15 +188,11 @@ def build_rendercv_model_from_commented_map(
         Validated RenderCVModel instance.
     """
     try:
-        validation_context = {
-            "context": ValidationContext(
-                input_file_path=input_file_path,
-                current_date=commented_map.get("settings", {}).get(
-                    "current_date", "today"
-                ),
-            )
-        }
-        model = RenderCVModel.model_validate(commented_map, context=validation_context)
+        validation_context = ValidationContext(
+            input_file_path=input_file_path,
+            current_date=commented_map.get("settings", {}).get("current_date", "today"),
+        )
+        model = validate_rendercv_model_incrementally(commented_map, validation_context)
     except pydantic.ValidationError as e:
         validation_errors = parse_validation_errors(e, commented_map, overlay_sources)
         raise RenderCVUserValidationError(validation_errors) from e
@@ -189,8 +200,58 @@ def build_rendercv_model_from_commented_map(
     return model
 
 
+def build_rendercv_model_variants(
+    commented_map: CommentedMap,
+    themes: list[str] | None = None,
+    locales: list[str] | None = None,
+    input_file_path: pathlib.Path | None = None,
+    overlay_sources: dict[str, CommentedMap] | None = None,
+) -> list[RenderCVModel]:
+    """Validate the merged dictionary once per theme and locale combination.
+
+    Why:
+        Rendering a CV in several themes or languages only changes `design` and
+        `locale`. All variants are validated from the same merged dictionary, so
+        `cv` and `settings` are validated once and reused from the validated
+        subtree pool, and only the design and locale variants are validated. A
+        theme replaces the input's `design.theme`, keeping its other design
+        options; a locale replaces the whole `locale` field, since its
+        translations belong to one language.
+
+    Args:
+        commented_map: Merged dictionary with line/column metadata.
+        themes: Themes to render with. If not given, the input's design is used.
+        locales: Locale languages to render with. If not given, the input's
+            locale is used.
+        input_file_path: Source file path for context and photo resolution.
+        overlay_sources: Per-section CommentedMaps from overlays (for correct error coordinates).
+
+    Returns:
+        Validated models, ordered by theme, then by locale.
+    """
+    models: list[RenderCVModel] = []
+    for theme in themes or [None]:
+        for locale in locales or [None]:
+            variant = commented_map.copy()
+            if theme is not None:
+                design = commented_map.get("design")
+                variant["design"] = (
+                    design.copy() if isinstance(design, dict) else CommentedMap()
+                )
+                variant["design"]["theme"] = theme
+            if locale is not None:
+                variant["locale"] = CommentedMap([("language", locale)])
+            models.append(
+                build_rendercv_model_from_commented_map(
+                    variant, input_file_path, overlay_sources
+                )
+            )
+
+    return models
+
+
 def build_rendercv_dictionary_and_model(
-    main_yaml_file: str,
+    main_yaml_file: str | CommentedMap,
     *,
     input_file_path: pathlib.Path | None = None,
     **kwargs: Unpack[BuildRendercvModelArguments],
@@ -198,7 +259,8 @@ def build_rendercv_dictionary_and_model(
     """Complete pipeline from raw YAML string to validated model.
 
     Args:
-        main_yaml_file: Primary CV YAML content string.
+        main_yaml_file: Primary CV YAML content string, or its already parsed
+            contents.
         input_file_path: Source file path for validation context (path resolution).
         kwargs: Optional YAML overlay strings, output paths, generation flags, and CLI overrides.
 
@@ -1,7 +1,11 @@
 import pathlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any
 
 import ruamel.yaml
-from ruamel.yaml.comments import CommentedMap
+from ruamel.yaml.comments import CommentedMap, CommentedSeq, LineCol
 from ruamel.yaml.scanner import RoundTripScanner
 
 from rendercv.exception import RenderCVInternalError, RenderCVUserError
@@ -49,7 +53,7 @@ def read_yaml(file_path_or_contents: pathlib.Path | str) -> CommentedMap:
     else:
         file_content = file_path_or_contents
 
-    yaml_as_dictionary: CommentedMap = yaml.load(file_content)
+    yaml_as_dictionary: CommentedMap = get_yaml_parser().load(file_content)
 
     if yaml_as_dictionary is None:
         message = "The input file is empty!"
@@ -80,10 +84,527 @@ class ScannerNoAlias(RoundTripScanner):
         self.fetch_plain()
 
 
-yaml = ruamel.yaml.YAML()
-yaml.Scanner = ScannerNoAlias
+def create_yaml_parser() -> ruamel.yaml.YAML:
+    """Create a round-trip YAML parser for RenderCV input files.
 
-# Disable ISO date parsing, keep it as a string:
-yaml.constructor.yaml_constructors["tag:yaml.org,2002:timestamp"] = (
-    lambda loader, node: loader.construct_scalar(node)
-)
+    Returns:
+        Parser treating `*` as plain text and keeping dates as strings.
+    """
+    yaml = ruamel.yaml.YAML()
+    yaml.Scanner = ScannerNoAlias
+
+    # Disable ISO date parsing, keep it as a string:
+    yaml.constructor.yaml_constructors["tag:yaml.org,2002:timestamp"] = (
+        lambda loader, node: loader.construct_scalar(node)
+    )
+    return yaml
+
+
+yaml_parsers = threading.local()
+
+
+def get_yaml_parser() -> ruamel.yaml.YAML:
+    """Get the calling thread's YAML parser.
+
+    Why:
+        A ruamel parser keeps the state of the document it is reading, so two
+        threads reading with one parser corrupt each other's documents. Each
+        thread reuses its own parser instead.
+
+    Returns:
+        Round-trip YAML parser.
+    """
+    yaml = getattr(yaml_parsers, "yaml", None)
+    if yaml is None:
+        yaml = yaml_parsers.yaml = create_yaml_parser()
+    return yaml
+
+
+# At most this many parsed blocks are kept by an `IncrementalYamlReader`:
+incremental_yaml_reader_cache_size = 8192
+
+# Where a block was placed in a document: its dedented text, line, indentation,
+# and the position of the token after it (see `IncrementalYamlReader.place_block`):
+type BlockPlacement = tuple[str, int, int, tuple[int, int] | None]
+
+# A mapping key with an empty value, whose value follows on the next lines:
+block_mapping_key_pattern = re.compile(r":[ ]*(#.*)?\r?\n?$")
+
+
+class NotSplittableError(Exception):
+    """A YAML block can't be split into independently parsed blocks."""
+
+
+class IncrementalYamlReader:
+    """Parse successive versions of a YAML document, reparsing only changed blocks.
+
+    Why:
+        Parsing with source coordinates is by far the slowest step of validating
+        a CV, and an editor re-validates the document after every keystroke. The
+        document is split by indentation into blocks (mapping keys and sequence
+        items such as entries), each parsed on its own and cached by its text.
+        Unchanged blocks are reused, and the containers are rebuilt with the same
+        values and coordinates `read_yaml` would produce. Anything that can't be
+        split safely (flow style at the top, document markers, tabs, duplicate
+        keys, syntax errors) falls back to `read_yaml`. Unchanged blocks are
+        shared between successive results, so results must not be modified.
+
+    Example:
+        ```py
+        reader = IncrementalYamlReader()
+        data = reader.read(yaml_string)
+        data = reader.read(edited_yaml_string)  # Only edited blocks are parsed
+        ```
+    """
+
+    def __init__(self) -> None:
+        # Parsed blocks by their dedented text, with coordinates relative to the
+        # block:
+        self.parsed_blocks: OrderedDict[str, CommentedMap | CommentedSeq] = (
+            OrderedDict()
+        )
+        # Blocks placed in the last document, by their placement:
+        self.placed_blocks: dict[BlockPlacement, CommentedMap | CommentedSeq] = {}
+
+    def read(self, file_contents: str) -> CommentedMap:
+        """Parse a version of the document.
+
+        Args:
+            file_contents: Raw YAML string.
+
+        Returns:
+            Dictionary with line/column metadata, equal to `read_yaml`'s result.
+        """
+        lines = file_contents.splitlines(keepends=True)
+        previous_placed_blocks = self.placed_blocks
+        self.placed_blocks = {}
+        try:
+            if any(
+                line.startswith(("---", "...", "%", "\t", "\ufeff")) for line in lines
+            ):
+                raise NotSplittableError
+            indents = [get_line_indent(line) for line in lines]
+            if not any(indent is not None for indent in indents):
+                raise NotSplittableError
+            return self.read_mapping(
+                lines, indents, 0, len(lines), 0, previous_placed_blocks
+            )
+        except (NotSplittableError, ruamel.yaml.YAMLError):
+            self.placed_blocks = {}
+            return read_yaml(file_contents)
+
+    def read_mapping(
+        self,
+        lines: list[str],
+        indents: list[int | None],
+        start: int,
+        end: int,
+        indent: int,
+        previous_placed_blocks: dict[BlockPlacement, CommentedMap | CommentedSeq],
+    ) -> CommentedMap:
+        """Build a block mapping from its keys' blocks.
+
+        Args:
+            lines: Lines of the document.
+            indents: Indentation of each line, None for blank and comment lines.
+            start: First line of the mapping.
+            end: Line after the mapping.
+            indent: Indentation of the mapping's keys.
+            previous_placed_blocks: Blocks placed in the previous document.
+
+        Returns:
+            The mapping.
+        """
+        mapping = CommentedMap()
+        # Sequences may be indented as much as their key, so dashes at the keys'
+        # indentation continue the previous key's block:
+        for block_start, block_end in split_blocks(
+            indents, start, end, indent, lines=lines, continuation_prefix="-"
+        ):
+            if lines[block_start].lstrip(" ").startswith("?"):
+                raise NotSplittableError
+
+            key, coordinates, value = self.read_mapping_key(
+                lines, indents, block_start, block_end, indent, previous_placed_blocks
+            )
+            if key in mapping:
+                # Let the full parse report the duplicate key:
+                raise NotSplittableError
+            mapping[key] = value
+            mapping._yaml_set_kv_line_col(key, coordinates)
+
+        first_key = next(iter(mapping))
+        mapping._yaml_set_line_col(*mapping.lc.data[first_key][:2])
+        return mapping
+
+    def read_mapping_key(
+        self,
+        lines: list[str],
+        indents: list[int | None],
+        start: int,
+        end: int,
+        indent: int,
+        previous_placed_blocks: dict[BlockPlacement, CommentedMap | CommentedSeq],
+    ) -> tuple[Any, list[int], Any]:
+        """Parse a mapping key's block, splitting its value further if possible.
+
+        Args:
+            lines: Lines of the document.
+            indents: Indentation of each line, None for blank and comment lines.
+            start: Line of the key.
+            end: Line after the key's value.
+            indent: Indentation of the key.
+            previous_placed_blocks: Blocks placed in the previous document.
+
+        Returns:
+            The key, the coordinates of the key and its value, and the value.
+        """
+        header = lines[start]
+        value_start = next(
+            (i for i in range(start + 1, end) if indents[i] is not None), None
+        )
+        if value_start is not None and block_mapping_key_pattern.search(header):
+            # Only the key's coordinates are used, so the empty value's position
+            # doesn't matter:
+            header_mapping = self.place_block(
+                [header], start, indent, previous_placed_blocks, (start + 1, 0)
+            )
+            if (
+                isinstance(header_mapping, CommentedMap)
+                and len(header_mapping) == 1
+                and next(iter(header_mapping.values())) is None
+            ):
+                key = next(iter(header_mapping))
+                value_indent = indents[value_start] or 0
+                try:
+                    if lines[value_start].lstrip(" ").startswith("- ") or (
+                        lines[value_start].strip() == "-"
+                    ):
+                        if value_indent < indent:
+                            raise NotSplittableError
+                        value = self.read_sequence(
+                            lines,
+                            indents,
+                            value_start,
+                            end,
+                            value_indent,
+                            previous_placed_blocks,
+                        )
+                    else:
+                        if value_indent <= indent:
+                            raise NotSplittableError
+                        value = self.read_mapping(
+                            lines,
+                            indents,
+                            value_start,
+                            end,
+                            value_indent,
+                            previous_placed_blocks,
+                        )
+                    key_line, key_column = header_mapping.lc.data[key][:2]
+                    return (
+                        key,
+                        [key_line, key_column, value.lc.line, value.lc.col],
+                        value,
+                    )
+                except NotSplittableError:
+                    pass
+
+        mapping = self.place_block(
+            lines[start:end],
+            start,
+            indent,
+            previous_placed_blocks,
+            get_next_token_position(lines, indents, end),
+        )
+        if not isinstance(mapping, CommentedMap) or len(mapping) != 1:
+            raise NotSplittableError
+        key = next(iter(mapping))
+        return key, list(mapping.lc.data[key]), mapping[key]
+
+    def read_sequence(
+        self,
+        lines: list[str],
+        indents: list[int | None],
+        start: int,
+        end: int,
+        indent: int,
+        previous_placed_blocks: dict[BlockPlacement, CommentedMap | CommentedSeq],
+    ) -> CommentedSeq:
+        """Build a block sequence from its items' blocks.
+
+        Args:
+            lines: Lines of the document.
+            indents: Indentation of each line, None for blank and comment lines.
+            start: First line of the sequence.
+            end: Line after the sequence.
+            indent: Indentation of the sequence's dashes.
+            previous_placed_blocks: Blocks placed in the previous document.
+
+        Returns:
+            The sequence.
+        """
+        sequence = CommentedSeq()
+        for block_start, block_end in split_blocks(indents, start, end, indent):
+            item_line = lines[block_start].lstrip(" ")
+            if not (item_line.startswith("- ") or item_line.strip() == "-"):
+                raise NotSplittableError
+            item_sequence = self.place_block(
+                lines[block_start:block_end],
+                block_start,
+                indent,
+                previous_placed_blocks,
+                get_next_token_position(lines, indents, block_end),
+            )
+            if not isinstance(item_sequence, CommentedSeq) or len(item_sequence) != 1:
+                raise NotSplittableError
+            sequence._yaml_set_idx_line_col(
+                len(sequence), list(item_sequence.lc.data[0])
+            )
+            sequence.append(item_sequence[0])
+
+        sequence._yaml_set_line_col(start, indent)
+        return sequence
+
+    def place_block(
+        self,
+        block_lines: list[str],
+        line_offset: int,
+        column_offset: int,
+        previous_placed_blocks: dict[BlockPlacement, CommentedMap | CommentedSeq],
+        next_token_position: tuple[int, int] | None,
+    ) -> Any:
+        """Parse a block, or reuse it from the cache, at its position in the document.
+
+        Args:
+            block_lines: Lines of the block.
+            line_offset: Line of the block in the document.
+            column_offset: Indentation of the block.
+            previous_placed_blocks: Blocks placed in the previous document.
+            next_token_position: Position of the first token after the block, or
+                None if unknown. An empty value at the end of the block is placed
+                there, as the full parse does.
+
+        Returns:
+            The parsed block with document coordinates.
+        """
+        text = "".join(
+            line[column_offset:]
+            if line[:column_offset].strip(" ") == ""
+            else line.lstrip(" ")
+            for line in block_lines
+        )
+        placement: BlockPlacement = (
+            text,
+            line_offset,
+            column_offset,
+            next_token_position,
+        )
+        placed_block = previous_placed_blocks.get(placement)
+        if placed_block is None:
+            parsed_block = self.parsed_blocks.get(text)
+            if parsed_block is None:
+                parsed_block = get_yaml_parser().load(text)
+                self.parsed_blocks[text] = parsed_block
+                if len(self.parsed_blocks) > incremental_yaml_reader_cache_size:
+                    self.parsed_blocks.popitem(last=False)
+            else:
+                self.parsed_blocks.move_to_end(text)
+            placed_block = copy_with_offset(parsed_block, line_offset, column_offset)
+            last_line = next(
+                (
+                    line
+                    for line in reversed(block_lines)
+                    if get_line_indent(line) is not None
+                ),
+                "",
+            )
+            if block_mapping_key_pattern.search(last_line) or (
+                last_line.strip().split("#")[0].strip() == "-"
+            ):
+                place_trailing_empty_value(
+                    placed_block,
+                    None if "#" in last_line else next_token_position,
+                )
+        self.placed_blocks[placement] = placed_block
+        return placed_block
+
+
+def get_line_indent(line: str) -> int | None:
+    """Get a line's indentation.
+
+    Args:
+        line: Line of a YAML document.
+
+    Returns:
+        Number of leading spaces, or None for blank and comment lines.
+    """
+    stripped_line = line.lstrip(" ")
+    if not stripped_line.strip() or stripped_line.startswith("#"):
+        return None
+    return len(line) - len(stripped_line)
+
+
+def get_next_token_position(
+    lines: list[str], indents: list[int | None], end: int
+) -> tuple[int, int] | None:
+    """Get the position of the first token after a block.
+
+    Args:
+        lines: Lines of the document.
+        indents: Indentation of each line, None for blank and comment lines.
+        end: Line after the block.
+
+    Returns:
+        Line and column of the next token, the end of the document if there is
+        none, or None if the document doesn't end with a line break.
+    """
+    for i in range(end, len(indents)):
+        indent = indents[i]
+        if indent is not None:
+            return i, indent
+    if lines and not lines[-1].endswith("\n"):
+        return None
+    return len(lines), 0
+
+
+def place_trailing_empty_value(
+    node: Any, next_token_position: tuple[int, int] | None
+) -> None:
+    """Move an empty value at the end of a block to the next token's position.
+
+    Why:
+        The parser places empty values (like `phone:` with nothing after it) at
+        the next token, which for the last value of a block lies outside it.
+
+    Args:
+        node: Placed block.
+        next_token_position: Position of the first token after the block, or
+            None if unknown.
+    """
+    while True:
+        if isinstance(node, CommentedMap) and node:
+            key = next(reversed(node))
+            if node[key] is None:
+                if next_token_position is None:
+                    raise NotSplittableError
+                node._yaml_set_kv_line_col(
+                    key, [*node.lc.data[key][:2], *next_token_position]
+                )
+                return
+            node = node[key]
+        elif isinstance(node, CommentedSeq) and node:
+            if node[-1] is None:
+                raise NotSplittableError
+            node = node[-1]
+        else:
+            return
+
+
+def split_blocks(
+    indents: list[int | None],
+    start: int,
+    end: int,
+    indent: int,
+    *,
+    lines: list[str] | None = None,
+    continuation_prefix: str | None = None,
+) -> list[tuple[int, int]]:
+    """Split lines into blocks that each start at the given indentation.
+
+    Blank and comment lines belong to the block before them.
+
+    Args:
+        indents: Indentation of each line, None for blank and comment lines.
+        start: First line.
+        end: Line after the last line.
+        indent: Indentation blocks start at.
+        lines: Lines of the document, needed for `continuation_prefix`.
+        continuation_prefix: Lines at the indentation that start with this prefix
+            continue the previous block instead of starting a new one.
+
+    Returns:
+        Start and end line of each block.
+    """
+    block_starts: list[int] = []
+    for i in range(start, end):
+        line_indent = indents[i]
+        if (
+            line_indent is None
+            or line_indent > indent
+            or (
+                line_indent == indent
+                and lines is not None
+                and continuation_prefix is not None
+                and lines[i][indent:].startswith(continuation_prefix)
+            )
+        ):
+            if not block_starts and line_indent is not None:
+                raise NotSplittableError
+            continue
+        if line_indent < indent:
+            raise NotSplittableError
+        block_starts.append(i)
+
+    if not block_starts:
+        raise NotSplittableError
+    block_ends = [*block_starts[1:], end]
+    return list(zip(block_starts, block_ends, strict=True))
+
+
+def copy_with_offset(node: Any, line_offset: int, column_offset: int) -> Any:
+    """Copy parsed YAML containers, moving their coordinates.
+
+    Args:
+        node: Parsed YAML node. Scalars are immutable and returned as is.
+        line_offset: Lines to add to every coordinate.
+        column_offset: Columns to add to every coordinate.
+
+    Returns:
+        Copy with moved coordinates.
+    """
+    if isinstance(node, CommentedMap):
+        copied_map = CommentedMap(
+            (key, copy_with_offset(value, line_offset, column_offset))
+            for key, value in node.items()
+        )
+        copy_line_col_with_offset(node.lc, copied_map.lc, line_offset, column_offset)
+        return copied_map
+
+    if isinstance(node, CommentedSeq):
+        copied_sequence = CommentedSeq(
+            copy_with_offset(item, line_offset, column_offset) for item in node
+        )
+        copy_line_col_with_offset(
+            node.lc, copied_sequence.lc, line_offset, column_offset
+        )
+        return copied_sequence
+
+    return node
+
+
+def copy_line_col_with_offset(
+    source: LineCol, target: LineCol, line_offset: int, column_offset: int
+) -> None:
+    """Copy a container's line and column record, moving every coordinate.
+
+    Args:
+        source: Coordinates of the original container.
+        target: Coordinates of the copy.
+        line_offset: Lines to add to every coordinate.
+        column_offset: Columns to add to every coordinate.
+    """
+    if source.line is not None and source.col is not None:
+        target.line = source.line + line_offset
+        target.col = source.col + column_offset
+    # Empty flow sequences have no item coordinates:
+    if source.data:
+        # Mapping entries hold key and value coordinates, sequence items only
+        # their own:
+        target.data = {
+            key: [
+                coordinate + (column_offset if index % 2 else line_offset)
+                for index, coordinate in enumerate(coordinates)
+            ]
+            for key, coordinates in source.data.items()
+        }
@@ -0,0 +1,246 @@
+import io
+import os
+import pathlib
+import threading
+from typing import Any
+
+import pytest
+
+from rendercv.cli.lsp_command.language_server import (
+    LanguageServer,
+    build_diagnostic,
+    convert_column_to_utf16,
+    get_diagnostics,
+    get_path_from_uri,
+    read_message,
+    write_message,
+)
+from rendercv.schema.sample_generator import create_sample_yaml_input_file
+from rendercv.schema.yaml_reader import IncrementalYamlReader
+
+sample_yaml = create_sample_yaml_input_file(file_path=None)
+
+
+class Client:
+    """Drives a language server running on a background thread through pipes."""
+
+    def __init__(self) -> None:
+        server_input, self.server_input = os.pipe()
+        self.server_output, server_output = os.pipe()
+        self.input_stream = os.fdopen(self.server_input, "wb")
+        self.output_stream = os.fdopen(self.server_output, "rb")
+        self.server = LanguageServer(
+            os.fdopen(server_input, "rb"), os.fdopen(server_output, "wb")
+        )
+        self.exit_code: int | None = None
+        self.thread = threading.Thread(target=self.run_server, daemon=True)
+        self.thread.start()
+
+    def run_server(self) -> None:
+        self.exit_code = self.server.serve()
+        self.server.output_stream.close()
+
+    def send(self, message: dict[str, Any]) -> None:
+        write_message(self.input_stream, {"jsonrpc": "2.0", **message})
+
+    def receive(self) -> dict[str, Any]:
+        message = read_message(self.output_stream)
+        assert message is not None
+        return message
+
+    def receive_diagnostics(self) -> dict[str, Any]:
+        while True:
+            message = self.receive()
+            if message.get("method") == "textDocument/publishDiagnostics":
+                return message["params"]
+
+    def open(self, uri: str, text: str) -> None:
+        self.send(
+            {
+                "method": "textDocument/didOpen",
+                "params": {
+                    "textDocument": {
+                        "uri": uri,
+                        "languageId": "yaml",
+                        "version": 1,
+                        "text": text,
+                    }
+                },
+            }
+        )
+
+    def change(self, uri: str, text: str, version: int) -> None:
+        self.send(
+            {
+                "method": "textDocument/didChange",
+                "params": {
+                    "textDocument": {"uri": uri, "version": version},
+                    "contentChanges": [{"text": text}],
+                },
+            }
+        )
+
+    def stop(self) -> int | None:
+        self.input_stream.close()
+        self.thread.join(timeout=30)
+        return self.exit_code
+
+
+@pytest.fixture
+def client():
+    client = Client()
+    client.send({"id": 1, "method": "initialize", "params": {}})
+    client.receive()
+    client.send({"method": "initialized", "params": {}})
+    yield client
+    client.stop()
+
+
+class TestMessages:
+    def test_round_trip(self):
+        stream = io.BytesIO()
+        message = {"jsonrpc": "2.0", "id": 1, "params": {"text": "Boğaziçi"}}
+
+        write_message(stream, message)
+        stream.seek(0)
+
+        assert read_message(stream) == message
+        assert read_message(stream) is None
+
+
+@pytest.mark.parametrize(
+    ("line", "column", "expected"),
+    [
+        ("abc", 2, 2),
+        ("ğüş: x", 4, 4),
+        ("😀: x", 1, 2),
+    ],
+)
+def test_convert_column_to_utf16(line: str, column: int, expected: int):
+    assert convert_column_to_utf16(line, column) == expected
+
+
+def test_get_path_from_uri(tmp_path: pathlib.Path):
+    assert get_path_from_uri(tmp_path.as_uri()) == tmp_path
+    assert get_path_from_uri("untitled:Untitled-1") is None
+
+
+def test_build_diagnostic_clamps_position():
+    diagnostic = build_diagnostic(["a: 1", "b: 2"], 5, 10, "message")
+
+    assert diagnostic["range"] == {
+        "start": {"line": 1, "character": 4},
+        "end": {"line": 1, "character": 4},
+    }
+
+
+class TestGetDiagnostics:
+    def test_valid_cv(self):
+        assert get_diagnostics(sample_yaml, IncrementalYamlReader(), None) == []
+
+    def test_reports_validation_error_at_its_location(self):
+        text = sample_yaml.replace("start_date: 2018-09", "start_date: invalid")
+        lines = text.splitlines()
+        section_line_number = lines.index("    education:")
+        line_number = lines.index("        start_date: invalid")
+
+        diagnostics = get_diagnostics(text, IncrementalYamlReader(), None)
+
+        assert [diagnostic["range"]["start"] for diagnostic in diagnostics] == [
+            {"line": section_line_number, "character": 4},
+            {"line": line_number, "character": 8},
+        ]
+        assert "start_date" in diagnostics[1]["message"]
+
+    def test_reports_syntax_error(self):
+        diagnostics = get_diagnostics(
+            "cv:\n  name: John Doe\n   phone: 123\n", IncrementalYamlReader(), None
+        )
+
+        assert len(diagnostics) == 1
+        assert "not a valid YAML file" in diagnostics[0]["message"]
+
+    @pytest.mark.parametrize(
+        "text", ["", "# comment\n", "just a string", "design:\n  theme: classic\n"]
+    )
+    def test_ignores_documents_that_are_not_cvs(self, text: str):
+        assert get_diagnostics(text, IncrementalYamlReader(), None) == []
+
+    def test_matches_full_validation_after_edits(self):
+        yaml_reader = IncrementalYamlReader()
+        get_diagnostics(sample_yaml, yaml_reader, None)
+        text = sample_yaml.replace("end_date: 2023-05", "end_date: 2016-05")
+
+        assert get_diagnostics(text, yaml_reader, None) == get_diagnostics(
+            text, IncrementalYamlReader(), None
+        )
+
+
+class TestLanguageServer:
+    def test_initialize(self):
+        client = Client()
+        client.send({"id": 1, "method": "initialize", "params": {}})
+
+        response = client.receive()
+
+        assert response["id"] == 1
+        assert response["result"]["capabilities"]["textDocumentSync"]["change"] == 1
+        client.stop()
+
+    def test_publishes_diagnostics_of_latest_version(self, client: Client):
+        uri = "untitled:cv.yaml"
+        client.open(uri, sample_yaml)
+        assert client.receive_diagnostics() == {
+            "uri": uri,
+            "version": 1,
+            "diagnostics": [],
+        }
+
+        client.change(uri, sample_yaml.replace("2018-09", "invalid"), 2)
+        client.change(uri, sample_yaml.replace("2018-09", "2018-13"), 3)
+        params = client.receive_diagnostics()
+        # Version 2 is only published if it was validated before version 3 arrived:
+        if params["version"] == 2:
+            params = client.receive_diagnostics()
+
+        assert params["version"] == 3
+        assert len(params["diagnostics"]) == 2
+
+    def test_clears_diagnostics_of_closed_document(self, client: Client):
+        uri = "untitled:cv.yaml"
+        client.open(uri, "cv:\n  name: [\n")
+        assert client.receive_diagnostics()["diagnostics"]
+
+        client.send(
+            {
+                "method": "textDocument/didClose",
+                "params": {"textDocument": {"uri": uri}},
+            }
+        )
+
+        assert client.receive_diagnostics() == {"uri": uri, "diagnostics": []}
+
+    def test_rejects_unknown_requests(self, client: Client):
+        client.send({"id": 2, "method": "textDocument/hover", "params": {}})
+
+        assert client.receive()["error"]["code"] == -32601
+
+    def test_rejects_requests_before_initialize(self):
+        client = Client()
+        client.send({"id": 1, "method": "shutdown"})
+
+        assert client.receive()["error"]["code"] == -32002
+        client.stop()
+
+    def test_exits_cleanly_after_shutdown(self, client: Client):
+        client.send({"id": 2, "method": "shutdown"})
+        assert client.receive() == {"jsonrpc": "2.0", "id": 2, "result": None}
+
+        client.send({"method": "exit"})
+
+        assert client.stop() == 0
+
+    def test_exits_with_error_without_shutdown(self, client: Client):
+        client.send({"method": "exit"})
+
+        assert client.stop() == 1
@@ -0,0 +1,57 @@
+import pytest
+
+from rendercv.cli.render_command.parse_variants_file import parse_variants_file
+from rendercv.exception import RenderCVUserError
+
+
+class TestParseVariantsFile:
+    def test_parses_csv_rows_without_empty_cells(self, tmp_path):
+        variants_file = tmp_path / "variants.csv"
+        variants_file.write_text(
+            "cv.headline, design.theme, \n"
+            'Backend Engineer, classic, ignored\n"Data, ML Engineer", ,\n',
+            encoding="utf-8",
+        )
+
+        assert parse_variants_file(variants_file) == [
+            {"cv.headline": "Backend Engineer", "design.theme": "classic"},
+            {"cv.headline": "Data, ML Engineer"},
+        ]
+
+    def test_parses_json_lines(self, tmp_path):
+        variants_file = tmp_path / "variants.jsonl"
+        variants_file.write_text(
+            '{"cv.headline": "Backend Engineer"}\n\n{"design.theme": "sb2nov"}\n',
+            encoding="utf-8",
+        )
+
+        assert parse_variants_file(variants_file) == [
+            {"cv.headline": "Backend Engineer"},
+            {"design.theme": "sb2nov"},
+        ]
+
+    @pytest.mark.parametrize(
+        ("content", "match"),
+        [
+            ('{"cv.headline": "A"}\n{"cv.headline": \n', "Line 2 .* not valid JSON"),
+            ('["cv.headline", "A"]\n', "Line 1 .* should be a JSON object"),
+            ("\n", "doesn't have any variants"),
+        ],
+    )
+    def test_rejects_invalid_json_lines(self, tmp_path, content, match):
+        variants_file = tmp_path / "variants.jsonl"
+        variants_file.write_text(content, encoding="utf-8")
+
+        with pytest.raises(RenderCVUserError, match=match):
+            parse_variants_file(variants_file)
+
+    def test_rejects_unknown_extension(self, tmp_path):
+        variants_file = tmp_path / "variants.yaml"
+        variants_file.write_text("cv.headline: A\n", encoding="utf-8")
+
+        with pytest.raises(RenderCVUserError, match="extensions"):
+            parse_variants_file(variants_file)
+
+    def test_rejects_missing_file(self, tmp_path):
+        with pytest.raises(RenderCVUserError, match="doesn't exist"):
+            parse_variants_file(tmp_path / "variants.csv")
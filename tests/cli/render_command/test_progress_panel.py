@@ -1,67 +1,14 @@
+import concurrent.futures
 import pathlib
 
 import pytest
 import typer
 
-from rendercv.cli.render_command.progress_panel import (
-    CompletedStep,
-    ProgressPanel,
-    format_validation_error_location,
-)
+from rendercv.cli.render_command.progress_panel import CompletedStep, ProgressPanel
+from rendercv.cli.render_command.progress_reporter import MemoryUse
 from rendercv.exception import RenderCVUserError, RenderCVValidationError
 
 
-class TestFormatValidationErrorLocation:
-    def test_returns_schema_location_when_available(self):
-        error = RenderCVValidationError(
-            schema_location=("cv", "email"),
-            yaml_location=((2, 3), (2, 8)),
-            yaml_source="main_yaml_file",
-            input="x",
-            message="m",
-        )
-
-        assert format_validation_error_location(error) == "cv.email"
-
-    def test_returns_yaml_source_and_single_coordinate_when_schema_location_missing(
-        self,
-    ):
-        error = RenderCVValidationError(
-            schema_location=None,
-            yaml_location=((3, 7), (3, 7)),
-            yaml_source="design_yaml_file",
-            input="x",
-            message="m",
-        )
-
-        assert format_validation_error_location(error) == "design_yaml_file: line 3"
-
-    def test_returns_yaml_source_and_range_when_schema_location_missing(self):
-        error = RenderCVValidationError(
-            schema_location=None,
-            yaml_location=((3, 7), (4, 2)),
-            yaml_source="main_yaml_file",
-            input="x",
-            message="m",
-        )
-
-        assert (
-            format_validation_error_location(error)
-            == "main_yaml_file: line 3 to line 4"
-        )
-
-    def test_returns_yaml_source_when_yaml_location_is_missing(self):
-        error = RenderCVValidationError(
-            schema_location=None,
-            yaml_location=None,
-            yaml_source="locale_yaml_file",
-            input="x",
-            message="m",
-        )
-
-        assert format_validation_error_location(error) == "locale_yaml_file"
-
-
 class TestProgressPanelUpdateProgress:
     def test_adds_step_to_completed_steps(self):
         panel = ProgressPanel(quiet=True)
@@ -84,6 +31,14 @@ class TestProgressPanelUpdateProgress:
         assert len(panel.completed_steps) == 1
         assert panel.completed_steps[0].paths == [path1, path2]
 
+    def test_stores_memory(self):
+        panel = ProgressPanel(quiet=True, measure_memory=True)
+
+        panel.update_progress("100", "Validated input", [], MemoryUse(1024, 0))
+
+        assert panel.completed_steps[0].memory == MemoryUse(1024, 0)
+        panel.print_progress_panel("Rendering your CV...")
+
     def test_handles_empty_paths(self):
         panel = ProgressPanel(quiet=True)
 
@@ -92,6 +47,17 @@ class TestProgressPanelUpdateProgress:
         assert len(panel.completed_steps) == 1
         assert panel.completed_steps[0].paths == []
 
+    def test_keeps_steps_reported_from_several_threads(self):
+        panel = ProgressPanel(quiet=True)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            for i in range(200):
+                executor.submit(panel.update_progress, "1", f"Step {i}", [])
+
+        assert sorted(step.message for step in panel.completed_steps) == sorted(
+            f"Step {i}" for i in range(200)
+        )
+
 
 class TestProgressPanelFinishProgress:
     def test_clears_completed_steps(self):
@@ -0,0 +1,219 @@
+import io
+import json
+import pathlib
+
+import pytest
+import typer
+
+from rendercv.cli.render_command.progress_reporter import (
+    JsonProgressReporter,
+    MemoryUse,
+    PlainProgressReporter,
+    SilentProgressReporter,
+    format_memory_use,
+    format_validation_error_location,
+)
+from rendercv.exception import RenderCVUserError, RenderCVValidationError
+
+validation_error = RenderCVValidationError(
+    schema_location=("cv", "email"),
+    yaml_location=((2, 3), (2, 8)),
+    yaml_source="main_yaml_file",
+    input="invalid",
+    message="Invalid email",
+)
+
+
+class TestFormatMemoryUse:
+    def test_formats_traced_peak(self):
+        assert format_memory_use(MemoryUse(3 * 1024 * 1024)) == "3.0 MiB"
+
+    def test_formats_peak_resident_set_size_increase(self):
+        assert (
+            format_memory_use(MemoryUse(1024 * 1024, 512 * 1024))
+            == "1.0 MiB, peak RSS +0.5 MiB"
+        )
+
+
+class TestFormatValidationErrorLocation:
+    def test_returns_schema_location_when_available(self):
+        error = RenderCVValidationError(
+            schema_location=("cv", "email"),
+            yaml_location=((2, 3), (2, 8)),
+            yaml_source="main_yaml_file",
+            input="x",
+            message="m",
+        )
+
+        assert format_validation_error_location(error) == "cv.email"
+
+    def test_returns_yaml_source_and_single_coordinate_when_schema_location_missing(
+        self,
+    ):
+        error = RenderCVValidationError(
+            schema_location=None,
+            yaml_location=((3, 7), (3, 7)),
+            yaml_source="design_yaml_file",
+            input="x",
+            message="m",
+        )
+
+        assert format_validation_error_location(error) == "design_yaml_file: line 3"
+
+    def test_returns_yaml_source_and_range_when_schema_location_missing(self):
+        error = RenderCVValidationError(
+            schema_location=None,
+            yaml_location=((3, 7), (4, 2)),
+            yaml_source="main_yaml_file",
+            input="x",
+            message="m",
+        )
+
+        assert (
+            format_validation_error_location(error)
+            == "main_yaml_file: line 3 to line 4"
+        )
+
+    def test_returns_yaml_source_when_yaml_location_is_missing(self):
+        error = RenderCVValidationError(
+            schema_location=None,
+            yaml_location=None,
+            yaml_source="locale_yaml_file",
+            input="x",
+            message="m",
+        )
+
+        assert format_validation_error_location(error) == "locale_yaml_file"
+
+
+class TestSilentProgressReporter:
+    def test_reports_nothing(self, capsys):
+        reporter = SilentProgressReporter()
+
+        reporter.update_progress("100", "Generated PDF", [pathlib.Path("cv.pdf")])
+        reporter.finish_progress()
+        reporter.print_user_error(RenderCVUserError(message="error"))
+        reporter.print_validation_errors([validation_error])
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err == ""
+
+    def test_exits_on_error(self):
+        reporter = SilentProgressReporter(exit_on_error=True)
+
+        with pytest.raises(typer.Exit) as exc_info:
+            reporter.print_user_error(RenderCVUserError(message="error"))
+
+        assert exc_info.value.exit_code == 1
+
+
+class TestPlainProgressReporter:
+    def test_writes_one_line_per_step(self):
+        file = io.StringIO()
+        reporter = PlainProgressReporter(file=file)
+
+        reporter.update_progress(
+            "150", "Generated PNG", [pathlib.Path("1.png"), pathlib.Path("2.png")]
+        )
+        reporter.update_progress("20", "Validated the input file", [])
+        reporter.finish_progress()
+
+        assert file.getvalue().splitlines() == [
+            "Generated PNG (150 ms): 1.png; 2.png",
+            "Validated the input file (20 ms)",
+            "Your CV is ready.",
+        ]
+
+    def test_writes_memory(self):
+        file = io.StringIO()
+        reporter = PlainProgressReporter(file=file, measure_memory=True)
+
+        reporter.update_progress(
+            "150", "Generated PDF", [pathlib.Path("cv.pdf")], MemoryUse(1024 * 1024)
+        )
+
+        assert file.getvalue() == "Generated PDF (150 ms, 1.0 MiB): cv.pdf\n"
+
+    def test_writes_errors_to_stderr(self, capsys):
+        file = io.StringIO()
+        reporter = PlainProgressReporter(file=file)
+
+        reporter.print_user_error(RenderCVUserError(message="test error"))
+        reporter.print_validation_errors([validation_error])
+
+        assert file.getvalue() == ""
+        assert capsys.readouterr().err.splitlines() == [
+            "Error: test error",
+            "There are validation errors!",
+            "cv.email: Invalid email (input: invalid)",
+        ]
+
+    def test_exits_on_error(self):
+        reporter = PlainProgressReporter(exit_on_error=True)
+
+        with pytest.raises(typer.Exit) as exc_info:
+            reporter.print_validation_errors([validation_error])
+
+        assert exc_info.value.exit_code == 1
+
+
+class TestJsonProgressReporter:
+    def test_writes_one_event_per_line(self):
+        file = io.StringIO()
+        reporter = JsonProgressReporter(file=file)
+
+        reporter.update_progress("150", "Generated PDF", [pathlib.Path("cv.pdf")])
+        reporter.finish_progress()
+
+        assert [json.loads(line) for line in file.getvalue().splitlines()] == [
+            {
+                "event": "step",
+                "message": "Generated PDF",
+                "time_ms": 150,
+                "paths": ["cv.pdf"],
+            },
+            {"event": "finished"},
+        ]
+
+    def test_writes_memory(self):
+        file = io.StringIO()
+        reporter = JsonProgressReporter(file=file, measure_memory=True)
+
+        reporter.update_progress(
+            "150", "Generated PDF", [], MemoryUse(1024 * 1024, 2048)
+        )
+
+        assert json.loads(file.getvalue())["memory"] == {
+            "traced_peak_bytes": 1024 * 1024,
+            "peak_rss_increase_bytes": 2048,
+        }
+
+    def test_writes_errors(self):
+        file = io.StringIO()
+        reporter = JsonProgressReporter(file=file)
+
+        reporter.print_user_error(RenderCVUserError(message="test error"))
+        reporter.print_validation_errors([validation_error])
+
+        assert [json.loads(line) for line in file.getvalue().splitlines()] == [
+            {"event": "error", "message": "test error"},
+            {
+                "event": "validation_errors",
+                "errors": [
+                    {
+                        "location": "cv.email",
+                        "input": "invalid",
+                        "message": "Invalid email",
+                    }
+                ],
+            },
+        ]
+
+    def test_exits_on_error(self):
+        reporter = JsonProgressReporter(file=io.StringIO(), exit_on_error=True)
+
+        with pytest.raises(typer.Exit) as exc_info:
+            reporter.print_user_error(RenderCVUserError(message="test error"))
+
+        assert exc_info.value.exit_code == 1
@@ -1,10 +1,22 @@
+import json
 import os
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from rendercv.cli.new_command.new_command import cli_command_new
-from rendercv.cli.render_command.render_command import cli_command_render
+from rendercv.cli.render_command.progress_panel import ProgressPanel
+from rendercv.cli.render_command.progress_reporter import (
+    PlainProgressReporter,
+    SilentProgressReporter,
+)
+from rendercv.cli.render_command.render_command import (
+    cli_command_render,
+    open_progress_reporter,
+    split_comma_separated_list,
+)
+from rendercv.exception import RenderCVUserError
+from rendercv.schema import rendercv_model_builder
 
 
 class TestCliCommandRender:
@@ -26,6 +38,7 @@ class TestCliCommandRender:
             "dont_generate_typst": False,
             "dont_generate_pdf": False,
             "dont_generate_png": False,
+            "narrow_fonts": False,
             "watch": False,
             "quiet": False,
             "yaml_field_override": None,
@@ -70,12 +83,17 @@ class TestCliCommandRender:
                 ],
                 [],
             ),
-            # dont_generate_markdown: skips markdown and HTML
+            # dont_generate_markdown: skips only markdown
             (
                 False,
                 {"dont_generate_markdown": True},
-                ["John_Doe_CV.typ", "John_Doe_CV.pdf", "John_Doe_CV_1.png"],
-                ["John_Doe_CV.md", "John_Doe_CV.html"],
+                [
+                    "John_Doe_CV.typ",
+                    "John_Doe_CV.pdf",
+                    "John_Doe_CV_1.png",
+                    "John_Doe_CV.html",
+                ],
+                ["John_Doe_CV.md"],
             ),
             # dont_generate_html: skips only HTML
             (
@@ -136,6 +154,22 @@ class TestCliCommandRender:
         for file in missing_files:
             assert not (rendercv_output / file).exists()
 
+    def test_reports_progress_as_json(self, input_file, capsys):
+        context = MagicMock()
+        context.args = []
+
+        cli_command_render(
+            input_file_name=input_file,
+            dont_generate_pdf=True,
+            dont_generate_png=True,
+            progress_format="json",
+            extra_data_model_override_arguments=context,
+        )
+
+        events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert events[-1] == {"event": "finished"}
+        assert all(event["event"] == "step" for event in events[:-1])
+
     def test_uses_custom_output_paths(self, input_file, default_arguments):
         custom_paths = {
             "typst_path": input_file.parent / "custom.typ",
@@ -177,6 +211,47 @@ class TestCliCommandRender:
         called_path = mock_run.call_args[0][0]
         assert called_path.is_absolute()
 
+    def test_renders_theme_and_locale_matrix(self, input_file, default_arguments):
+        cli_command_render(
+            input_file_name=input_file,
+            **{  # ty: ignore[invalid-argument-type]
+                **default_arguments,
+                "themes": "classic, moderncv",
+                "locales": "turkish",
+                "dont_generate_pdf": True,
+                "dont_generate_png": True,
+            },
+        )
+
+        rendercv_output = input_file.parent / "rendercv_output"
+        assert (rendercv_output / "John_Doe_CV_classic_turkish.typ").exists()
+        assert (rendercv_output / "John_Doe_CV_moderncv_turkish.md").exists()
+        assert not (rendercv_output / "John_Doe_CV.typ").exists()
+
+    def test_renders_variants(self, input_file, default_arguments):
+        variants_file = input_file.parent / "variants.csv"
+        variants_file.write_text(
+            "cv.headline,design.theme\nBackend Engineer,classic\nData Engineer,sb2nov\n",
+            encoding="utf-8",
+        )
+
+        cli_command_render(
+            input_file_name=input_file,
+            **{  # ty: ignore[invalid-argument-type]
+                **default_arguments,
+                "variants": variants_file,
+                "dont_generate_pdf": True,
+                "dont_generate_png": True,
+            },
+        )
+
+        rendercv_output = input_file.parent / "rendercv_output"
+        assert "Data Engineer" in (rendercv_output / "John_Doe_CV_2.typ").read_text(
+            encoding="utf-8"
+        )
+        assert (rendercv_output / "John_Doe_CV_1.typ").exists()
+        assert not (rendercv_output / "John_Doe_CV.typ").exists()
+
     @patch("rendercv.cli.render_command.render_command.run_function_if_files_change")
     def test_calls_watcher_when_watch_flag_is_true(
         self, mock_watcher, input_file, default_arguments
@@ -188,6 +263,51 @@ class TestCliCommandRender:
 
         mock_watcher.assert_called_once()
 
+    def test_parses_input_file_once(self, input_file, default_arguments):
+        with patch.object(
+            rendercv_model_builder, "read_yaml", wraps=rendercv_model_builder.read_yaml
+        ) as mock_read_yaml:
+            cli_command_render(
+                input_file_name=input_file,
+                **{
+                    **default_arguments,
+                    "dont_generate_pdf": True,
+                    "dont_generate_png": True,
+                },  # ty: ignore[invalid-argument-type]
+            )
+
+        mock_read_yaml.assert_called_once()
+
+    def test_parses_input_file_once_per_watch_render(
+        self, input_file, default_arguments
+    ):
+        def run_twice(_file_paths, function):
+            function()
+            function()
+
+        with (
+            patch(
+                "rendercv.cli.render_command.render_command.run_function_if_files_change",
+                side_effect=run_twice,
+            ),
+            patch.object(
+                rendercv_model_builder,
+                "read_yaml",
+                wraps=rendercv_model_builder.read_yaml,
+            ) as mock_read_yaml,
+        ):
+            cli_command_render(
+                input_file_name=input_file,
+                **{  # ty: ignore[invalid-argument-type]
+                    **default_arguments,
+                    "watch": True,
+                    "dont_generate_pdf": True,
+                    "dont_generate_png": True,
+                },
+            )
+
+        assert mock_read_yaml.call_count == 2
+
     @pytest.mark.parametrize(
         ("config_type", "config_content", "expected_in_output"),
         [
@@ -256,3 +376,42 @@ class TestCliCommandRender:
 
         typst_file = tmp_path / "rendercv_output" / "John_Doe_CV.typ"
         assert expected_in_output in typst_file.read_text()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("classic", ["classic"]),
+        ("classic, sb2nov,", ["classic", "sb2nov"]),
+        (" , ", None),
+    ],
+)
+def test_split_comma_separated_list(value, expected):
+    assert split_comma_separated_list(value) == expected
+
+
+class TestOpenProgressReporter:
+    @pytest.mark.parametrize(
+        ("progress_format", "quiet", "isatty", "expected_class"),
+        [
+            ("auto", False, True, ProgressPanel),
+            ("auto", False, False, PlainProgressReporter),
+            ("rich", False, False, ProgressPanel),
+            ("plain", False, True, PlainProgressReporter),
+            ("json", True, True, SilentProgressReporter),
+        ],
+    )
+    def test_picks_reporter(self, progress_format, quiet, isatty, expected_class):
+        with (
+            patch("sys.stdout.isatty", return_value=isatty),
+            open_progress_reporter(progress_format, quiet, False) as reporter,
+        ):
+            assert type(reporter) is expected_class
+
+    def test_rejects_unknown_format(self):
+        with (
+            pytest.raises(RenderCVUserError),
+            open_progress_reporter("xml", False, False),
+        ):
+            pass
@@ -1,18 +1,36 @@
+import concurrent.futures
+import io
+import json
 import os
 import pathlib
 import sys
+import time
+import tracemalloc
 from unittest.mock import patch
 
 import pytest
 import typer
 
 from rendercv.cli.render_command.progress_panel import ProgressPanel
+from rendercv.cli.render_command.progress_reporter import (
+    JsonProgressReporter,
+    SilentProgressReporter,
+)
 from rendercv.cli.render_command.run_rendercv import (
+    add_suffix_to_output_file_names,
+    add_variant_to_output_file_names,
+    build_rendercv_models,
     collect_input_file_paths,
+    get_peak_resident_set_size,
+    measure_memory,
+    read_main_yaml_file,
+    render_rendercv_models,
     run_rendercv,
     timed_step,
 )
-from rendercv.exception import RenderCVUserError
+from rendercv.exception import RenderCVUserError, RenderCVUserValidationError
+from rendercv.renderer.photo import build_rendercv_model
+from rendercv.schema.yaml_reader import read_yaml
 
 
 class TestTimedStep:
@@ -83,8 +101,276 @@ class TestTimedStep:
 
         assert result == 6
 
+    def test_reports_memory_when_measured(self):
+        progress = ProgressPanel(quiet=True, measure_memory=True)
+
+        result = timed_step("Validated the input file", progress, bytes, 1024)
+
+        assert result == bytes(1024)
+        assert len(progress.completed_steps) == 1
+        assert progress.completed_steps[0].memory is not None
+
+    def test_doesnt_measure_memory_by_default(self):
+        progress = ProgressPanel(quiet=True)
+
+        with patch(
+            "rendercv.cli.render_command.run_rendercv.measure_memory"
+        ) as mock_measure_memory:
+            timed_step("Generated PDF", progress, lambda: pathlib.Path("cv.pdf"))
+
+        mock_measure_memory.assert_not_called()
+        assert progress.completed_steps[0].memory is None
+
+
+class TestMeasureMemory:
+    def test_measures_python_allocations(self):
+        def allocate() -> int:
+            return len(bytearray(8 * 1024 * 1024))
+
+        result, memory = measure_memory(allocate)
+
+        assert result == 8 * 1024 * 1024
+        assert memory.traced_peak_bytes >= 8 * 1024 * 1024
+
+    def test_runs_overlapping_steps_one_at_a_time(self):
+        running_steps: list[int] = []
+        overlaps: list[bool] = []
+
+        def allocate() -> int:
+            running_steps.append(1)
+            overlaps.append(len(running_steps) > 1)
+            data = bytearray(8 * 1024 * 1024)
+            time.sleep(0.05)
+            running_steps.pop()
+            return len(data)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(measure_memory, allocate) for _ in range(2)]
+            results = [future.result() for future in futures]
+
+        assert overlaps == [False, False]
+        for result, memory in results:
+            assert result == 8 * 1024 * 1024
+            assert memory.traced_peak_bytes >= 8 * 1024 * 1024
+
+    def test_stops_tracing_it_started(self):
+        measure_memory(lambda: None)
+
+        assert not tracemalloc.is_tracing()
+
+    def test_leaves_tracing_started_elsewhere_running(self):
+        tracemalloc.start()
+        try:
+            measure_memory(lambda: None)
+
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_reports_peak_resident_set_size_increase(self):
+        _, memory = measure_memory(lambda: None)
+
+        if get_peak_resident_set_size() is None:
+            assert memory.peak_rss_increase_bytes is None
+        else:
+            assert memory.peak_rss_increase_bytes is not None
+            assert memory.peak_rss_increase_bytes >= 0
+
+
+class TestBuildRendercvModels:
+    def test_appends_variant_to_output_file_names(self, tmp_path):
+        models = build_rendercv_models(
+            "cv:\n  name: John Doe\n",
+            tmp_path / "cv.yaml",
+            ["classic", "sb2nov"],
+            ["turkish"],
+        )
+
+        assert [model.settings.render_command.pdf_path.name for model in models] == [
+            "NAME_IN_SNAKE_CASE_CV_classic_turkish.pdf",
+            "NAME_IN_SNAKE_CASE_CV_sb2nov_turkish.pdf",
+        ]
+
+    def test_applies_variant_overrides(self, tmp_path):
+        base = "cv:\n  name: John Doe\n  headline: Engineer\n"
+
+        models = build_rendercv_models(
+            base,
+            tmp_path / "cv.yaml",
+            None,
+            ["english", "turkish"],
+            [
+                {"cv.headline": "Backend Engineer"},
+                {"cv.headline": "Data Engineer", "design.theme": "sb2nov"},
+                {"settings.render_command.output_folder": "acme"},
+            ],
+        )
+
+        assert [
+            (model.cv.headline, model.design.theme, model.locale.language)
+            for model in models
+        ] == [
+            ("Backend Engineer", "classic", "english"),
+            ("Backend Engineer", "classic", "turkish"),
+            ("Data Engineer", "sb2nov", "english"),
+            ("Data Engineer", "sb2nov", "turkish"),
+            ("Engineer", "classic", "english"),
+            ("Engineer", "classic", "turkish"),
+        ]
+        assert [model.settings.render_command.pdf_path.name for model in models] == [
+            "NAME_IN_SNAKE_CASE_CV_1_classic_english.pdf",
+            "NAME_IN_SNAKE_CASE_CV_1_classic_turkish.pdf",
+            "NAME_IN_SNAKE_CASE_CV_2_sb2nov_english.pdf",
+            "NAME_IN_SNAKE_CASE_CV_2_sb2nov_turkish.pdf",
+            "NAME_IN_SNAKE_CASE_CV_classic_english.pdf",
+            "NAME_IN_SNAKE_CASE_CV_classic_turkish.pdf",
+        ]
+        assert models[-1].settings.render_command.output_folder == tmp_path / "acme"
+
+    def test_reports_variant_number_with_validation_errors(self, tmp_path):
+        with pytest.raises(RenderCVUserValidationError) as exc_info:
+            build_rendercv_models(
+                "cv:\n  name: John Doe\n",
+                tmp_path / "cv.yaml",
+                None,
+                None,
+                [{"cv.headline": "Engineer"}, {"cv.email": "invalid"}],
+            )
+
+        [error] = exc_info.value.validation_errors
+        assert error.schema_location == ("cv", "email")
+        assert error.message.startswith("Variant 2: ")
+
+
+class TestAddSuffixToOutputFileNames:
+    def test_does_not_modify_original_model(self, tmp_path):
+        model = build_rendercv_model("cv:\n  name: John Doe\n", tmp_path / "cv.yaml")
+
+        variant = add_suffix_to_output_file_names(model, "_2")
+
+        assert variant.settings.render_command.typst_path.name == (
+            "NAME_IN_SNAKE_CASE_CV_2.typ"
+        )
+        assert model.settings.render_command.typst_path.name == (
+            "NAME_IN_SNAKE_CASE_CV.typ"
+        )
+
+
+class TestAddVariantToOutputFileNames:
+    def test_does_not_modify_original_model(self, tmp_path):
+        model = build_rendercv_model("cv:\n  name: John Doe\n", tmp_path / "cv.yaml")
+
+        variant = add_variant_to_output_file_names(model)
+
+        assert variant.settings.render_command.png_path.name == (
+            "NAME_IN_SNAKE_CASE_CV_classic_english.png"
+        )
+        assert model.settings.render_command.png_path.name == (
+            "NAME_IN_SNAKE_CASE_CV.png"
+        )
+        assert variant._input_file_path == model._input_file_path
+
+
+class TestRenderRendercvModels:
+    @pytest.mark.parametrize(
+        ("photo", "themes", "max_workers"),
+        [
+            (None, ["classic", "moderncv"], 4),
+            ("https://example.com/photo.jpg", ["classic", "sb2nov"], 4),
+            # The photo is copied to one path at two different widths:
+            ("https://example.com/photo.jpg", ["classic", "moderncv"], 1),
+        ],
+    )
+    def test_compiles_on_thread_pool(self, tmp_path, photo, themes, max_workers):
+        yaml_content = "cv:\n  name: John Doe\n"
+        if photo:
+            yaml_content += f"  photo: {photo}\n"
+        with patch("rendercv.renderer.photo.start_photo_download"):
+            models = build_rendercv_models(
+                yaml_content, tmp_path / "cv.yaml", themes, None
+            )
+
+        with (
+            patch(
+                "rendercv.renderer.templater.model_processor.schedule_photo_download"
+            ),
+            patch(
+                "rendercv.cli.render_command.run_rendercv.variant_compilation_pool_size",
+                4,
+            ),
+            patch(
+                "rendercv.cli.render_command.run_rendercv.concurrent.futures"
+                ".ThreadPoolExecutor",
+                wraps=concurrent.futures.ThreadPoolExecutor,
+            ) as mock_executor,
+            patch("rendercv.cli.render_command.run_rendercv.generate_typst"),
+            patch("rendercv.cli.render_command.run_rendercv.generate_markdown"),
+            patch("rendercv.cli.render_command.run_rendercv.generate_html"),
+            patch(
+                "rendercv.cli.render_command.run_rendercv.generate_pdf"
+            ) as mock_generate_pdf,
+            patch("rendercv.cli.render_command.run_rendercv.generate_png"),
+        ):
+            render_rendercv_models(models, ProgressPanel(quiet=True))
+
+        mock_executor.assert_called_once_with(max_workers=max_workers)
+        assert mock_generate_pdf.call_count == 2
+
 
 class TestRunRendercv:
+    def test_renders_theme_and_locale_matrix(self, tmp_path):
+        yaml_file = tmp_path / "cv.yaml"
+        yaml_file.write_text("cv:\n  name: John Doe\n", encoding="utf-8")
+        progress = ProgressPanel(quiet=True)
+
+        with progress:
+            run_rendercv(
+                yaml_file,
+                progress,
+                themes=["classic", "sb2nov"],
+                locales=["english", "turkish"],
+                dont_generate_pdf=True,
+                dont_generate_png=True,
+            )
+
+        assert sorted(
+            path.name for path in (tmp_path / "rendercv_output").glob("*.typ")
+        ) == [
+            "John_Doe_CV_classic_english.typ",
+            "John_Doe_CV_classic_turkish.typ",
+            "John_Doe_CV_sb2nov_english.typ",
+            "John_Doe_CV_sb2nov_turkish.typ",
+        ]
+        output_folder = tmp_path / "rendercv_output"
+        assert 'locale-catalog-language: "tr"' in (
+            output_folder / "John_Doe_CV_sb2nov_turkish.typ"
+        ).read_text(encoding="utf-8")
+        assert (output_folder / "John_Doe_CV_sb2nov_turkish.typ").read_text(
+            encoding="utf-8"
+        ) != (output_folder / "John_Doe_CV_classic_turkish.typ").read_text(
+            encoding="utf-8"
+        )
+
+    def test_uses_parsed_main_yaml_file(self, tmp_path):
+        yaml_file = tmp_path / "cv.yaml"
+        yaml_file.write_text("cv:\n  name: John Doe\n", encoding="utf-8")
+        main_yaml_file = read_main_yaml_file(yaml_file)
+        yaml_file.unlink()
+        progress = ProgressPanel(quiet=True)
+
+        with progress:
+            run_rendercv(
+                yaml_file,
+                progress,
+                main_yaml_file=main_yaml_file,
+                dont_generate_pdf=True,
+                dont_generate_png=True,
+            )
+
+        assert (tmp_path / "rendercv_output" / "John_Doe_CV.typ").exists()
+        # The parsed document is shared with the caller, so it's left unchanged:
+        assert main_yaml_file == {"cv": {"name": "John Doe"}}
+
     def test_invalid_yaml(self, tmp_path):
         invalid_yaml = tmp_path / "invalid.yaml"
         invalid_yaml.write_text("invalid: yaml: content: :", encoding="utf-8")
@@ -171,8 +457,7 @@ design:
 
         with (
             patch(
-                "rendercv.cli.render_command.run_rendercv"
-                ".build_rendercv_dictionary_and_model",
+                "rendercv.cli.render_command.run_rendercv.build_rendercv_model",
                 side_effect=RenderCVUserError(message="test error"),
             ),
             pytest.raises(typer.Exit) as exc_info,
@@ -182,6 +467,69 @@ design:
 
         assert exc_info.value.exit_code == 1
 
+    def test_reports_to_any_progress_reporter(self, tmp_path):
+        yaml_file = tmp_path / "cv.yaml"
+        yaml_file.write_text("cv:\n  name: John Doe\n", encoding="utf-8")
+        file = io.StringIO()
+
+        run_rendercv(
+            yaml_file,
+            JsonProgressReporter(file=file),
+            dont_generate_pdf=True,
+            dont_generate_png=True,
+        )
+
+        events = [json.loads(line) for line in file.getvalue().splitlines()]
+        assert events[-1] == {"event": "finished"}
+        typst_event = next(
+            event for event in events if event.get("message") == "Generated Typst"
+        )
+        assert typst_event["paths"] == [
+            str(tmp_path / "rendercv_output" / "John_Doe_CV.typ")
+        ]
+
+    def test_reports_photo_url_that_cant_be_downloaded(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path / "cache"))
+        yaml_file = tmp_path / "cv.yaml"
+        yaml_file.write_text(
+            "cv:\n  name: John Doe\n  photo: http://127.0.0.1:1/photo.jpg\n",
+            encoding="utf-8",
+        )
+        file = io.StringIO()
+
+        run_rendercv(
+            yaml_file,
+            JsonProgressReporter(file=file),
+            dont_generate_typst=True,
+            dont_generate_pdf=True,
+            dont_generate_png=True,
+        )
+
+        events = [json.loads(line) for line in file.getvalue().splitlines()]
+        assert events[-1]["event"] == "error"
+        assert "Failed to download photo" in events[-1]["message"]
+
+    def test_silent_reporter_doesnt_exit(self, tmp_path):
+        yaml_file = tmp_path / "doesnt_exist.yaml"
+
+        run_rendercv(yaml_file, SilentProgressReporter())
+
+        assert not (tmp_path / "rendercv_output").exists()
+
+
+class TestReadMainYamlFile:
+    def test_returns_parsed_yaml(self, tmp_path):
+        yaml_file = tmp_path / "cv.yaml"
+        yaml_file.write_text("cv:\n  name: John Doe\n", encoding="utf-8")
+
+        assert read_main_yaml_file(yaml_file) == {"cv": {"name": "John Doe"}}
+
+    def test_returns_text_of_invalid_yaml(self, tmp_path):
+        yaml_file = tmp_path / "cv.yaml"
+        yaml_file.write_text("invalid: yaml: content: :", encoding="utf-8")
+
+        assert read_main_yaml_file(yaml_file) == "invalid: yaml: content: :"
+
 
 class TestCollectInputFilePaths:
     def test_returns_only_input_file_by_default(self, tmp_path):
@@ -275,3 +623,14 @@ class TestCollectInputFilePaths:
         result = collect_input_file_paths(yaml_file, design=cli_design)
 
         assert result["design"] == cli_design
+
+    def test_uses_parsed_main_yaml_file(self, tmp_path):
+        yaml_file = tmp_path / "cv.yaml"
+        main_yaml_file = read_yaml(
+            "cv:\n  name: John Doe\n"
+            "settings:\n  render_command:\n    design: my_design.yaml\n"
+        )
+
+        result = collect_input_file_paths(yaml_file, main_yaml_file=main_yaml_file)
+
+        assert result["design"] == (tmp_path / "my_design.yaml").resolve()
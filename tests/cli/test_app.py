@@ -1,6 +1,5 @@
 import json
 import pathlib
-import sys
 import time
 from unittest.mock import MagicMock, patch
 
@@ -60,22 +59,15 @@ class TestCliCommandNoArgs:
         assert "RenderCV is a command-line tool" in result.output
         mock_warn.assert_called_once()
 
+    @patch("rendercv.cli.app.warn_if_new_version_is_available")
+    @patch("rendercv.cli.lsp_command.lsp_command.LanguageServer")
+    def test_does_not_warn_for_language_server(self, mock_language_server, mock_warn):
+        mock_language_server.return_value.serve.return_value = 0
+        runner = CliRunner()
+        result = runner.invoke(app, ["lsp"])
 
-class TestGetCacheDir:
-    def test_returns_platform_appropriate_path(self):
-        cache_dir = get_cache_dir()
-
-        assert cache_dir.name == "rendercv"
-        if sys.platform == "darwin":
-            assert "Library/Caches" in str(cache_dir)
-        elif sys.platform == "win32":
-            assert "Local" in str(cache_dir)
-
-    def test_respects_xdg_cache_home_on_linux(self, tmp_path, monkeypatch):
-        monkeypatch.setattr("rendercv.cli.app.sys.platform", "linux")
-        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
-
-        assert get_cache_dir() == tmp_path / "rendercv"
+        assert result.exit_code == 0
+        mock_warn.assert_not_called()
 
 
 def test_get_version_cache_file():
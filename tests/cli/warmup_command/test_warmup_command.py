@@ -0,0 +1,45 @@
+import pathlib
+
+from rendercv.cli.warmup_command import warmup_command
+from rendercv.cli.warmup_command.warmup_command import (
+    cli_command_warmup,
+    compile_templates,
+    index_fonts,
+)
+from rendercv.renderer.pdf_png import get_font_index, get_font_paths
+
+
+class TestIndexFonts:
+    def test_stores_font_index(self, tmp_path: pathlib.Path, monkeypatch):
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path))
+
+        font_indexes_directory = index_fonts()
+
+        assert font_indexes_directory == tmp_path / "font_indexes"
+        assert len(list(font_indexes_directory.glob("*.json"))) == 1
+        assert get_font_index(get_font_paths(None))
+
+
+class TestCompileTemplates:
+    def test_fills_bytecode_cache(self, tmp_path: pathlib.Path, monkeypatch):
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path))
+
+        bytecode_directory = compile_templates()
+
+        assert bytecode_directory == tmp_path / "jinja2"
+        assert list(bytecode_directory.glob("*.cache"))
+
+
+class TestCliCommandWarmup:
+    def test_fills_all_caches(self, tmp_path: pathlib.Path, monkeypatch):
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path))
+        warmup_command.get_package_path.cache_clear()
+
+        try:
+            cli_command_warmup()
+        finally:
+            warmup_command.get_package_path.cache_clear()
+
+        assert list((tmp_path / "typst_packages").iterdir())
+        assert list((tmp_path / "font_indexes").glob("*.json"))
+        assert list((tmp_path / "jinja2").glob("*.cache"))
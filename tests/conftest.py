@@ -1,4 +1,5 @@
 import pathlib
+from collections.abc import Iterator
 
 import pytest
 from hypothesis import settings as hypothesis_settings
@@ -17,6 +18,18 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
+@pytest.fixture(autouse=True, scope="session")
+def isolated_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[pathlib.Path]:
+    """Keep persistent caches (compiled templates, Typst packages, etc.) out of the
+    user's real cache directory during tests."""
+    cache_dir = tmp_path_factory.mktemp("rendercv_cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(cache_dir))
+        yield cache_dir
+
+
 @pytest.fixture
 def update_testdata(request: pytest.FixtureRequest) -> bool:
     return request.config.getoption("--update-testdata")
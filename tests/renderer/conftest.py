@@ -1,7 +1,10 @@
 import filecmp
+import hashlib
+import http.server
 import itertools
 import pathlib
 import shutil
+import threading
 import types
 import typing
 from datetime import date as Date
@@ -10,6 +13,7 @@ import pydantic
 import pydantic_extra_types.phone_numbers as pydantic_phone_numbers
 import pytest
 
+from rendercv.renderer import photo
 from rendercv.schema.models.cv.cv import Cv
 from rendercv.schema.models.cv.entries.bullet import BulletEntry
 from rendercv.schema.models.cv.entries.education import EducationEntry
@@ -103,6 +107,67 @@ def compare_file_with_reference(
     return compare
 
 
+class PhotoServer(http.server.ThreadingHTTPServer):
+    """Local HTTP server serving one photo with ETag revalidation."""
+
+    content: bytes = b"photo data"
+    status: int = 200
+    received_headers: list[dict[str, str]]
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/photo.jpg"
+
+    @property
+    def etag(self) -> str:
+        return f'"{hashlib.sha256(self.content).hexdigest()[:16]}"'
+
+
+class PhotoRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        server = typing.cast(PhotoServer, self.server)
+        server.received_headers.append(dict(self.headers))
+        if server.status != 200:
+            self.send_error(server.status)
+        elif self.headers.get("If-None-Match") == server.etag:
+            self.send_response(304)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.send_header("ETag", server.etag)
+            self.send_header("Content-Length", str(len(server.content)))
+            self.end_headers()
+            self.wfile.write(server.content)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def photo_server(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> typing.Iterator[PhotoServer]:
+    """Serve a photo over HTTP and isolate the photo download cache.
+
+    Yields:
+        The running server. Its `content` and `status` can be changed.
+    """
+    monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path / "cache"))
+    photo.photo_downloads.clear()
+    photo.pending_photo_paths.clear()
+
+    server = PhotoServer(("127.0.0.1", 0), PhotoRequestHandler)
+    server.received_headers = []
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
 @pytest.fixture
 def minimal_rendercv_model() -> RenderCVModel:
     """Create a minimal RenderCVModel for testing.
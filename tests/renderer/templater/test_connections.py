@@ -6,9 +6,11 @@ import pytest
 from rendercv.exception import RenderCVInternalError
 from rendercv.renderer.templater.connections import (
     compute_connections,
+    compute_connections_for_html,
     compute_connections_for_markdown,
     compute_connections_for_typst,
     fontawesome_icons,
+    format_phone_number,
     parse_connections,
 )
 from rendercv.schema.models.cv.custom_connection import CustomConnection
@@ -145,6 +147,17 @@ class TestParseConnections:
 
         assert connections[0].body == expected_body
 
+    def test_phone_is_formatted_once_for_typst_and_markdown(self):
+        cv = create_cv(key_order=["phone"], phone="+14155552671")
+        model = create_rendercv_model(cv)
+        format_phone_number.cache_clear()
+
+        compute_connections_for_typst(model)
+        compute_connections_for_markdown(model)
+
+        assert format_phone_number.cache_info().misses == 1
+        assert format_phone_number.cache_info().hits == 1
+
     def test_website_connection_structure(self):
         cv = create_cv(key_order=["website"], website="https://example.com")
         model = create_rendercv_model(cv)
@@ -389,8 +402,34 @@ class TestComputeConnectionsForMarkdown:
         assert result[0] == "Office Hours"
 
 
+class TestComputeConnectionsForHtml:
+    def test_connection_with_url_formatted_as_html_link(self):
+        cv = create_cv(key_order=["email"], email="john@example.com")
+        model = create_rendercv_model(cv)
+
+        result = compute_connections_for_html(model)
+
+        assert result[0] == '<a href="mailto:john@example.com">john@example.com</a>'
+
+    def test_connection_without_url_is_plain_text(self):
+        cv = create_cv(key_order=["location"], location="New York, NY")
+        model = create_rendercv_model(cv)
+
+        result = compute_connections_for_html(model)
+
+        assert result[0] == "New York, NY"
+
+    def test_body_is_converted_from_markdown(self):
+        cv = create_cv(key_order=["location"], location="R&D *Lab*")
+        model = create_rendercv_model(cv)
+
+        result = compute_connections_for_html(model)
+
+        assert result[0] == "R&amp;D <em>Lab</em>"
+
+
 class TestComputeConnections:
-    @pytest.mark.parametrize("file_type", ["typst", "markdown"])
+    @pytest.mark.parametrize("file_type", ["typst", "markdown", "html"])
     def test_dispatches_to_correct_formatter(self, file_type):
         cv = create_cv(key_order=["email"], email="john@example.com")
         model = create_rendercv_model(cv, use_icons=True, make_links=True)
@@ -402,6 +441,8 @@ class TestComputeConnections:
 
         if file_type == "typst":
             assert "#connection-with-icon" in result[0]
+        elif file_type == "html":
+            assert result[0].startswith("<a href=")
         else:  # markdown
             assert result[0].startswith("[")
 
@@ -10,6 +10,7 @@ from rendercv.renderer.templater.date import (
     build_date_placeholders,
     compute_time_span_string,
     date_object_to_string,
+    format_date_object,
     format_date_range,
     format_single_date,
 )
@@ -229,6 +230,37 @@ def test_date_object_to_string(date, template, locale_kwargs, expected):
     assert result == expected
 
 
+class TestDateObjectToStringMemoization:
+    def test_formats_same_date_once(self):
+        format_date_object.cache_clear()
+
+        for _ in range(3):
+            date_object_to_string(
+                Date(2020, 1, 1),
+                locale=EnglishLocale(),
+                single_date_template="MONTH_NAME YEAR",
+            )
+
+        assert format_date_object.cache_info().misses == 1
+
+    def test_distinguishes_locales(self):
+        spanish_month_names = [f"Mes {i}" for i in range(1, 13)]
+
+        english = date_object_to_string(
+            Date(2020, 1, 1),
+            locale=EnglishLocale(),
+            single_date_template="MONTH_NAME YEAR",
+        )
+        spanish = date_object_to_string(
+            Date(2020, 1, 1),
+            locale=EnglishLocale(month_names=spanish_month_names),
+            single_date_template="MONTH_NAME YEAR",
+        )
+
+        assert english == "January 2020"
+        assert spanish == "Mes 1 2020"
+
+
 @pytest.mark.parametrize(
     ("date", "template", "locale_kwargs", "expected"),
     [
@@ -8,10 +8,14 @@ from hypothesis import strategies as st
 
 from rendercv.exception import RenderCVInternalError
 from rendercv.renderer.templater.entry_templates_from_input import (
+    EntryTemplatePlan,
     clean_trailing_parts,
+    compile_entry_template_plan,
+    get_entry_template_plan,
     process_authors,
     process_date,
     process_doi,
+    process_fields,
     process_highlights,
     process_summary,
     process_url,
@@ -904,3 +908,142 @@ class TestRenderEntryTemplatesWithMissingDegree:
         main = entry.main_column  # ty: ignore[unresolved-attribute]
         assert "PhD" in main
         assert " in " not in main
+
+
+class TestEntryTemplatePlan:
+    def test_expands_locale_phrases(self):
+        plan = EntryTemplatePlan(
+            {"main_column": "DEGREE_WITH_AREA"}, {"degree_with_area": "DEGREE in AREA"}
+        )
+
+        assert plan.entry_templates == {"main_column": "DEGREE in AREA"}
+        assert plan.used_placeholders == {"DEGREE", "AREA"}
+
+    def test_renders_like_substitution(self):
+        plan = EntryTemplatePlan(
+            {"main_column": "**NAME**, DEGREE in AREA -- LOCATION"}, {}
+        )
+
+        assert plan.render({"NAME": "MIT", "AREA": "CS", "LOCATION": "US"}) == {
+            "main_column": "**MIT**, CS -- US"
+        }
+
+    def test_compiles_templates_once_per_provided_fields(self):
+        plan = EntryTemplatePlan({"main_column": "NAME -- LOCATION"}, {})
+
+        with patch(
+            "rendercv.renderer.templater.entry_templates_from_input.remove_not_provided_placeholders",
+            wraps=remove_not_provided_placeholders,
+        ) as mock_remove:
+            first = plan.render({"NAME": "A"})
+            second = plan.render({"NAME": "B"})
+
+        assert first == {"main_column": "A"}
+        assert second == {"main_column": "B"}
+        mock_remove.assert_called_once()
+
+    def test_ignores_placeholder_like_field_values(self):
+        plan = EntryTemplatePlan({"main_column": "NAME LOCATION"}, {})
+
+        assert plan.render({"NAME": "LOCATION", "LOCATION": "X"}) == {
+            "main_column": "LOCATION X"
+        }
+
+
+class TestGetEntryTemplatePlan:
+    def test_reuses_plan_for_identical_templates_and_locale(self):
+        compile_entry_template_plan.cache_clear()
+
+        first = get_entry_template_plan(
+            "normal_entry", templates=Templates(), locale=EnglishLocale()
+        )
+        second = get_entry_template_plan(
+            "normal_entry", templates=Templates(), locale=EnglishLocale()
+        )
+
+        assert first is second
+
+    def test_compiles_separate_plan_per_locale(self):
+        templates = Templates(
+            education_entry=EducationEntryTemplate(main_column="DEGREE_WITH_AREA")
+        )
+
+        english = get_entry_template_plan(
+            "education_entry", templates=templates, locale=EnglishLocale()
+        )
+        french = get_entry_template_plan(
+            "education_entry",
+            templates=templates,
+            locale=locale_adapter.validate_python({"language": "french"}),
+        )
+
+        assert english.entry_templates["main_column"] == "DEGREE in AREA"
+        assert french.entry_templates["main_column"] == "DEGREE en AREA"
+
+
+class TestRenderEntryTemplatesWithStringProcessors:
+    def test_matches_separate_field_processing(self):
+        def processor(value: str) -> str:
+            return f"<{value}>"
+
+        def make_entry():
+            return EducationEntry.model_validate(
+                {
+                    "institution": "MIT",
+                    "area": "CS",
+                    "degree": "BS",
+                    "start_date": "2020-01",
+                    "end_date": "2024-05",
+                    "highlights": ["One", "Two"],
+                    "url": "https://example.com",
+                }
+            )
+
+        expected = process_fields(
+            render_entry_templates(
+                make_entry(),
+                templates=Templates(),
+                locale=EnglishLocale(),
+                show_time_span=True,
+                current_date=Date(2024, 1, 1),
+            ),
+            [processor],
+        )
+
+        result = render_entry_templates(
+            make_entry(),
+            templates=Templates(),
+            locale=EnglishLocale(),
+            show_time_span=True,
+            current_date=Date(2024, 1, 1),
+            entry_template_plans={},
+            string_processors=[processor],
+        )
+
+        assert result.model_dump() == expected.model_dump()  # ty: ignore[unresolved-attribute]
+
+    def test_processes_text_entries(self):
+        result = render_entry_templates(
+            "text",
+            templates=Templates(),
+            locale=EnglishLocale(),
+            show_time_span=False,
+            current_date=Date(2024, 1, 1),
+            string_processors=[str.upper],
+        )
+
+        assert result == "TEXT"
+
+    def test_fills_shared_plans(self):
+        entry_template_plans: dict[str, EntryTemplatePlan] = {}
+
+        render_entry_templates(
+            NormalEntry(name="A"),
+            templates=Templates(),
+            locale=EnglishLocale(),
+            show_time_span=False,
+            current_date=Date(2024, 1, 1),
+            entry_template_plans=entry_template_plans,
+        )
+
+        assert list(entry_template_plans) == ["normal_entry"]
@@ -1,3 +1,4 @@
+import concurrent.futures
 import string
 
 import pytest
@@ -6,7 +7,10 @@ from hypothesis import strategies as st
 
 from rendercv.renderer.templater.markdown_parser import (
     escape_typst_characters,
-    markdown_to_html,
+    get_html_markdown_parser,
+    get_markdown_parser,
+    html_lines_to_blocks,
+    markdown_to_inline_html,
     markdown_to_typst,
 )
 
@@ -306,7 +310,70 @@ class TestMarkdownToTypst:
         assert f"#emph[{word}]" in result
 
 
-def test_markdown_to_html():
-    assert (
-        markdown_to_html("Hello, **world**!") == "<p>Hello, <strong>world</strong>!</p>"
+class TestMarkdownToInlineHtml:
+    @pytest.mark.parametrize(
+        ("markdown_string", "expected"),
+        [
+            ("Hello, **world**!", "Hello, <strong>world</strong>!"),
+            ("*a* & b", "<em>a</em> &amp; b"),
+            ("[link](https://example.com)", '<a href="https://example.com">link</a>'),
+            ("# Not a heading", "# Not a heading"),
+            ("1. Not a list", "1. Not a list"),
+            ("", ""),
+        ],
     )
+    def test_converts_inline_markdown(self, markdown_string, expected):
+        assert markdown_to_inline_html(markdown_string) == expected
+
+    def test_keeps_list_markers_and_indentation(self):
+        result = markdown_to_inline_html(
+            "**Title**\n- *a*\n  - **b**\n!!! summary\n    `c`"
+        )
+
+        assert result == (
+            "<strong>Title</strong>\n- <em>a</em>\n  - <strong>b</strong>\n"
+            "!!! summary\n    <code>c</code>"
+        )
+
+    def test_doesnt_join_emphasis_across_lines(self):
+        assert markdown_to_inline_html("*a\nb*") == "*a\nb*"
+
+
+class TestHtmlLinesToBlocks:
+    def test_wraps_lines_in_paragraphs(self):
+        assert html_lines_to_blocks(["a", "", "b"]) == "<p>a</p>\n<p>b</p>"
+
+    def test_nests_sub_items(self):
+        result = html_lines_to_blocks(["- a", "  - b", "  - c", "- d", "e"])
+
+        assert result.splitlines() == [
+            "<ul>",
+            "<li>a",
+            "<ul>",
+            "<li>b</li>",
+            "<li>c</li>",
+            "</ul>",
+            "</li>",
+            "<li>d</li>",
+            "</ul>",
+            "<p>e</p>",
+        ]
+
+    def test_unwraps_summary(self):
+        assert html_lines_to_blocks(["!!! summary", "    text"]) == "<p>text</p>"
+
+    def test_returns_empty_string_for_no_lines(self):
+        assert html_lines_to_blocks([]) == ""
+
+
+def test_get_markdown_parser_returns_one_parser_per_thread():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        other_thread_parser = executor.submit(get_markdown_parser).result()
+
+    assert get_markdown_parser() is get_markdown_parser()
+    assert get_markdown_parser() is not other_thread_parser
+
+
+def test_get_html_markdown_parser_is_reused():
+    assert get_html_markdown_parser() is get_html_markdown_parser()
+    assert get_html_markdown_parser() is not get_markdown_parser()
@@ -1,14 +1,15 @@
+import pathlib
 from collections.abc import Callable
 from datetime import date as Date
-from unittest.mock import MagicMock, patch
 
 import pydantic
 import pytest
 
 from rendercv.exception import RenderCVUserError
+from rendercv.renderer.photo import wait_for_photo_download
+from rendercv.renderer.templater.entry_templates_from_input import process_fields
 from rendercv.renderer.templater.model_processor import (
     download_photo_from_url,
-    process_fields,
     process_model,
 )
 from rendercv.schema.models.cv.cv import Cv
@@ -210,89 +211,86 @@ class TestDownloadPhotoFromUrl:
         cv = Cv.model_validate({"name": "John Doe"})
         model = RenderCVModel(cv=cv)
 
-        download_photo_from_url(model)
-
-        assert model.cv.photo is None
+        assert download_photo_from_url(model) is model
 
     def test_skips_when_photo_is_local_path(self, tmp_path):
         cv = Cv.model_validate({"name": "John Doe"})
         model = RenderCVModel(cv=cv)
         model.cv.photo = tmp_path / "photo.jpg"
 
-        download_photo_from_url(model)
-
-        assert model.cv.photo == tmp_path / "photo.jpg"
+        assert download_photo_from_url(model) is model
 
-    def test_downloads_photo_from_url(self, tmp_path):
+    def test_downloads_photo_from_url(self, tmp_path, photo_server):
         cv = Cv.model_validate({"name": "John Doe"})
         model = RenderCVModel(cv=cv)
-        model.cv.photo = pydantic.HttpUrl("https://example.com/photo.jpg")
+        model.cv.photo = pydantic.HttpUrl(photo_server.url)
         model.settings.render_command.output_folder = tmp_path / "output"
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"photo data"
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
+        model = download_photo_from_url(model)
+        assert isinstance(model.cv.photo, pathlib.Path)
+        wait_for_photo_download(model.cv.photo)
 
-        with patch(
-            "rendercv.renderer.templater.model_processor.urllib.request.urlopen",
-            return_value=mock_response,
-        ) as mock_urlopen:
-            download_photo_from_url(model)
-
-        mock_urlopen.assert_called_once()
         assert model.cv.photo == tmp_path / "output" / "photo.jpg"
+        assert model.cv.photo.read_bytes() == b"photo data"
 
-    def test_uses_photo_jpg_fallback_when_no_filename_in_url(self, tmp_path):
+    def test_does_not_modify_given_model(self, tmp_path, photo_server):
         cv = Cv.model_validate({"name": "John Doe"})
         model = RenderCVModel(cv=cv)
-        model.cv.photo = pydantic.HttpUrl("https://example.com/")
+        model.cv.photo = pydantic.HttpUrl(photo_server.url)
         model.settings.render_command.output_folder = tmp_path / "output"
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"photo data"
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
+        result = download_photo_from_url(model)
+        assert isinstance(result.cv.photo, pathlib.Path)
+        wait_for_photo_download(result.cv.photo)
+
+        assert model.cv.photo == pydantic.HttpUrl(photo_server.url)
+        assert result.cv is not model.cv
+        assert result.cv.name == "John Doe"
+
+    def test_uses_photo_jpg_fallback_when_no_filename_in_url(
+        self, tmp_path, photo_server
+    ):
+        cv = Cv.model_validate({"name": "John Doe"})
+        model = RenderCVModel(cv=cv)
+        model.cv.photo = pydantic.HttpUrl(photo_server.url.removesuffix("photo.jpg"))
+        model.settings.render_command.output_folder = tmp_path / "output"
 
-        with patch(
-            "rendercv.renderer.templater.model_processor.urllib.request.urlopen",
-            return_value=mock_response,
-        ):
-            download_photo_from_url(model)
+        model = download_photo_from_url(model)
+        assert isinstance(model.cv.photo, pathlib.Path)
+        wait_for_photo_download(model.cv.photo)
 
         assert model.cv.photo == tmp_path / "output" / "photo.jpg"
+        assert model.cv.photo.read_bytes() == b"photo data"
 
-    def test_skips_download_when_file_already_exists(self, tmp_path):
+    def test_refreshes_existing_file_when_remote_photo_changed(
+        self, tmp_path, photo_server
+    ):
         cv = Cv.model_validate({"name": "John Doe"})
         model = RenderCVModel(cv=cv)
-        model.cv.photo = pydantic.HttpUrl("https://example.com/photo.jpg")
+        model.cv.photo = pydantic.HttpUrl(photo_server.url)
         output_dir = tmp_path / "output"
         output_dir.mkdir()
         (output_dir / "photo.jpg").write_bytes(b"existing")
         model.settings.render_command.output_folder = output_dir
 
-        with patch(
-            "rendercv.renderer.templater.model_processor.urllib.request.urlopen"
-        ) as mock_urlopen:
-            download_photo_from_url(model)
+        model = download_photo_from_url(model)
+        assert isinstance(model.cv.photo, pathlib.Path)
+        wait_for_photo_download(model.cv.photo)
 
-        mock_urlopen.assert_not_called()
         assert model.cv.photo == output_dir / "photo.jpg"
+        assert model.cv.photo.read_bytes() == b"photo data"
 
-    def test_raises_user_error_on_download_failure(self, tmp_path):
+    def test_raises_user_error_on_download_failure(self, tmp_path, photo_server):
+        photo_server.status = 404
         cv = Cv.model_validate({"name": "John Doe"})
         model = RenderCVModel(cv=cv)
-        model.cv.photo = pydantic.HttpUrl("https://example.com/photo.jpg")
+        model.cv.photo = pydantic.HttpUrl(photo_server.url)
         model.settings.render_command.output_folder = tmp_path / "output"
 
-        with (
-            patch(
-                "rendercv.renderer.templater.model_processor.urllib.request.urlopen",
-                side_effect=OSError("network error"),
-            ),
-            pytest.raises(RenderCVUserError) as exc_info,
-        ):
-            download_photo_from_url(model)
+        model = download_photo_from_url(model)
+        assert isinstance(model.cv.photo, pathlib.Path)
+        with pytest.raises(RenderCVUserError) as exc_info:
+            wait_for_photo_download(model.cv.photo)
 
         assert exc_info.value.message is not None
         assert "Failed to download photo" in exc_info.value.message
@@ -4,8 +4,12 @@ from hypothesis import strategies as st
 
 from rendercv.exception import RenderCVInternalError
 from rendercv.renderer.templater.string_processor import (
+    KeywordMatcher,
+    PlaceholderTemplate,
+    build_keyword_matcher,
     build_keyword_matcher_pattern,
     clean_url,
+    compile_placeholder_template,
     make_keywords_bold,
     substitute_placeholders,
 )
@@ -156,6 +160,48 @@ class TestSubstitutePlaceholders:
             assert key not in result
 
 
+class TestPlaceholderTemplate:
+    def test_splits_template_into_literals_and_slots(self):
+        template = PlaceholderTemplate(
+            "NAME_CV_YEAR_IN_TWO_DIGITS.pdf",
+            frozenset({"NAME", "YEAR", "YEAR_IN_TWO_DIGITS"}),
+        )
+
+        assert template.literals == ["", "_CV_", ".pdf"]
+        assert template.slots == ["NAME", "YEAR_IN_TWO_DIGITS"]
+
+    def test_renders_template_without_slots(self):
+        template = PlaceholderTemplate("  plain  ", frozenset({"NAME"}))
+
+        assert template.render({"NAME": "John"}) == "plain"
+
+    def test_reuses_compiled_template(self):
+        names = frozenset({"NAME"})
+
+        assert compile_placeholder_template(
+            "NAME", names
+        ) is compile_placeholder_template("NAME", names)
+
+    @settings(deadline=None)
+    @given(
+        placeholders=placeholder_dicts(),  # ty: ignore[missing-argument]
+        literal=st.text(max_size=20),
+    )
+    def test_matches_regex_substitution(
+        self, placeholders: dict[str, str], literal: str
+    ) -> None:
+        assume(placeholders)
+        string = literal.join(placeholders) + literal
+        pattern = build_keyword_matcher_pattern(frozenset(placeholders))
+
+        expected = pattern.sub(lambda m: placeholders[m.group(0)], string).strip()
+
+        assert (
+            PlaceholderTemplate(string, frozenset(placeholders)).render(placeholders)
+            == expected
+        )
+
+
 class TestCleanUrl:
     @pytest.mark.parametrize(
         ("url", "expected_clean_url"),
@@ -224,3 +270,53 @@ class TestBuildKeywordMatcherPattern:
         assert match is not None
         assert match.group(0) == long
         build_keyword_matcher_pattern.cache_clear()
+
+
+class TestKeywordMatcher:
+    def test_raises_error_for_empty_keywords(self):
+        with pytest.raises(RenderCVInternalError) as exc_info:
+            KeywordMatcher(frozenset())
+
+        assert "Keywords cannot be empty" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        ("text", "keywords", "word_boundary", "expected"),
+        [
+            ("Python 3 and Python", {"Python", "Python 3"}, True, [(0, 8), (13, 19)]),
+            ("I can read well", {"re"}, True, []),
+            ("I can read well", {"re"}, False, [(6, 8)]),
+            ("Use C++ and C#", {"C++", "C#"}, True, [(4, 7), (12, 14)]),
+            ("abcd", {"bc", "abc", "cd"}, False, [(0, 3)]),
+            ("xabcd", {"bc", "abcx", "cd"}, False, [(2, 4)]),
+            ("machine learning", {"learn", "machine learning"}, True, [(0, 16)]),
+        ],
+    )
+    def test_find_all(self, text, keywords, word_boundary, expected):
+        matcher = KeywordMatcher(frozenset(keywords), word_boundary=word_boundary)
+        assert matcher.find_all(text) == expected
+
+    def test_sub(self):
+        matcher = KeywordMatcher(frozenset({"a", "ab"}))
+        assert matcher.sub("abc a", lambda keyword: keyword.upper()) == "ABc A"
+
+    @settings(deadline=None)
+    @given(
+        text=st.text(alphabet="abc ,.-_1", max_size=60),
+        keywords=st.frozensets(
+            st.text(alphabet="abc1", min_size=1, max_size=4), min_size=1, max_size=8
+        ),
+        word_boundary=st.booleans(),
+    )
+    def test_agrees_with_regex_pattern(
+        self, text: str, keywords: frozenset[str], word_boundary: bool
+    ) -> None:
+        pattern = build_keyword_matcher_pattern(keywords, word_boundary=word_boundary)
+        matcher = build_keyword_matcher(keywords, word_boundary=word_boundary)
+        assert matcher.find_all(text) == [m.span() for m in pattern.finditer(text)]
+
+    def test_scales_to_many_keywords(self):
+        keywords = frozenset(f"keyword{i}" for i in range(5000))
+        matcher = KeywordMatcher(keywords, word_boundary=True)
+        text = "keyword1 keyword4999 keyword50000 " * 100
+
+        assert len(matcher.find_all(text)) == 200
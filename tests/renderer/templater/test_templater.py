@@ -0,0 +1,266 @@
+import concurrent.futures
+import pathlib
+
+import jinja2
+import pytest
+
+from rendercv.renderer.html import generate_html
+from rendercv.renderer.markdown import generate_markdown
+from rendercv.renderer.templater.templater import (
+    compile_built_in_templates,
+    get_jinja2_bytecode_cache,
+    get_jinja2_environment,
+    jinja2_environment_pool,
+    render_full_template,
+    resolve_templates,
+    templates_directory,
+    write_full_template,
+)
+from rendercv.renderer.typst import generate_typst
+from rendercv.schema.models.rendercv_model import RenderCVModel
+from rendercv.schema.rendercv_model_builder import build_rendercv_dictionary_and_model
+
+examples = sorted(
+    (pathlib.Path(__file__).parents[3] / "examples").glob("*.yaml"),
+    key=lambda file_path: file_path.name,
+)
+
+
+class TestCompileBuiltInTemplates:
+    def test_fills_bytecode_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path))
+
+        template_names = compile_built_in_templates()
+
+        assert "typst/Preamble.j2.typ" in template_names
+        assert "html/Full.html" in template_names
+        assert len(list((tmp_path / "jinja2").glob("*.cache"))) == len(template_names)
+
+    def test_cache_is_used_by_renders(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path))
+        compile_built_in_templates()
+        cached_files = {
+            path: path.stat().st_mtime_ns for path in (tmp_path / "jinja2").iterdir()
+        }
+
+        environment = get_jinja2_environment(tmp_path / "cv.yaml")
+        environment.get_template("typst/Header.j2.typ")
+
+        assert {
+            path: path.stat().st_mtime_ns for path in (tmp_path / "jinja2").iterdir()
+        } == cached_files
+
+
+class TestGetJinja2BytecodeCache:
+    def test_stores_compiled_templates_in_cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path))
+        bytecode_cache = get_jinja2_bytecode_cache()
+        assert bytecode_cache is not None
+
+        environment = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(templates_directory),
+            bytecode_cache=bytecode_cache,
+        )
+        environment.get_template("markdown/Header.j2.md")
+
+        assert list((tmp_path / "jinja2").glob("*.cache"))
+
+    def test_returns_none_if_cache_dir_is_not_writable(self, tmp_path, monkeypatch):
+        not_a_directory = tmp_path / "file"
+        not_a_directory.write_text("", encoding="utf-8")
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(not_a_directory))
+
+        assert get_jinja2_bytecode_cache() is None
+
+
+class TestGetJinja2Environment:
+    def test_reuses_environment_for_same_directory(self, tmp_path: pathlib.Path):
+        first = get_jinja2_environment(tmp_path / "cv1.yaml")
+        second = get_jinja2_environment(tmp_path / "cv2.yaml")
+
+        assert first is second
+
+    def test_keeps_environments_of_several_directories(self, tmp_path: pathlib.Path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        environment_a = get_jinja2_environment(tmp_path / "a" / "cv.yaml")
+        environment_b = get_jinja2_environment(tmp_path / "b" / "cv.yaml")
+
+        assert environment_a is not environment_b
+        assert get_jinja2_environment(tmp_path / "a" / "cv.yaml") is environment_a
+
+    def test_evicts_least_recently_used_environment(
+        self, tmp_path: pathlib.Path, monkeypatch
+    ):
+        monkeypatch.setattr(
+            "rendercv.renderer.templater.templater.jinja2_environment_pool_size", 2
+        )
+        jinja2_environment_pool.clear()
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+        environment_a = get_jinja2_environment(tmp_path / "a" / "cv.yaml")
+        get_jinja2_environment(tmp_path / "b" / "cv.yaml")
+        get_jinja2_environment(tmp_path / "a" / "cv.yaml")
+        get_jinja2_environment(tmp_path / "c" / "cv.yaml")
+
+        assert list(jinja2_environment_pool) == [tmp_path / "a", tmp_path / "c"]
+        assert get_jinja2_environment(tmp_path / "a" / "cv.yaml") is environment_a
+
+    def test_picks_up_new_user_templates(self, tmp_path: pathlib.Path):
+        input_file_path = tmp_path / "cv.yaml"
+        environment = get_jinja2_environment(input_file_path)
+        environment.get_template("markdown/Header.j2.md")
+
+        (tmp_path / "markdown").mkdir()
+        (tmp_path / "markdown" / "Header.j2.md").write_text("CUSTOM", encoding="utf-8")
+        new_environment = get_jinja2_environment(input_file_path)
+
+        assert new_environment is not environment
+        assert new_environment.get_template("markdown/Header.j2.md").render() == (
+            "CUSTOM"
+        )
+
+
+class TestResolveTemplates:
+    def test_resolves_each_template_once(self, minimal_rendercv_model: RenderCVModel):
+        templates = resolve_templates(minimal_rendercv_model, "typst")
+
+        assert set(templates) == {
+            "Header.j2.typ",
+            "Preamble.j2.typ",
+            "SectionBeginning.j2.typ",
+            "SectionEnding.j2.typ",
+            "entries/TextEntry.j2.typ",
+        }
+        assert all(
+            template.filename is not None
+            and pathlib.Path(template.filename).is_relative_to(templates_directory)
+            for template in templates.values()
+        )
+
+    def test_prefers_user_theme_templates(
+        self, tmp_path: pathlib.Path, minimal_rendercv_model: RenderCVModel
+    ):
+        theme_folder = tmp_path / minimal_rendercv_model.design.theme
+        (theme_folder / "entries").mkdir(parents=True)
+        (theme_folder / "entries" / "TextEntry.j2.typ").write_text(
+            "CUSTOM {{ entry }}", encoding="utf-8"
+        )
+        minimal_rendercv_model._input_file_path = tmp_path / "cv.yaml"
+
+        templates = resolve_templates(minimal_rendercv_model, "typst")
+
+        assert templates["entries/TextEntry.j2.typ"].filename == str(
+            theme_folder / "entries" / "TextEntry.j2.typ"
+        )
+        assert "CUSTOM Software Engineer" in render_full_template(
+            minimal_rendercv_model, "typst"
+        )
+
+    def test_markdown_templates_are_not_overridden_by_theme(
+        self, minimal_rendercv_model: RenderCVModel
+    ):
+        templates = resolve_templates(minimal_rendercv_model, "markdown")
+
+        assert "Preamble.j2.md" not in templates
+        assert templates["Header.j2.md"] == get_jinja2_environment(
+            minimal_rendercv_model._input_file_path
+        ).get_template("markdown/Header.j2.md")
+
+
+class TestWriteFullTemplate:
+    @pytest.mark.parametrize("file_type", ["typst", "markdown"])
+    def test_matches_render_full_template(
+        self,
+        tmp_path: pathlib.Path,
+        minimal_rendercv_model: RenderCVModel,
+        file_type,
+    ):
+        file_path = tmp_path / "cv.txt"
+
+        write_full_template(minimal_rendercv_model, file_type, file_path)
+
+        assert file_path.read_bytes() == render_full_template(
+            minimal_rendercv_model, file_type
+        ).encode("utf-8")
+        assert list(tmp_path.iterdir()) == [file_path]
+
+    def test_keeps_previous_file_if_rendering_fails(
+        self,
+        tmp_path: pathlib.Path,
+        minimal_rendercv_model: RenderCVModel,
+        monkeypatch,
+    ):
+        file_path = tmp_path / "cv.typ"
+        file_path.write_text("previous", encoding="utf-8")
+
+        def raise_error(*args, **kwargs):
+            raise RuntimeError
+
+        monkeypatch.setattr(
+            "rendercv.renderer.templater.templater.render_template", raise_error
+        )
+        with pytest.raises(RuntimeError):
+            write_full_template(minimal_rendercv_model, "typst", file_path)
+
+        assert file_path.read_text(encoding="utf-8") == "previous"
+        assert list(tmp_path.iterdir()) == [file_path]
+
+    def test_concurrent_writers_of_the_same_file(
+        self, tmp_path: pathlib.Path, minimal_rendercv_model: RenderCVModel
+    ):
+        file_path = tmp_path / "cv.typ"
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(
+                    write_full_template, minimal_rendercv_model, "typst", file_path
+                )
+                for _ in range(16)
+            ]
+            for future in futures:
+                future.result()
+
+        assert file_path.read_text(encoding="utf-8") == render_full_template(
+            minimal_rendercv_model, "typst"
+        )
+        assert list(tmp_path.iterdir()) == [file_path]
+
+
+def render_example(example: pathlib.Path, output_folder: pathlib.Path) -> None:
+    _, rendercv_model = build_rendercv_dictionary_and_model(
+        example.read_text(encoding="utf-8"),
+        input_file_path=example,
+        output_folder=output_folder,
+    )
+    generate_typst(rendercv_model)
+    generate_markdown(rendercv_model)
+    generate_html(rendercv_model)
+
+
+class TestConcurrentRendering:
+    def test_matches_serial_rendering(self, tmp_path: pathlib.Path):
+        for example in examples:
+            render_example(example, tmp_path / "serial" / example.stem)
+
+        jobs = [
+            (example, tmp_path / "concurrent" / str(i) / example.stem)
+            for i in range(4)
+            for example in examples
+        ]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(render_example, example, output_folder)
+                for example, output_folder in jobs
+            ]
+            for future in futures:
+                future.result()
+
+        for example, output_folder in jobs:
+            serial_folder = tmp_path / "serial" / example.stem
+            output_files = sorted(path.name for path in output_folder.iterdir())
+            assert output_files == sorted(path.name for path in serial_folder.iterdir())
+            for name in output_files:
+                assert (output_folder / name).read_bytes() == (
+                    serial_folder / name
+                ).read_bytes()
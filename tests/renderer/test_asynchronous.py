@@ -0,0 +1,139 @@
+import asyncio
+import pathlib
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from rendercv.exception import RenderCVUserValidationError
+from rendercv.renderer import asynchronous, photo
+from rendercv.renderer.asynchronous import async_build_model, async_render
+from rendercv.renderer.html import generate_html
+from rendercv.renderer.markdown import generate_markdown
+from rendercv.renderer.typst import generate_typst
+from rendercv.schema.rendercv_model_builder import build_rendercv_dictionary_and_model
+
+yaml_content = "cv:\n  name: John Doe\n  headline: Engineer\n"
+
+
+class TestAsyncBuildModel:
+    def test_reads_path(self, tmp_path: pathlib.Path):
+        input_file_path = tmp_path / "cv.yaml"
+        input_file_path.write_text(yaml_content, encoding="utf-8")
+
+        model = asyncio.run(async_build_model(input_file_path))
+
+        assert model.cv.name == "John Doe"
+        assert model._input_file_path == input_file_path
+
+    def test_applies_arguments(self, tmp_path: pathlib.Path):
+        model = asyncio.run(
+            async_build_model(
+                yaml_content,
+                output_folder=tmp_path,
+                overrides={"cv.headline": "Manager"},
+            )
+        )
+
+        assert model.cv.headline == "Manager"
+        assert model.settings.render_command.output_folder == tmp_path
+
+    def test_raises_validation_errors(self):
+        with pytest.raises(RenderCVUserValidationError):
+            asyncio.run(async_build_model("cv:\n  email: invalid\n"))
+
+    def test_starts_photo_download(self):
+        with (
+            patch.object(photo, "start_photo_download") as mock_start,
+            pytest.raises(RenderCVUserValidationError),
+        ):
+            asyncio.run(
+                async_build_model(
+                    "cv:\n  photo: https://example.com/photo.jpg\n  email: invalid\n"
+                )
+            )
+
+        mock_start.assert_called_once_with("https://example.com/photo.jpg")
+
+
+class TestAsyncRender:
+    def test_matches_synchronous_rendering(self, tmp_path: pathlib.Path):
+        _, expected_model = build_rendercv_dictionary_and_model(
+            yaml_content,
+            output_folder=tmp_path / "sync",
+            dont_generate_pdf=True,
+            dont_generate_png=True,
+        )
+        expected_paths = {
+            "typst": generate_typst(expected_model),
+            "markdown": generate_markdown(expected_model),
+            "html": generate_html(expected_model),
+        }
+
+        async def render():
+            model = await async_build_model(
+                yaml_content,
+                output_folder=tmp_path / "async",
+                dont_generate_pdf=True,
+                dont_generate_png=True,
+            )
+            return await async_render(model)
+
+        rendered_files = asyncio.run(render())
+
+        assert rendered_files["pdf"] is None
+        assert rendered_files["png"] is None
+        for key, expected_path in expected_paths.items():
+            assert expected_path is not None
+            assert rendered_files[key].name == expected_path.name
+            assert rendered_files[key].read_bytes() == expected_path.read_bytes()
+
+    def test_compiles_on_compilation_executor(self, tmp_path: pathlib.Path):
+        thread_names: list[str] = []
+
+        def record_thread_name(*args):
+            thread_names.append(threading.current_thread().name)
+
+        async def render():
+            model = await async_build_model(yaml_content, output_folder=tmp_path)
+            return await async_render(model)
+
+        with (
+            patch.object(asynchronous, "generate_pdf", side_effect=record_thread_name),
+            patch.object(asynchronous, "generate_png", side_effect=record_thread_name),
+        ):
+            asyncio.run(render())
+
+        assert len(thread_names) == 2
+        assert all(
+            name.startswith("rendercv-async-compilation") for name in thread_names
+        )
+
+    def test_cancellation_skips_remaining_steps(self, tmp_path: pathlib.Path):
+        markdown_started = threading.Event()
+        release_markdown = threading.Event()
+
+        def generate_markdown_slowly(*args):
+            markdown_started.set()
+            release_markdown.wait(timeout=10)
+
+        async def render_and_cancel():
+            model = await async_build_model(yaml_content, output_folder=tmp_path)
+            task = asyncio.create_task(async_render(model))
+            await asyncio.to_thread(markdown_started.wait, 10)
+            task.cancel()
+            release_markdown.set()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with (
+            patch.object(
+                asynchronous, "generate_markdown", side_effect=generate_markdown_slowly
+            ),
+            patch.object(asynchronous, "generate_typst") as mock_generate_typst,
+            patch.object(asynchronous, "generate_pdf") as mock_generate_pdf,
+        ):
+            asyncio.run(render_and_cancel())
+
+        mock_generate_typst.assert_not_called()
+        mock_generate_pdf.assert_not_called()
@@ -1,7 +1,6 @@
 import pytest
 
 from rendercv.renderer.html import generate_html
-from rendercv.renderer.markdown import generate_markdown
 from rendercv.schema.models.rendercv_model import RenderCVModel
 
 
@@ -20,11 +19,8 @@ def test_generate_html(
     )
 
     def generate_file(output_path):
-        model.settings.render_command.markdown_path = output_path.with_suffix(".md")
-        markdown_path = generate_markdown(model)
-
         model.settings.render_command.html_path = output_path
-        generate_html(model, markdown_path)
+        generate_html(model)
 
     reference_filename = f"{cv_variant}.html"
     assert compare_file_with_reference(generate_file, reference_filename)
@@ -1,14 +1,31 @@
+import concurrent.futures
+import json
+import os
 import pathlib
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
+import rendercv_fonts
 
 from rendercv.exception import RenderCVInternalError
 from rendercv.renderer.pdf_png import (
+    build_font_index,
+    compute_bundled_typst_packages_hash,
+    compute_font_paths_fingerprint,
     generate_pdf,
     generate_png,
+    get_font_index,
+    get_font_paths,
+    get_narrowed_font_paths,
     get_package_path,
+    get_required_font_families,
+    get_typst_compiler,
+    get_typst_fonts,
+    icon_font_families,
+    install_bundled_typst_packages,
     read_version_from_typst_toml,
+    typst_compiler_pool,
 )
 from rendercv.renderer.typst import generate_typst
 from rendercv.schema.models.design.built_in_design import available_themes
@@ -102,6 +119,287 @@ class TestGetPackagePath:
             read_version_from_typst_toml(toml_file)
 
 
+class TestGetPackagePathCache:
+    @pytest.fixture(autouse=True)
+    def bundled_package(self, tmp_path: pathlib.Path, monkeypatch):
+        bundled_path = tmp_path / "bundled"
+        bundled_path.mkdir()
+        (bundled_path / "typst.toml").write_text(
+            '[package]\nname = "example"\nversion = "1.0.0"\n', encoding="utf-8"
+        )
+        (bundled_path / "lib.typ").write_text("#let x = 1", encoding="utf-8")
+        monkeypatch.setattr(
+            "rendercv.renderer.pdf_png.bundled_typst_packages",
+            [(bundled_path, "example", ["lib.typ"])],
+        )
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path / "cache"))
+        get_package_path.cache_clear()
+        yield bundled_path
+        get_package_path.cache_clear()
+
+    def test_installs_into_cache_dir(self, tmp_path: pathlib.Path):
+        result = get_package_path()
+
+        assert result.parent == tmp_path / "cache" / "typst_packages"
+        assert (result / "preview" / "example" / "1.0.0" / "lib.typ").is_file()
+
+    def test_reuses_installation_across_processes(self):
+        first_result = get_package_path()
+        marker = first_result / "marker"
+        marker.touch()
+
+        get_package_path.cache_clear()
+        assert get_package_path() == first_result
+        assert marker.exists()
+
+    def test_reinstalls_when_package_contents_change(
+        self, bundled_package: pathlib.Path
+    ):
+        first_result = get_package_path()
+
+        (bundled_package / "lib.typ").write_text("#let x = 2", encoding="utf-8")
+        get_package_path.cache_clear()
+        second_result = get_package_path()
+
+        assert second_result != first_result
+        assert (second_result / "preview" / "example" / "1.0.0" / "lib.typ").read_text(
+            encoding="utf-8"
+        ) == "#let x = 2"
+
+    def test_uses_installation_of_concurrent_process(self, monkeypatch):
+        installed_by_other_process: list[pathlib.Path] = []
+
+        def install_and_lose_race(temp_dir: pathlib.Path) -> None:
+            install_bundled_typst_packages(temp_dir)
+            # Another process renames its installation into place first:
+            other_temp_dir = temp_dir.parent / ".tmp-other"
+            install_bundled_typst_packages(other_temp_dir)
+            target = temp_dir.parent / compute_bundled_typst_packages_hash()
+            other_temp_dir.rename(target)
+            installed_by_other_process.append(target)
+
+        monkeypatch.setattr(
+            "rendercv.renderer.pdf_png.install_bundled_typst_packages",
+            install_and_lose_race,
+        )
+        result = get_package_path()
+
+        assert [result] == installed_by_other_process
+        assert [p.name for p in result.parent.iterdir()] == [result.name]
+
+    def test_removes_stale_installations(self, tmp_path: pathlib.Path):
+        packages_directory = tmp_path / "cache" / "typst_packages"
+        stale = packages_directory / "stale"
+        recent = packages_directory / "recent"
+        stale.mkdir(parents=True)
+        recent.mkdir()
+        os.utime(stale, (0, 0))
+
+        result = get_package_path()
+
+        assert sorted(packages_directory.iterdir()) == sorted([recent, result])
+
+    def test_falls_back_to_temporary_directory(
+        self, tmp_path: pathlib.Path, monkeypatch
+    ):
+        not_a_directory = tmp_path / "file"
+        not_a_directory.write_text("", encoding="utf-8")
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(not_a_directory))
+
+        result = get_package_path()
+
+        assert not result.is_relative_to(not_a_directory)
+        assert (result / "preview" / "example" / "1.0.0" / "lib.typ").is_file()
+
+
+class TestGetTypstCompiler:
+    @pytest.fixture(autouse=True)
+    def package_path(self, tmp_path: pathlib.Path):
+        with patch("rendercv.renderer.pdf_png.get_package_path", return_value=tmp_path):
+            typst_compiler_pool.clear()
+            yield
+            typst_compiler_pool.clear()
+
+    def test_reuses_compiler_for_same_fonts_and_root(self, tmp_path: pathlib.Path):
+        first = get_typst_compiler(tmp_path / "a" / "cv.yaml", tmp_path)
+        second = get_typst_compiler(tmp_path / "b" / "cv.yaml", tmp_path)
+
+        assert first is second
+
+    def test_gives_each_thread_its_own_compiler(self, tmp_path: pathlib.Path):
+        compiler = get_typst_compiler(None, tmp_path)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            other_compiler = executor.submit(
+                get_typst_compiler, None, tmp_path
+            ).result()
+
+        assert other_compiler is not compiler
+        assert get_typst_compiler(None, tmp_path) is compiler
+
+    def test_threads_share_a_pool_entry(self, tmp_path: pathlib.Path):
+        compiler = get_typst_compiler(None, tmp_path)
+        with (
+            patch("rendercv.renderer.pdf_png.typst_compiler_pool_size", 1),
+            concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor,
+        ):
+            barrier = threading.Barrier(4)
+
+            def get_compiler_on_each_thread() -> None:
+                barrier.wait()
+                get_typst_compiler(None, tmp_path)
+
+            for future in [
+                executor.submit(get_compiler_on_each_thread) for _ in range(4)
+            ]:
+                future.result()
+
+        assert len(typst_compiler_pool) == 1
+        assert get_typst_compiler(None, tmp_path) is compiler
+
+    def test_shares_fonts_between_roots(self, tmp_path: pathlib.Path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        get_typst_fonts.cache_clear()
+        get_typst_compiler(tmp_path / "cv.yaml", tmp_path / "a")
+        get_typst_compiler(tmp_path / "cv.yaml", tmp_path / "b")
+
+        assert len(typst_compiler_pool) == 2
+        assert get_typst_fonts.cache_info().misses == 1
+
+    def test_includes_user_fonts_folder_only_if_it_exists(self, tmp_path: pathlib.Path):
+        input_file_path = tmp_path / "cv.yaml"
+        assert tmp_path / "fonts" not in get_font_paths(input_file_path)
+
+        (tmp_path / "fonts").mkdir()
+        assert get_font_paths(input_file_path)[-1] == tmp_path / "fonts"
+
+    def test_evicts_least_recently_used_compiler(self, tmp_path: pathlib.Path):
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+        with patch("rendercv.renderer.pdf_png.typst_compiler_pool_size", 2):
+            first = get_typst_compiler(None, tmp_path / "a")
+            get_typst_compiler(None, tmp_path / "b")
+            get_typst_compiler(None, tmp_path / "a")
+            get_typst_compiler(None, tmp_path / "c")
+
+        assert [root for *_, root in typst_compiler_pool] == [
+            tmp_path / "a",
+            tmp_path / "c",
+        ]
+        assert get_typst_compiler(None, tmp_path / "a") is first
+
+
+class TestNarrowFonts:
+    @pytest.fixture(autouse=True)
+    def package_path(self, tmp_path: pathlib.Path, monkeypatch):
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path / "cache"))
+        with patch("rendercv.renderer.pdf_png.get_package_path", return_value=tmp_path):
+            typst_compiler_pool.clear()
+            yield
+            typst_compiler_pool.clear()
+
+    @pytest.fixture
+    def bundled_font_paths(self) -> tuple[pathlib.Path, ...]:
+        return get_font_paths(None)
+
+    def test_required_font_families(self, minimal_rendercv_model: RenderCVModel):
+        assert get_required_font_families(minimal_rendercv_model) == (
+            {"Source Sans 3"} | icon_font_families
+        )
+
+    def test_stores_font_index_on_disk(self, bundled_font_paths):
+        with patch(
+            "rendercv.renderer.pdf_png.build_font_index", wraps=build_font_index
+        ) as mock_build_font_index:
+            first = get_font_index(bundled_font_paths)
+            second = get_font_index(bundled_font_paths)
+
+        mock_build_font_index.assert_called_once()
+        assert first == second
+        assert first["Source Sans 3"] == [
+            pathlib.Path(rendercv_fonts.path_of["Source Sans 3"])
+        ]
+
+    def test_stores_font_indexes_built_concurrently(self, tmp_path: pathlib.Path):
+        font_paths = [(tmp_path / "a",), (tmp_path / "b",)]
+        for (folder,) in font_paths:
+            folder.mkdir()
+        barrier = threading.Barrier(len(font_paths))
+        replace = pathlib.Path.replace
+
+        def replace_at_once(self: pathlib.Path, target: pathlib.Path) -> pathlib.Path:
+            # Both threads have written their temporary files by now:
+            barrier.wait()
+            return replace(self, target)
+
+        with (
+            patch(
+                "rendercv.renderer.pdf_png.build_font_index",
+                side_effect=lambda font_paths: {"Family": list(font_paths)},
+            ),
+            patch.object(pathlib.Path, "replace", replace_at_once),
+            concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor,
+        ):
+            for future in [
+                executor.submit(get_font_index, paths) for paths in font_paths
+            ]:
+                future.result()
+
+        font_indexes_folder = tmp_path / "cache" / "font_indexes"
+        for paths in font_paths:
+            stored_font_index = json.loads(
+                (
+                    font_indexes_folder
+                    / f"{compute_font_paths_fingerprint(paths)}.json"
+                ).read_text(encoding="utf-8")
+            )
+            assert stored_font_index == {"Family": [str(paths[0])]}
+        assert len(list(font_indexes_folder.iterdir())) == len(font_paths)
+
+    def test_narrows_to_folders_of_required_families(self, bundled_font_paths):
+        result = get_narrowed_font_paths(
+            bundled_font_paths,
+            frozenset({"Lato", "New Computer Modern"}) | icon_font_families,
+        )
+
+        assert result == tuple(
+            sorted(
+                [
+                    pathlib.Path(rendercv_fonts.path_of["Lato"]),
+                    pathlib.Path(rendercv_fonts.path_of["Font Awesome 7"]),
+                ]
+            )
+        )
+
+    def test_rebuilds_index_for_unknown_family(self, bundled_font_paths):
+        get_font_index(bundled_font_paths)
+        with patch(
+            "rendercv.renderer.pdf_png.build_font_index", wraps=build_font_index
+        ) as mock_build_font_index:
+            result = get_narrowed_font_paths(
+                bundled_font_paths, frozenset({"Nonexistent Font"})
+            )
+
+        mock_build_font_index.assert_called_once()
+        assert result is None
+
+    def test_compiler_loads_only_required_fonts(self, tmp_path: pathlib.Path):
+        compiler = get_typst_compiler(None, tmp_path, frozenset({"Lato"}))
+
+        assert list(typst_compiler_pool) == [
+            ((pathlib.Path(rendercv_fonts.path_of["Lato"]),), False, tmp_path)
+        ]
+        assert get_typst_compiler(None, tmp_path, frozenset({"Lato"})) is compiler
+        assert get_typst_compiler(None, tmp_path) is not compiler
+
+    def test_compiler_loads_all_fonts_if_family_is_unknown(
+        self, tmp_path: pathlib.Path
+    ):
+        get_typst_compiler(None, tmp_path, frozenset({"Nonexistent Font"}))
+
+        assert list(typst_compiler_pool) == [(get_font_paths(None), True, tmp_path)]
+
+
 class TestGeneratePngCleansUpOldFiles:
     def test_removes_stale_png_files_from_previous_run(
         self,
@@ -0,0 +1,312 @@
+import os
+import pathlib
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from rendercv.exception import RenderCVUserError
+from rendercv.renderer import photo
+from rendercv.renderer.pdf_png import copy_photo_next_to_typst_file
+from rendercv.renderer.photo import (
+    build_rendercv_model,
+    compute_file_hash,
+    convert_typst_dimension_to_pixels,
+    copy_file_if_changed,
+    download_photo_to_cache,
+    get_file_hash,
+    get_photo_derivative,
+    schedule_photo_download,
+    start_photo_download,
+    wait_for_photo_download,
+)
+from rendercv.schema.models.rendercv_model import RenderCVModel
+
+
+@pytest.mark.parametrize(
+    ("dimension", "expected"),
+    [
+        ("1in", 300),
+        ("2.54cm", 300),
+        ("25.4mm", 300),
+        ("72pt", 300),
+        ("3.5cm", 413),
+        ("2em", None),
+    ],
+)
+def test_convert_typst_dimension_to_pixels(dimension: str, expected: int | None):
+    assert convert_typst_dimension_to_pixels(dimension, 300) == expected
+
+
+class TestGetFileHash:
+    def test_reads_unchanged_file_once(self, tmp_path: pathlib.Path):
+        file_path = tmp_path / "photo.jpg"
+        file_path.write_bytes(b"photo")
+        compute_file_hash.cache_clear()
+
+        first = get_file_hash(file_path)
+        second = get_file_hash(file_path)
+
+        assert first == second
+        assert compute_file_hash.cache_info().misses == 1
+
+    def test_detects_changed_file(self, tmp_path: pathlib.Path):
+        file_path = tmp_path / "photo.jpg"
+        file_path.write_bytes(b"photo")
+        first = get_file_hash(file_path)
+
+        file_path.write_bytes(b"other photo")
+
+        assert get_file_hash(file_path) != first
+
+
+class TestCopyFileIfChanged:
+    def test_copies_file(self, tmp_path: pathlib.Path):
+        source = tmp_path / "source.jpg"
+        source.write_bytes(b"photo")
+        destination = tmp_path / "output" / "photo.jpg"
+        destination.parent.mkdir()
+
+        copy_file_if_changed(source, destination)
+
+        assert destination.read_bytes() == b"photo"
+        assert list(destination.parent.iterdir()) == [destination]
+
+    def test_skips_identical_file(self, tmp_path: pathlib.Path):
+        source = tmp_path / "source.jpg"
+        source.write_bytes(b"photo")
+        destination = tmp_path / "photo.jpg"
+        destination.write_bytes(b"photo")
+        os.utime(destination, ns=(0, 0))
+
+        copy_file_if_changed(source, destination)
+
+        assert destination.stat().st_mtime_ns == 0
+
+    def test_replaces_different_file(self, tmp_path: pathlib.Path):
+        source = tmp_path / "source.jpg"
+        source.write_bytes(b"photo")
+        destination = tmp_path / "photo.jpg"
+        destination.write_bytes(b"other")
+
+        copy_file_if_changed(source, destination)
+
+        assert destination.read_bytes() == b"photo"
+
+
+class TestGetPhotoDerivative:
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path: pathlib.Path, monkeypatch):
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path / "cache"))
+
+    @pytest.fixture
+    def large_photo(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        photo_path = tmp_path / "photo.jpg"
+        Image.new("RGB", (3000, 4000), "red").save(photo_path)
+        return photo_path
+
+    def test_downscales_to_printed_width(
+        self, tmp_path: pathlib.Path, large_photo: pathlib.Path
+    ):
+        result = get_photo_derivative(large_photo, "1in")
+
+        assert result.is_relative_to(tmp_path / "cache" / "photos")
+        assert result.suffix == ".jpg"
+        with Image.open(result) as image:
+            assert image.size == (300, 400)
+
+    def test_reuses_cached_derivative(self, large_photo: pathlib.Path):
+        first = get_photo_derivative(large_photo, "1in")
+
+        with patch(
+            "rendercv.renderer.photo.create_photo_derivative"
+        ) as mock_create_photo_derivative:
+            second = get_photo_derivative(large_photo, "1in")
+
+        assert first == second
+        mock_create_photo_derivative.assert_not_called()
+
+    def test_keeps_small_photo(self, large_photo: pathlib.Path):
+        assert get_photo_derivative(large_photo, "20in") == large_photo
+
+    def test_keeps_photo_with_relative_width(self, tmp_path: pathlib.Path):
+        photo_path = tmp_path / "photo.jpg"
+        photo_path.write_bytes(b"photo")
+
+        assert get_photo_derivative(photo_path, "5em") == photo_path
+
+    def test_keeps_unreadable_photo(self, tmp_path: pathlib.Path):
+        photo_path = tmp_path / "photo.svg"
+        photo_path.write_text("<svg></svg>", encoding="utf-8")
+
+        assert get_photo_derivative(photo_path, "1in") == photo_path
+
+
+class TestCopyPhotoNextToTypstFile:
+    def test_does_not_overwrite_photo_next_to_typst_file(
+        self, tmp_path: pathlib.Path, minimal_rendercv_model: RenderCVModel
+    ):
+        photo_path = tmp_path / "photo.jpg"
+        photo_path.write_bytes(b"photo")
+        minimal_rendercv_model.cv.photo = photo_path
+
+        with patch(
+            "rendercv.renderer.pdf_png.get_photo_derivative"
+        ) as mock_get_photo_derivative:
+            copy_photo_next_to_typst_file(minimal_rendercv_model, tmp_path / "cv.typ")
+
+        mock_get_photo_derivative.assert_not_called()
+        assert photo_path.read_bytes() == b"photo"
+
+    def test_copies_derivative_under_original_name(
+        self, tmp_path: pathlib.Path, minimal_rendercv_model: RenderCVModel
+    ):
+        photo_path = tmp_path / "photo.jpg"
+        photo_path.write_bytes(b"photo")
+        derivative_path = tmp_path / "derivative.jpg"
+        derivative_path.write_bytes(b"small photo")
+        minimal_rendercv_model.cv.photo = photo_path
+        output_folder = tmp_path / "output"
+        output_folder.mkdir()
+
+        with patch(
+            "rendercv.renderer.pdf_png.get_photo_derivative",
+            return_value=derivative_path,
+        ) as mock_get_photo_derivative:
+            copy_photo_next_to_typst_file(
+                minimal_rendercv_model, output_folder / "cv.typ"
+            )
+
+        mock_get_photo_derivative.assert_called_once_with(
+            photo_path, minimal_rendercv_model.design.header.photo_width
+        )
+        assert (output_folder / "photo.jpg").read_bytes() == b"small photo"
+
+
+class TestDownloadPhotoToCache:
+    def test_downloads_into_cache_dir(self, tmp_path: pathlib.Path, photo_server):
+        result = download_photo_to_cache(photo_server.url)
+
+        assert result.is_relative_to(tmp_path / "cache" / "photo_downloads")
+        assert result.suffix == ".jpg"
+        assert result.read_bytes() == b"photo data"
+
+    def test_revalidates_cached_photo(self, photo_server):
+        first = download_photo_to_cache(photo_server.url)
+        second = download_photo_to_cache(photo_server.url)
+
+        assert first == second
+        assert "If-None-Match" not in photo_server.received_headers[0]
+        assert photo_server.received_headers[1]["If-None-Match"] == photo_server.etag
+
+    def test_picks_up_changed_photo(self, photo_server):
+        first = download_photo_to_cache(photo_server.url)
+
+        photo_server.content = b"new photo data"
+        second = download_photo_to_cache(photo_server.url)
+
+        assert second != first
+        assert second.read_bytes() == b"new photo data"
+
+    def test_uses_cached_photo_if_server_is_unreachable(self, photo_server):
+        url = photo_server.url
+        first = download_photo_to_cache(url)
+
+        photo_server.shutdown()
+        photo_server.server_close()
+
+        assert download_photo_to_cache(url) == first
+
+    def test_raises_user_error_on_http_error(self, photo_server):
+        photo_server.status = 404
+
+        with pytest.raises(RenderCVUserError) as exc_info:
+            download_photo_to_cache(photo_server.url)
+
+        assert exc_info.value.message is not None
+        assert "Failed to download photo" in exc_info.value.message
+
+
+class TestPhotoDownloadScheduling:
+    def test_ignores_local_paths(self, photo_server):  # noqa: ARG002
+        assert start_photo_download("photo.jpg") is None
+
+    def test_starts_each_url_once(self, photo_server):
+        first = start_photo_download(photo_server.url)
+        second = start_photo_download(photo_server.url)
+
+        assert first is second
+
+    def test_scheduled_download_uses_started_download(
+        self, tmp_path: pathlib.Path, photo_server
+    ):
+        photo_path = tmp_path / "output" / "photo.jpg"
+        start_photo_download(photo_server.url)
+
+        schedule_photo_download(photo_server.url, photo_path)
+        wait_for_photo_download(photo_path)
+
+        assert photo_path.read_bytes() == b"photo data"
+        assert len(photo_server.received_headers) == 1
+
+    def test_wait_unregisters_download(self, tmp_path: pathlib.Path, photo_server):
+        photo_path = tmp_path / "output" / "photo.jpg"
+        schedule_photo_download(photo_server.url, photo_path)
+
+        wait_for_photo_download(photo_path)
+
+        assert photo_path not in photo.pending_photo_paths
+        assert photo.photo_downloads == {}
+
+    def test_wait_unregisters_failed_download(
+        self, tmp_path: pathlib.Path, photo_server
+    ):
+        photo_server.status = 404
+        photo_path = tmp_path / "output" / "photo.jpg"
+        schedule_photo_download(photo_server.url, photo_path)
+
+        with pytest.raises(RenderCVUserError):
+            wait_for_photo_download(photo_path)
+
+        assert photo_path not in photo.pending_photo_paths
+
+    def test_drops_finished_downloads_no_render_claimed(self, photo_server):
+        unclaimed_url = f"{photo_server.url}?unclaimed"
+        future = start_photo_download(unclaimed_url)
+        assert future is not None
+        future.result()
+
+        start_photo_download(photo_server.url)
+
+        assert list(photo.photo_downloads) == [photo_server.url]
+
+    def test_wait_without_scheduled_download_does_nothing(self, tmp_path: pathlib.Path):
+        wait_for_photo_download(tmp_path / "photo.jpg")
+        wait_for_photo_download(None)
+
+        assert not (tmp_path / "photo.jpg").exists()
+
+
+class TestBuildRendercvModel:
+    def test_starts_photo_download_before_validation(self, tmp_path):
+        yaml_content = "cv:\n  name: John Doe\n  photo: https://example.com/photo.jpg\n"
+
+        with (
+            patch.object(photo, "start_photo_download") as mock_start_photo_download,
+            patch.object(
+                photo,
+                "build_rendercv_model_from_commented_map",
+                side_effect=lambda *args: mock_start_photo_download.assert_called(),
+            ),
+        ):
+            build_rendercv_model(yaml_content, tmp_path / "cv.yaml")
+
+        mock_start_photo_download.assert_called_once_with(
+            "https://example.com/photo.jpg"
+        )
+
+    def test_returns_validated_model(self, tmp_path):
+        model = build_rendercv_model("cv:\n  name: John Doe\n", tmp_path / "cv.yaml")
+
+        assert model.cv.name == "John Doe"
+        assert model._input_file_path == tmp_path / "cv.yaml"
@@ -1,3 +1,6 @@
+import pathlib
+
+import pydantic
 import pytest
 
 from rendercv.renderer.typst import generate_typst
@@ -28,3 +31,15 @@ def test_generate_typst(
 
     reference_filename = f"{theme}_{cv_variant}.typ"
     assert compare_file_with_reference(generate_file, reference_filename)
+
+
+def test_generate_typst_waits_for_photo_url(
+    tmp_path: pathlib.Path, minimal_rendercv_model: RenderCVModel, photo_server
+):
+    minimal_rendercv_model.cv.photo = pydantic.HttpUrl(photo_server.url)
+    minimal_rendercv_model.settings.render_command.output_folder = tmp_path
+    minimal_rendercv_model.settings.render_command.typst_path = tmp_path / "cv.typ"
+
+    generate_typst(minimal_rendercv_model)
+
+    assert (tmp_path / "photo.jpg").read_bytes() == b"photo data"
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -90,6 +92,17 @@ class TestCv:
         assert "tel:" not in serialized["phone"]
         assert serialized["phone"] == "+90-541-999-99-99"
 
+    def test_does_not_load_phone_number_library_without_phone(self):
+        code = (
+            "import sys\n"
+            "from rendercv.schema.models.cv.cv import Cv\n"
+            "import rendercv.renderer.templater.connections\n"
+            "Cv.model_validate({'name': 'John Doe', 'email': 'john@example.com'})\n"
+            "assert 'phonenumbers' not in sys.modules\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_raises_internal_error_when_field_name_is_none(self):
         mock_info = MagicMock(spec=pydantic.ValidationInfo)
         mock_info.field_name = None
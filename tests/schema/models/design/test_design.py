@@ -6,6 +6,7 @@ import pydantic
 import pytest
 
 from rendercv.exception import RenderCVInternalError
+from rendercv.schema.models.design import design as design_module
 from rendercv.schema.models.design.design import Design
 from rendercv.schema.models.validation_context import ValidationContext
 
@@ -109,6 +110,110 @@ class MythemeTheme(BaseModel):
         assert design.theme == "mytheme"
         assert design.custom_option == "test_value"
 
+    def test_reuses_custom_theme_class_until_init_file_changes(
+        self, design_adapter, tmp_path
+    ):
+        custom_theme_path = tmp_path / "mytheme"
+        custom_theme_path.mkdir()
+        (custom_theme_path / "EducationEntry.j2.typ").touch()
+        init_file = custom_theme_path / "__init__.py"
+        init_file.write_text(
+            "from pydantic import BaseModel\n\n"
+            "class MythemeTheme(BaseModel):\n"
+            "    theme: str\n",
+            encoding="utf-8",
+        )
+        context = {
+            "context": ValidationContext(input_file_path=tmp_path / "input.yaml")
+        }
+
+        first = design_adapter.validate_python({"theme": "mytheme"}, context=context)
+        second = design_adapter.validate_python({"theme": "mytheme"}, context=context)
+        init_file.write_text(
+            "from pydantic import BaseModel\n\n"
+            "class MythemeTheme(BaseModel):\n"
+            "    theme: str\n"
+            "    custom_option: str = 'new'\n",
+            encoding="utf-8",
+        )
+        third = design_adapter.validate_python({"theme": "mytheme"}, context=context)
+
+        assert type(second) is type(first)
+        assert type(third) is not type(first)
+        assert third.custom_option == "new"
+
+    def test_reuses_class_of_custom_theme_without_init_file(
+        self, design_adapter, tmp_path
+    ):
+        custom_theme_path = tmp_path / "dummytheme"
+        custom_theme_path.mkdir()
+        (custom_theme_path / "EducationEntry.j2.typ").touch()
+        context = {
+            "context": ValidationContext(input_file_path=tmp_path / "input.yaml")
+        }
+
+        first = design_adapter.validate_python({"theme": "dummytheme"}, context=context)
+        second = design_adapter.validate_python(
+            {"theme": "dummytheme"}, context=context
+        )
+
+        assert type(second) is type(first)
+
+    def test_searches_custom_theme_folder_once(self, design_adapter, tmp_path):
+        custom_theme_path = tmp_path / "dummytheme"
+        custom_theme_path.mkdir()
+        (custom_theme_path / "EducationEntry.j2.typ").touch()
+        context = {
+            "context": ValidationContext(input_file_path=tmp_path / "input.yaml")
+        }
+
+        with patch.object(
+            pathlib.Path, "rglob", autospec=True, side_effect=pathlib.Path.rglob
+        ) as mock_rglob:
+            design_adapter.validate_python({"theme": "dummytheme"}, context=context)
+            design_adapter.validate_python({"theme": "dummytheme"}, context=context)
+
+        mock_rglob.assert_called_once()
+
+    def test_finds_templates_added_after_failed_validation(
+        self, design_adapter, tmp_path
+    ):
+        custom_theme_path = tmp_path / "dummytheme"
+        custom_theme_path.mkdir()
+        context = {
+            "context": ValidationContext(input_file_path=tmp_path / "input.yaml")
+        }
+        with pytest.raises(pydantic.ValidationError):
+            design_adapter.validate_python({"theme": "dummytheme"}, context=context)
+
+        (custom_theme_path / "EducationEntry.j2.typ").touch()
+        design = design_adapter.validate_python(
+            {"theme": "dummytheme"}, context=context
+        )
+
+        assert design.theme == "dummytheme"
+
+    def test_skips_built_in_validation_for_custom_theme(self, design_adapter, tmp_path):
+        custom_theme_path = tmp_path / "dummytheme"
+        custom_theme_path.mkdir()
+        (custom_theme_path / "EducationEntry.j2.typ").touch()
+
+        with patch.object(
+            design_module,
+            "built_in_design_adapter",
+            wraps=design_module.built_in_design_adapter,
+        ) as mock_built_in_design_adapter:
+            design_adapter.validate_python(
+                {"theme": "dummytheme"},
+                context={
+                    "context": ValidationContext(
+                        input_file_path=tmp_path / "input.yaml"
+                    )
+                },
+            )
+
+        mock_built_in_design_adapter.validate_python.assert_not_called()
+
     def test_rejects_custom_theme_with_missing_model_class(
         self, design_adapter, tmp_path
     ):
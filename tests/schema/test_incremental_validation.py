@@ -0,0 +1,192 @@
+import pathlib
+from datetime import date as Date
+from unittest.mock import patch
+
+import pydantic
+import pytest
+
+from rendercv.schema import incremental_validation
+from rendercv.schema.incremental_validation import (
+    get_structural_key,
+    validate_rendercv_model_incrementally,
+    validated_subtree_pool,
+)
+from rendercv.schema.models.cv.entries.one_line import OneLineEntry
+from rendercv.schema.models.rendercv_model import RenderCVModel
+from rendercv.schema.models.validation_context import ValidationContext
+from rendercv.schema.pydantic_error_handling import parse_validation_errors
+from rendercv.schema.yaml_reader import read_yaml
+
+examples = sorted(
+    (pathlib.Path(__file__).parents[2] / "examples").glob("*.yaml"),
+    key=lambda file_path: file_path.name,
+)
+
+
+def validate_fully(input_dictionary, validation_context) -> RenderCVModel:
+    return RenderCVModel.model_validate(
+        input_dictionary, context={"context": validation_context}
+    )
+
+
+@pytest.fixture
+def input_dictionary():
+    return read_yaml(
+        "cv:\n"
+        "  name: John Doe\n"
+        "  email: john@example.com\n"
+        "  sections:\n"
+        "    experience:\n"
+        "      - company: Company\n"
+        "        position: Engineer\n"
+        "        start_date: 2020-01\n"
+        "    skills:\n"
+        "      - label: Languages\n"
+        "        details: Python\n"
+        "  location: Istanbul\n"
+        "design:\n"
+        "  theme: sb2nov\n"
+        "locale:\n"
+        "  language: turkish\n"
+        "settings:\n"
+        "  current_date: 2024-01-01\n"
+    )
+
+
+@pytest.fixture
+def validation_context() -> ValidationContext:
+    return ValidationContext(current_date="2024-01-01")
+
+
+class TestGetStructuralKey:
+    def test_equal_for_equal_structures(self):
+        assert get_structural_key(read_yaml("a: [1, {b: c}]")) == get_structural_key(
+            {"a": [1, {"b": "c"}]}
+        )
+
+    @pytest.mark.parametrize(
+        ("first", "second"),
+        [
+            ({"a": 1}, {"a": True}),
+            ({"a": 1}, {"a": 1.0}),
+            ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+            ([1, 2], [2, 1]),
+        ],
+    )
+    def test_differs_for_different_structures(self, first, second):
+        assert get_structural_key(first) != get_structural_key(second)
+
+
+class TestValidateRenderCVModelIncrementally:
+    @pytest.mark.parametrize("example", examples, ids=lambda path: path.name)
+    def test_matches_full_validation(self, example: pathlib.Path):
+        input_dictionary = read_yaml(example)
+        validation_context = ValidationContext(input_file_path=example)
+
+        expected = validate_fully(input_dictionary, validation_context)
+        for _ in range(2):
+            model = validate_rendercv_model_incrementally(
+                input_dictionary, validation_context
+            )
+
+            assert model.model_dump() == expected.model_dump()
+            assert model.cv._key_order == expected.cv._key_order
+            assert model._input_file_path == example
+
+    def test_validates_only_changed_sections(
+        self, input_dictionary, validation_context
+    ):
+        first = validate_rendercv_model_incrementally(
+            input_dictionary, validation_context
+        )
+        input_dictionary["cv"]["sections"]["skills"][0]["details"] = "Python, Rust"
+
+        with patch.object(
+            incremental_validation.section_adapter,
+            "validate_python",
+            wraps=incremental_validation.section_adapter.validate_python,
+        ) as mock_validate_python:
+            second = validate_rendercv_model_incrementally(
+                input_dictionary, validation_context
+            )
+
+        mock_validate_python.assert_called_once()
+        assert first.cv.sections is not None
+        assert second.cv.sections is not None
+        skill = second.cv.sections["skills"][0]
+        assert isinstance(skill, OneLineEntry)
+        assert skill.details == "Python, Rust"
+        assert second.cv.sections["experience"][0] is first.cv.sections["experience"][0]
+        assert second.design is first.design
+        assert second.locale is first.locale
+        assert second.settings is first.settings
+
+    def test_each_model_gets_its_own_cv(self, input_dictionary, validation_context):
+        first = validate_rendercv_model_incrementally(
+            input_dictionary, validation_context
+        )
+        second = validate_rendercv_model_incrementally(
+            input_dictionary, validation_context
+        )
+
+        assert second.cv is not first.cv
+        assert second.cv._key_order == ["name", "email", "sections", "location"]
+
+    def test_revalidates_for_another_context(self, input_dictionary):
+        validate_rendercv_model_incrementally(
+            input_dictionary, ValidationContext(current_date=Date(2024, 1, 1))
+        )
+
+        with patch.object(
+            incremental_validation.section_adapter,
+            "validate_python",
+            wraps=incremental_validation.section_adapter.validate_python,
+        ) as mock_validate_python:
+            validate_rendercv_model_incrementally(
+                input_dictionary, ValidationContext(current_date=Date(2025, 1, 1))
+            )
+
+        assert mock_validate_python.call_count == 2
+
+    def test_errors_match_full_validation(self, input_dictionary, validation_context):
+        validate_rendercv_model_incrementally(input_dictionary, validation_context)
+        input_dictionary["cv"]["sections"]["experience"][0]["start_date"] = "invalid"
+        input_dictionary["cv"]["email"] = "invalid"
+
+        with pytest.raises(pydantic.ValidationError) as expected:
+            validate_fully(input_dictionary, validation_context)
+        with pytest.raises(pydantic.ValidationError) as result:
+            validate_rendercv_model_incrementally(input_dictionary, validation_context)
+
+        assert parse_validation_errors(
+            result.value, input_dictionary
+        ) == parse_validation_errors(expected.value, input_dictionary)
+
+    def test_rechecks_photo(
+        self, tmp_path: pathlib.Path, input_dictionary, validation_context
+    ):
+        photo_path = tmp_path / "photo.jpg"
+        photo_path.write_bytes(b"photo")
+        input_dictionary["cv"]["photo"] = str(photo_path)
+        validate_rendercv_model_incrementally(input_dictionary, validation_context)
+
+        photo_path.unlink()
+
+        with pytest.raises(pydantic.ValidationError):
+            validate_rendercv_model_incrementally(input_dictionary, validation_context)
+
+    def test_rejects_unknown_top_level_keys(self, input_dictionary, validation_context):
+        input_dictionary["unknown"] = 1
+
+        with pytest.raises(pydantic.ValidationError):
+            validate_rendercv_model_incrementally(input_dictionary, validation_context)
+
+    def test_evicts_least_recently_used_subtrees(
+        self, input_dictionary, validation_context, monkeypatch
+    ):
+        monkeypatch.setattr(incremental_validation, "validated_subtree_pool_size", 2)
+        validated_subtree_pool.clear()
+
+        validate_rendercv_model_incrementally(input_dictionary, validation_context)
+
+        assert len(validated_subtree_pool) == 2
@@ -0,0 +1,199 @@
+import pathlib
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from rendercv.exception import RenderCVUserError
+from rendercv.renderer.templater.templater import render_full_template
+from rendercv.schema import model_snapshot
+from rendercv.schema.model_snapshot import (
+    collect_model_classes,
+    dump_rendercv_model_snapshot,
+    get_generated_model_classes,
+    load_rendercv_model_snapshot,
+)
+from rendercv.schema.models.design.built_in_design import available_themes
+from rendercv.schema.models.locale.locale import available_locales
+from rendercv.schema.models.rendercv_model import RenderCVModel
+from rendercv.schema.rendercv_model_builder import build_rendercv_dictionary_and_model
+
+examples = sorted(
+    (pathlib.Path(__file__).parents[2] / "examples").glob("*.yaml"),
+    key=lambda file_path: file_path.name,
+)
+
+custom_theme_init_file = (
+    "from pydantic import BaseModel\n\n"
+    "class Colors(BaseModel):\n"
+    "    text: str = 'black'\n\n"
+    "class MythemeTheme(BaseModel):\n"
+    "    theme: str\n"
+    "    colors: Colors = Colors()\n"
+)
+
+
+def build_model(yaml_content: str, input_file_path: pathlib.Path) -> RenderCVModel:
+    _, rendercv_model = build_rendercv_dictionary_and_model(
+        yaml_content, input_file_path=input_file_path
+    )
+    return rendercv_model
+
+
+@pytest.fixture
+def custom_theme_folder(tmp_path: pathlib.Path) -> pathlib.Path:
+    folder = tmp_path / "mytheme"
+    folder.mkdir()
+    (folder / "Header.j2.typ").touch()
+    return folder
+
+
+class TestCollectModelClasses:
+    def test_keys_are_unique_for_generated_classes(self):
+        generated_classes = get_generated_model_classes()
+
+        assert len({key[1] for key in generated_classes}) == len(
+            available_themes
+        ) + len(available_locales)
+
+    def test_keys_nested_classes_by_path(self):
+        keys = dict(collect_model_classes(RenderCVModel, ()))
+
+        assert keys[()] is RenderCVModel
+        assert ("cv", "Cv") in keys
+
+
+class TestRenderCVModelSnapshot:
+    @pytest.mark.parametrize("example", examples, ids=lambda path: path.name)
+    def test_round_trip_renders_identically(self, example: pathlib.Path):
+        rendercv_model = build_model(example.read_text(encoding="utf-8"), example)
+
+        loaded_model = load_rendercv_model_snapshot(
+            dump_rendercv_model_snapshot(rendercv_model)
+        )
+
+        assert type(loaded_model.design) is type(rendercv_model.design)
+        assert loaded_model.model_dump() == rendercv_model.model_dump()
+        assert loaded_model.cv._key_order == rendercv_model.cv._key_order
+        assert loaded_model._input_file_path == example
+        assert (
+            loaded_model.settings._resolved_current_date
+            == rendercv_model.settings._resolved_current_date
+        )
+        assert render_full_template(loaded_model, "typst") == render_full_template(
+            rendercv_model, "typst"
+        )
+
+    @pytest.mark.parametrize("locale", ["turkish", "japanese"])
+    def test_keeps_generated_locales(self, tmp_path: pathlib.Path, locale: str):
+        rendercv_model = build_model(
+            f"cv:\n  name: John Doe\nlocale:\n  language: {locale}\n",
+            tmp_path / "cv.yaml",
+        )
+
+        loaded_model = load_rendercv_model_snapshot(
+            dump_rendercv_model_snapshot(rendercv_model)
+        )
+
+        assert type(loaded_model.locale) is type(rendercv_model.locale)
+        assert loaded_model.locale == rendercv_model.locale
+
+    def test_doesnt_validate_again(self, tmp_path: pathlib.Path):
+        photo_path = tmp_path / "photo.jpg"
+        photo_path.write_bytes(b"photo")
+        rendercv_model = build_model(
+            "cv:\n  name: John Doe\n  email: john@example.com\n  photo: photo.jpg\n",
+            tmp_path / "cv.yaml",
+        )
+        snapshot = dump_rendercv_model_snapshot(rendercv_model)
+        # The photo would no longer pass validation:
+        photo_path.unlink()
+
+        with patch.object(RenderCVModel, "model_validate") as mock_model_validate:
+            loaded_model = load_rendercv_model_snapshot(snapshot)
+
+        mock_model_validate.assert_not_called()
+        assert loaded_model.cv.photo == photo_path
+
+    def test_loads_in_another_process(self, tmp_path: pathlib.Path):
+        rendercv_model = build_model(
+            "cv:\n  name: John Doe\n  email: john@example.com\n"
+            "design:\n  theme: sb2nov\n",
+            tmp_path / "cv.yaml",
+        )
+        snapshot_path = tmp_path / "cv.snapshot"
+        snapshot_path.write_bytes(dump_rendercv_model_snapshot(rendercv_model))
+
+        script = (
+            "import pathlib, sys\n"
+            "from rendercv.schema.model_snapshot import load_rendercv_model_snapshot\n"
+            "model = load_rendercv_model_snapshot("
+            "pathlib.Path(sys.argv[1]).read_bytes())\n"
+            "print(model.cv.name, model.design.theme, model.cv._key_order)"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script, str(snapshot_path)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "John Doe sb2nov ['name', 'email']"
+
+    def test_rejects_snapshot_of_another_version(self, tmp_path: pathlib.Path):
+        rendercv_model = build_model("cv:\n  name: John Doe\n", tmp_path / "cv.yaml")
+        snapshot = dump_rendercv_model_snapshot(rendercv_model)
+
+        with (
+            patch.object(model_snapshot, "__version__", "0.1"),
+            pytest.raises(RenderCVUserError),
+        ):
+            load_rendercv_model_snapshot(snapshot)
+
+    def test_keeps_custom_theme_classes(self, custom_theme_folder: pathlib.Path):
+        (custom_theme_folder / "__init__.py").write_text(
+            custom_theme_init_file, encoding="utf-8"
+        )
+        rendercv_model = build_model(
+            "cv:\n  name: John Doe\ndesign:\n  theme: mytheme\n"
+            "  colors:\n    text: red\n",
+            custom_theme_folder.parent / "cv.yaml",
+        )
+
+        loaded_model = load_rendercv_model_snapshot(
+            dump_rendercv_model_snapshot(rendercv_model)
+        )
+
+        assert type(loaded_model.design) is type(rendercv_model.design)
+        assert type(loaded_model.design.colors) is type(rendercv_model.design.colors)
+        assert loaded_model.design.colors.text == "red"
+
+    def test_keeps_custom_theme_without_init_file(
+        self, custom_theme_folder: pathlib.Path
+    ):
+        rendercv_model = build_model(
+            "cv:\n  name: John Doe\ndesign:\n  theme: mytheme\n",
+            custom_theme_folder.parent / "cv.yaml",
+        )
+
+        loaded_model = load_rendercv_model_snapshot(
+            dump_rendercv_model_snapshot(rendercv_model)
+        )
+
+        assert loaded_model.design.theme == "mytheme"
+        assert type(loaded_model.design) is type(rendercv_model.design)
+
+    def test_rejects_changed_custom_theme(self, custom_theme_folder: pathlib.Path):
+        init_file = custom_theme_folder / "__init__.py"
+        init_file.write_text(custom_theme_init_file, encoding="utf-8")
+        rendercv_model = build_model(
+            "cv:\n  name: John Doe\ndesign:\n  theme: mytheme\n",
+            custom_theme_folder.parent / "cv.yaml",
+        )
+        snapshot = dump_rendercv_model_snapshot(rendercv_model)
+        init_file.write_text(f"{custom_theme_init_file}# edited\n", encoding="utf-8")
+
+        with pytest.raises(RenderCVUserError):
+            load_rendercv_model_snapshot(snapshot)
@@ -10,6 +10,7 @@ from rendercv.schema.override_dictionary import (
     apply_overrides_to_dictionary,
     update_value_by_location,
 )
+from rendercv.schema.yaml_reader import read_yaml
 
 
 class TestUpdateValueByLocation:
@@ -315,6 +316,63 @@ class TestApplyOverridesToDictionary:
         assert result["cv"]["sections"]["experience"][0]["title"] == "Engineer"
         assert initial["cv"]["name"] == "John Doe"
 
+    def test_shares_untouched_subtrees(self):
+        initial: dict[str, Any] = {
+            "cv": {
+                "name": "John Doe",
+                "sections": {
+                    "education": [{"institution": "MIT"}, {"institution": "METU"}],
+                    "experience": [{"company": "Google"}],
+                },
+            },
+            "design": {"theme": "classic"},
+        }
+        frozen = copy.deepcopy(initial)
+
+        result = apply_overrides_to_dictionary(
+            initial,
+            {
+                "cv.sections.education.1.institution": "Harvard",
+                "cv.sections.education.1.degree": "PhD",
+                "cv.headline": "Engineer",
+            },
+        )
+
+        assert initial == frozen
+        assert result["design"] is initial["design"]
+        assert (
+            result["cv"]["sections"]["experience"]
+            is (initial["cv"]["sections"]["experience"])
+        )
+        assert (
+            result["cv"]["sections"]["education"][0]
+            is (initial["cv"]["sections"]["education"][0])
+        )
+        assert result["cv"]["sections"]["education"][1] == {
+            "institution": "Harvard",
+            "degree": "PhD",
+        }
+        assert result["cv"]["headline"] == "Engineer"
+
+    def test_keeps_yaml_coordinates(self):
+        initial = read_yaml("cv:\n  name: John Doe\n  sections:\n    a: [x, y]\n")
+
+        result = apply_overrides_to_dictionary(initial, {"cv.sections.a.1": "z"})
+
+        assert result["cv"].lc.data == initial["cv"].lc.data
+        assert result["cv"]["sections"]["a"].lc.data == (
+            initial["cv"]["sections"]["a"].lc.data
+        )
+        assert initial["cv"]["sections"]["a"] == ["x", "y"]
+
+    def test_errors_do_not_mutate_original(self):
+        original = {"a": [{"b": "old"}]}
+
+        with pytest.raises(RenderCVUserError):
+            apply_overrides_to_dictionary(original, {"a.0.b": "new", "a.5.b": "x"})
+
+        assert original == {"a": [{"b": "old"}]}
+
     @settings(deadline=None)
     @given(value=st.text(min_size=1, max_size=20))
     def test_original_never_mutated(self, value: str) -> None:
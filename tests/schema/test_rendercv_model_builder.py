@@ -11,9 +11,11 @@ from rendercv.schema.rendercv_model_builder import (
     build_rendercv_dictionary,
     build_rendercv_dictionary_and_model,
     build_rendercv_model_from_commented_map,
+    build_rendercv_model_variants,
     get_yaml_error_location,
 )
 from rendercv.schema.sample_generator import dictionary_to_yaml
+from rendercv.schema.yaml_reader import read_yaml
 
 
 @pytest.fixture
@@ -216,6 +218,20 @@ class TestBuildRendercvDictionary:
         assert result["settings"]["render_command"]["typst_path"] == "new.typ"
         assert result["settings"]["other_setting"] == "preserved"
 
+    def test_does_not_modify_parsed_input(self):
+        parsed_input = read_yaml(
+            "cv:\n  name: John Doe\nsettings:\n  render_command:\n    pdf_path: a.pdf\n"
+        )
+
+        result, _ = build_rendercv_dictionary(parsed_input, typst_path="new.typ")
+
+        assert result["settings"]["render_command"] == {
+            "pdf_path": "a.pdf",
+            "typst_path": "new.typ",
+        }
+        assert parsed_input["settings"]["render_command"] == {"pdf_path": "a.pdf"}
+        assert result.lc.data == parsed_input.lc.data
+
     def test_combined_overlays_and_render_overrides(self, minimal_input_dict):
         main_yaml = dictionary_to_yaml(minimal_input_dict)
         locale_yaml = dictionary_to_yaml({"locale": {"language": "turkish"}})
@@ -467,6 +483,15 @@ class TestBuildRendercvModelFromDictionary:
 
         assert model.settings.current_date == Date(2024, 6, 15)
 
+    def test_reports_errors_of_overridden_values_without_coordinates(self):
+        with pytest.raises(RenderCVUserValidationError) as exc_info:
+            build_rendercv_dictionary_and_model(
+                "cv:\n  name: John Doe\n",
+                overrides={"design.theme": "nonexistent"},
+            )
+
+        assert exc_info.value.validation_errors[0].schema_location == ("design",)
+
     def test_today_keyword_in_current_date_works(self, minimal_input_dict):
         yaml_input = dictionary_to_yaml(
             {**minimal_input_dict, "settings": {"current_date": "today"}}
@@ -756,6 +781,59 @@ class TestBuildRendercvModel:
         assert check(model)
 
 
+class TestBuildRendercvModelVariants:
+    def test_builds_every_combination(self):
+        models = build_rendercv_model_variants(
+            read_yaml("cv:\n  name: John Doe\n"),
+            themes=["classic", "sb2nov"],
+            locales=["english", "turkish"],
+        )
+
+        assert [(m.design.theme, m.locale.language) for m in models] == [
+            ("classic", "english"),
+            ("classic", "turkish"),
+            ("sb2nov", "english"),
+            ("sb2nov", "turkish"),
+        ]
+
+    def test_keeps_other_design_options(self):
+        commented_map = read_yaml(
+            "cv:\n  name: John Doe\ndesign:\n  theme: classic\n  page:\n    size: a4\n"
+        )
+
+        (model,) = build_rendercv_model_variants(commented_map, themes=["sb2nov"])
+
+        assert model.design.theme == "sb2nov"
+        assert model.design.page.size == "a4"
+        assert commented_map["design"]["theme"] == "classic"
+
+    def test_replaces_whole_locale(self):
+        commented_map = read_yaml(
+            "cv:\n  name: John Doe\nlocale:\n  language: english\n  present: now\n"
+        )
+
+        (model,) = build_rendercv_model_variants(commented_map, locales=["turkish"])
+
+        assert model.locale.language == "turkish"
+        assert model.locale.present != "now"
+
+    def test_without_variants_builds_input_as_is(self):
+        (model,) = build_rendercv_model_variants(
+            read_yaml("cv:\n  name: John Doe\ndesign:\n  theme: sb2nov\n")
+        )
+
+        assert model.design.theme == "sb2nov"
+        assert model.locale.language == "english"
+
+    def test_reports_invalid_theme(self):
+        with pytest.raises(RenderCVUserValidationError) as exc_info:
+            build_rendercv_model_variants(
+                read_yaml("cv:\n  name: John Doe\n"), themes=["nonexistent"]
+            )
+
+        assert exc_info.value.validation_errors[0].schema_location == ("design",)
+
+
 class TestGetYamlErrorLocation:
     def test_returns_none_when_no_marks(self):
         error = ruamel.yaml.YAMLError()
@@ -1,10 +1,20 @@
+import concurrent.futures
+import contextlib
 import pathlib
+from typing import Any
+from unittest.mock import patch
 
 import pytest
-from ruamel.yaml.comments import CommentedMap
+import ruamel.yaml
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from rendercv.exception import RenderCVInternalError, RenderCVUserError
-from rendercv.schema.yaml_reader import read_yaml
+from rendercv.schema.sample_generator import create_sample_yaml_input_file
+from rendercv.schema.yaml_reader import (
+    IncrementalYamlReader,
+    get_yaml_parser,
+    read_yaml,
+)
 
 
 class TestReadYaml:
@@ -42,3 +52,122 @@ class TestReadYaml:
 
         assert isinstance(result, CommentedMap)
         assert result["key"] == "*not_an_alias"
+
+
+def assert_same_yaml(result: Any, expected: Any) -> None:
+    assert type(result) is type(expected)
+    if isinstance(expected, CommentedMap):
+        assert list(result) == list(expected)
+        assert result.lc.data == expected.lc.data
+        assert (result.lc.line, result.lc.col) == (expected.lc.line, expected.lc.col)
+        for key in expected:
+            assert_same_yaml(result[key], expected[key])
+    elif isinstance(expected, CommentedSeq):
+        assert len(result) == len(expected)
+        assert (result.lc.data or {}) == (expected.lc.data or {})
+        assert (result.lc.line, result.lc.col) == (expected.lc.line, expected.lc.col)
+        for result_item, expected_item in zip(result, expected, strict=True):
+            assert_same_yaml(result_item, expected_item)
+    else:
+        assert result == expected
+
+
+sample_yaml = create_sample_yaml_input_file(file_path=None)
+
+
+class TestIncrementalYamlReader:
+    @pytest.mark.parametrize(
+        "yaml_content",
+        [
+            sample_yaml,
+            *(
+                file_path.read_text(encoding="utf-8")
+                for file_path in sorted(
+                    (pathlib.Path(__file__).parents[2] / "examples").glob("*.yaml")
+                )
+            ),
+            "cv:\n  name: John\n  sections:\n  - not a mapping\n",
+            "a:\nb: 1\nc:\n  # comment\nd:\n",
+            "a:\n- 1\n-\n- - 2\n  - 3\nb: [1, 2]\nc: {}\n",
+            "a: |\n  text\n\n  more text\nb: >-\n  folded\n",
+            "a:\n  b:\n    c: 1\n  d: 'quoted\n    string'\ne: 2",
+            "a: 1 # comment\nb: # comment\n  c:\n",
+            "'quoted key': 1\n? complex key\n: 2\n",
+        ],
+    )
+    def test_matches_read_yaml(self, yaml_content: str):
+        assert_same_yaml(
+            IncrementalYamlReader().read(yaml_content), read_yaml(yaml_content)
+        )
+
+    def test_matches_read_yaml_after_edits(self):
+        reader = IncrementalYamlReader()
+        reader.read(sample_yaml)
+        lines = sample_yaml.splitlines(keepends=True)
+
+        for index in range(0, len(lines), 7):
+            edited_lines = [*lines]
+            edited_lines.insert(index, "\n")
+            edited_lines[-1] = edited_lines[-1].replace(":", ": x", 1)
+            edited_yaml = "".join(edited_lines)
+            try:
+                expected = read_yaml(edited_yaml)
+            except ruamel.yaml.YAMLError:
+                with pytest.raises(ruamel.yaml.YAMLError):
+                    reader.read(edited_yaml)
+                continue
+
+            assert_same_yaml(reader.read(edited_yaml), expected)
+
+    def test_parses_only_changed_blocks(self):
+        reader = IncrementalYamlReader()
+        reader.read(sample_yaml)
+        edited_yaml = sample_yaml.replace("Princeton, NJ", "Cambridge, MA")
+
+        yaml = get_yaml_parser()
+        with patch.object(yaml, "load", wraps=yaml.load) as mock_load:
+            result = reader.read(edited_yaml)
+
+        assert mock_load.call_count == 1
+        assert "Cambridge, MA" in mock_load.call_args.args[0]
+        assert_same_yaml(result, read_yaml(edited_yaml))
+
+    def test_reuses_unchanged_blocks(self):
+        reader = IncrementalYamlReader()
+        first = reader.read(sample_yaml)
+        second = reader.read(sample_yaml.replace("John Doe", "Jane Doe"))
+
+        assert (
+            second["cv"]["sections"]["education"][0]
+            is first["cv"]["sections"]["education"][0]
+        )
+        assert second["cv"]["name"] == "Jane Doe"
+
+    @pytest.mark.parametrize(
+        "yaml_content",
+        ["---\na: 1\n", "a: 1\n...\n", "a:\n\tb: 1\n", "[1, 2]\n", "# comment\n"],
+    )
+    def test_falls_back_to_read_yaml(self, yaml_content: str):
+        with (
+            patch(
+                "rendercv.schema.yaml_reader.read_yaml", wraps=read_yaml
+            ) as mock_read_yaml,
+            contextlib.suppress(ruamel.yaml.YAMLError, RenderCVUserError),
+        ):
+            IncrementalYamlReader().read(yaml_content)
+
+        mock_read_yaml.assert_called_once_with(yaml_content)
+
+    def test_reports_duplicate_keys_like_read_yaml(self):
+        yaml_content = "a: 1\nb: 2\na: 3\n"
+
+        with pytest.raises(ruamel.yaml.YAMLError):
+            IncrementalYamlReader().read(yaml_content)
+
+
+def test_get_yaml_parser_returns_one_parser_per_thread():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        other_thread_parser = executor.submit(get_yaml_parser).result()
+
+    assert get_yaml_parser() is get_yaml_parser()
+    assert get_yaml_parser() is not other_thread_parser
@@ -0,0 +1,27 @@
+import sys
+
+from rendercv.cache import get_cache_dir
+
+
+class TestGetCacheDir:
+    def test_returns_platform_appropriate_path(self, monkeypatch):
+        monkeypatch.delenv("RENDERCV_CACHE_DIR", raising=False)
+        cache_dir = get_cache_dir()
+
+        assert cache_dir.name == "rendercv"
+        if sys.platform == "darwin":
+            assert "Library/Caches" in str(cache_dir)
+        elif sys.platform == "win32":
+            assert "Local" in str(cache_dir)
+
+    def test_respects_xdg_cache_home_on_linux(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("RENDERCV_CACHE_DIR", raising=False)
+        monkeypatch.setattr("rendercv.cache.sys.platform", "linux")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert get_cache_dir() == tmp_path / "rendercv"
+
+    def test_respects_rendercv_cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("RENDERCV_CACHE_DIR", str(tmp_path / "custom"))
+
+        assert get_cache_dir() == tmp_path / "custom"